@@ -2,23 +2,29 @@
 VideoTranscript Pro - Modern YouTube Transcript & Podcast Generator
 A production-ready web application for extracting and processing YouTube transcripts
 """
-from flask import Flask, render_template, request, jsonify, send_file, session, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, send_file, session, redirect, url_for, stream_with_context
+import json
 import logging
 import os
 import sys
 from datetime import datetime
+import hashlib
+import threading
 import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
-from src.youtube_podcast.utils.youtube_utils import fetch_transcript
+from src.youtube_podcast.utils.youtube_utils import fetch_transcript_segments
 from src.youtube_podcast.utils.bulk_extract import (
     bulk_extract_transcripts,
+    iter_bulk_extract_transcripts,
     parse_csv_urls,
     export_to_csv,
     export_transcripts_to_csv,
     get_playlist_video_ids,
+    get_bulk_workers,
 )
 from src.youtube_podcast.utils.auth import (
     requires_auth,
@@ -26,17 +32,30 @@ from src.youtube_podcast.utils.auth import (
     check_token_limit,
     increment_token_usage,
 )
+from src.youtube_podcast.utils.transcript_cache import get_transcript_cache_stats
+from src.youtube_podcast.utils.llm_cache import get_llm_cache_stats
+from src.youtube_podcast.utils.tts_cache import get_tts_cache_stats
+from src.youtube_podcast.utils.tts_backends import get_tts_backend, list_tts_backends
+from src.youtube_podcast.utils.metrics import get_latency_stats, get_latency_histogram
+from src.youtube_podcast.utils.tracing import get_recent_traces
+from src.youtube_podcast.utils.transcript_store import get_transcript_store, get_render_store
+from src.youtube_podcast.utils.job_queue import get_job_queue
 from src.youtube_podcast.utils.supabase_client import get_supabase, is_supabase_configured
 from src.youtube_podcast.utils.usage_tracker import track_usage, get_user_usage_history, get_user_usage_stats
 from src.youtube_podcast.utils.rate_limiter import requires_rate_limit, check_rate_limit
 from src.youtube_podcast.agents.summary_agent import (
     generate_summary,
+    stream_summary,
 )
 from src.youtube_podcast.agents.podcast_agent import (
     create_conversation,
     generate_podcast,
+    generate_podcast_pipelined,
+    podcast_checkpoint_id,
+    resume_from_checkpoint,
+    stream_podcast_audio,
 )
-from src.youtube_podcast.config.settings import DEFAULT_OUTPUT_DIR
+from src.youtube_podcast.config.settings import DEFAULT_OUTPUT_DIR, PODCAST_AUDIO_WAIT, PODCAST_MULTI_VOICE, PODCAST_PIPELINE_ENABLED
 from config import get_config
 
 
@@ -74,6 +93,70 @@ def create_app() -> Flask:
 
 app = create_app()
 
+
+def wants_stream() -> bool:
+    """Check whether the client asked for a streaming NDJSON response."""
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return True
+    return 'application/x-ndjson' in request.headers.get('Accept', '')
+
+
+def stream_bulk_results(urls, max_workers, format_result=None, **summary) -> Response:
+    """
+    Stream bulk extraction results as NDJSON, one line per video as it finishes.
+    
+    Each result line carries "type": "result" and the video's position in
+    `urls` as "index". The stream ends with a "type": "summary" trailer
+    holding the totals and any extra `summary` fields.
+    """
+    def generate():
+        total = 0
+        successful = 0
+        for index, result in iter_bulk_extract_transcripts(urls, max_workers=max_workers):
+            total += 1
+            if result.get('success'):
+                successful += 1
+            line = format_result(result) if format_result else result
+            yield json.dumps({'type': 'result', 'index': index, **line}) + '\n'
+        
+        yield json.dumps({
+            'type': 'summary',
+            'success': True,
+            **summary,
+            'total': total,
+            'successful': successful,
+            'failed': total - successful
+        }) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+def resolve_transcript(data):
+    """
+    Get the transcript for a generate request.
+    
+    Clients can send the full transcript, or a handle returned by /extract:
+    'transcript_id' or the extract 'session_id'.
+    
+    Returns:
+        (transcript, url, error_response) where error_response is None on success
+    """
+    transcript = data.get('transcript', '')
+    url = data.get('url', '')
+    if transcript:
+        return transcript, url, None
+    
+    handle = data.get('transcript_id') or data.get('session_id')
+    if not handle:
+        return None, url, (jsonify({'error': 'Transcript is required'}), 400)
+    
+    entry = get_transcript_store().get(handle)
+    if entry is None:
+        return None, url, (jsonify({'error': 'Transcript not found or expired. Please extract it again.'}), 404)
+    
+    return entry['transcript'], url or entry.get('url', ''), None
+
+
 @app.route('/')
 def home():
     """Home page"""
@@ -536,6 +619,53 @@ def health_check():
     """Simple health-check endpoint for load balancers and uptime monitoring."""
     return jsonify({"status": "ok", "service": "video-transcript-pro"}), 200
 
+@app.route("/api/cache/stats", methods=["GET"])
+def cache_stats():
+    """Report hit/miss counters for the server-side caches."""
+    return jsonify({
+        'success': True,
+        'transcript_cache': get_transcript_cache_stats(),
+        'llm_cache': get_llm_cache_stats(),
+        'tts_cache': get_tts_cache_stats()
+    })
+
+@app.route("/api/tts/backends", methods=["GET"])
+def tts_backends():
+    """List the speech engines a podcast request can choose with 'tts_backend'."""
+    return jsonify({
+        'success': True,
+        'backends': list_tts_backends()
+    })
+
+@app.route("/api/metrics/latency", methods=["GET"])
+def latency_metrics():
+    """Report latency percentiles, e.g. summary time-to-first-token."""
+    return jsonify({
+        'success': True,
+        'latency': get_latency_stats()
+    })
+
+@app.route("/api/metrics/nodes", methods=["GET"])
+def node_metrics():
+    """Report per-node latency percentiles and histograms for the workflow graph."""
+    return jsonify({
+        'success': True,
+        'latency': get_latency_stats(prefix='node.'),
+        'histograms': get_latency_histogram(prefix='node.')
+    })
+
+@app.route("/api/traces", methods=["GET"])
+def recent_traces():
+    """Show the most recent traces as span trees, e.g. ?limit=5."""
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 200))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'limit must be a number'}), 400
+    return jsonify({
+        'success': True,
+        'traces': get_recent_traces(limit)
+    })
+
 @app.route('/favicon.ico')
 def favicon():
     """Handle favicon requests to avoid noisy 404 logs."""
@@ -554,16 +684,35 @@ def extract_transcript():
         if not youtube_url:
             return jsonify({'error': 'YouTube URL is required'}), 400
         
+        # Optional time window (in seconds) for returning an excerpt
+        start = data.get('start')
+        end = data.get('end')
+        
         # Fetch transcript
-        transcript = fetch_transcript(youtube_url)
+        segments = fetch_transcript_segments(youtube_url)
         
-        if not transcript:
+        if not segments:
             return jsonify({'error': 'Failed to fetch transcript. The video may not have captions available.'}), 400
         
-        # Store in session for later use
+        if start is not None or end is not None:
+            try:
+                segments = segments.slice_time(
+                    float(start) if start is not None else None,
+                    float(end) if end is not None else None
+                )
+            except (TypeError, ValueError):
+                return jsonify({'error': 'start and end must be numbers of seconds'}), 400
+            
+            if not segments:
+                return jsonify({'error': 'No transcript found in the requested time window'}), 400
+        
+        transcript = segments.text
+        
+        # Keep the transcript server-side; the session only holds its handle
         session_id = str(uuid.uuid4())
+        transcript_id = get_transcript_store().put(transcript, youtube_url, alias=session_id)
         session[session_id] = {
-            'transcript': transcript,
+            'transcript_id': transcript_id,
             'url': youtube_url,
             'timestamp': datetime.now().isoformat()
         }
@@ -582,57 +731,304 @@ def extract_transcript():
             'success': True,
             'transcript': transcript,
             'session_id': session_id,
-            'length': len(transcript)
+            'transcript_id': transcript_id,
+            'length': len(transcript),
+            'start': segments.start_time,
+            'end': segments.end_time
         })
     
     except Exception as e:
         return jsonify({'error': f'Error processing request: {str(e)}'}), 500
 
+class PipelineError(Exception):
+    """Raised when a generation pipeline reports an error in its state."""
+
+
+def pipeline_transcript(params):
+    """
+    Get the transcript a pipeline runs on.
+    
+    Inline runs pass the text; queued jobs pass a transcript store handle
+    so the job row doesn't hold a copy of it.
+    """
+    if params.get('transcript'):
+        return params['transcript']
+    
+    entry = get_transcript_store().get(params['transcript_id']) if params.get('transcript_id') else None
+    if entry is None:
+        raise PipelineError('Transcript not found or expired. Please extract it again.')
+    return entry['transcript']
+
+
+def run_summary_pipeline(params):
+    """
+    Generate a summary and return the response payload.
+    
+    Used both inline by /generate-summary and by the 'summary' job handler.
+    
+    Args:
+        params: Dictionary with 'transcript' or 'transcript_id', 'url' and
+            optional 'user_id', 'use_cache' and 'title_strategy'
+    """
+    transcript = pipeline_transcript(params)
+    state = {
+        'url': params.get('url', ''),
+        'transcript': transcript,
+        'status': 'transcript_fetched',
+        'output_type': 'summary',
+        'use_cache': params.get('use_cache', True),
+        'title_strategy': params.get('title_strategy')
+    }
+    
+    # Generate summary
+    result = generate_summary(state)
+    
+    if result.get('error'):
+        raise PipelineError(result['error'])
+    
+    # Track usage if user is logged in
+    if params.get('user_id'):
+        track_usage(
+            user_id=params['user_id'],
+            video_url=params.get('url', ''),
+            operation_type='summary',
+            transcript_length=len(transcript),
+            tokens_used=1
+        )
+    
+    return {
+        'summary': result.get('summary', ''),
+        'title': result.get('summary_title', 'Summary'),
+        'filename': os.path.basename(result.get('summary_filename', ''))
+    }
+
+
+def run_podcast_pipeline(params):
+    """
+    Generate a podcast conversation and audio, and return the response payload.
+    
+    Used both inline by /generate-podcast and by the 'podcast' job handler.
+    
+    Args:
+        params: Dictionary with 'transcript' or 'transcript_id', 'url', 'gender'
+            and optional 'user_id', 'use_cache', 'title_strategy', 'tts_backend'
+            and 'pipelined'
+    """
+    transcript = pipeline_transcript(params)
+    state = {
+        'url': params.get('url', ''),
+        'transcript': transcript,
+        'status': 'transcript_fetched',
+        'output_type': 'podcast',
+        'gender': params.get('gender', 'mixed'),
+        'tts_backend': params.get('tts_backend'),
+        'use_cache': params.get('use_cache', True),
+        'title_strategy': params.get('title_strategy')
+    }
+    
+    # A retry of a failed run picks up its checkpointed conversation
+    state['checkpoint_id'] = podcast_checkpoint_id(state)
+    if state['use_cache']:
+        state = resume_from_checkpoint(state)
+    
+    pipelined = params.get('pipelined')
+    if state['status'] == 'conversation_created':
+        # Only the audio is left to generate
+        state = generate_podcast(state)
+    elif pipelined if pipelined is not None else PODCAST_PIPELINE_ENABLED:
+        # Synthesize each turn as soon as the LLM has written it
+        state = generate_podcast_pipelined(state)
+    else:
+        # Generate conversation
+        state = create_conversation(state)
+        
+        if state.get('error'):
+            raise PipelineError(state['error'])
+        
+        # Generate audio
+        state = generate_podcast(state)
+    
+    if state.get('error'):
+        raise PipelineError(state['error'])
+    
+    audio_path = state.get('audio_path')
+    if not audio_path or not os.path.exists(audio_path):
+        raise PipelineError('Failed to generate audio file')
+    
+    # Track usage if user is logged in
+    if params.get('user_id'):
+        track_usage(
+            user_id=params['user_id'],
+            video_url=params.get('url', ''),
+            operation_type='podcast',
+            transcript_length=len(transcript),
+            tokens_used=1
+        )
+    
+    return {
+        'conversation': str(state.get('conversation') or ''),
+        'title': state.get('podcast_title', 'Podcast'),
+        'audio_filename': os.path.basename(audio_path),
+        'audio_url': f'/download/{os.path.basename(audio_path)}',
+        'resumed_from': state.get('resumed_from')
+    }
+
+
+job_queue = get_job_queue()
+job_queue.register('summary', run_summary_pipeline)
+job_queue.register('podcast', run_podcast_pipeline)
+job_queue.resume_pending()
+
+
+def wants_async(data) -> bool:
+    """Check whether the client asked for the work to run as a background job."""
+    if request.args.get('async', '').lower() in ('1', 'true'):
+        return True
+    return bool(data.get('async'))
+
+
+def wants_cache(data) -> bool:
+    """Check whether cached LLM responses may be used; send use_cache=false to regenerate."""
+    if request.args.get('use_cache', '').lower() in ('0', 'false'):
+        return False
+    # The JSON body may say false, 0, "false" or "0", like the query string
+    value = data.get('use_cache', True)
+    if isinstance(value, str):
+        return value.strip().lower() not in ('0', 'false')
+    return value != 0
+
+
+def requested_title_strategy(data):
+    """Get the title strategy a request asked for ('llm' or 'local'), or None for the default."""
+    strategy = str(data.get('title_strategy') or '').lower()
+    return strategy if strategy in ('llm', 'local') else None
+
+
+def resolve_tts_backend(data):
+    """
+    Get the TTS backend a podcast request asked for, checking it can be used.
+    
+    Runs before any LLM or speech work, so a request naming an unknown or
+    unavailable backend (e.g. elevenlabs without an API key) fails straight away.
+    
+    Returns:
+        (name, error_response) where name is 'gtts', 'elevenlabs' or 'espeak',
+        or None for the default, and error_response is None on success
+    """
+    name = str(data.get('tts_backend') or '').lower()
+    try:
+        backend = get_tts_backend(name or None)
+    except ValueError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+    
+    if not backend.is_available():
+        return None, (jsonify({'error': f'The {backend.name} speech engine is not available on this server'}), 400)
+    
+    return (backend.name if name else None), None
+
+
+def submit_job(kind, params):
+    """Queue a generation job and build the 202 Accepted response."""
+    # The job row keeps a transcript store handle, not the transcript itself
+    params = dict(params)
+    params['transcript_id'] = get_transcript_store().put(params.pop('transcript'), params.get('url', ''))
+    job_id = job_queue.submit(kind, params)
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': f'/jobs/{job_id}',
+        'result_url': f'/jobs/{job_id}/result'
+    }), 202
+
+
 @app.route('/generate-summary', methods=['POST'])
 @requires_rate_limit
 def generate_summary_endpoint():
     """Generate summary from transcript"""
     try:
         data = request.get_json()
-        transcript = data.get('transcript', '')
-        session_id = data.get('session_id', '')
+        transcript, url, error_response = resolve_transcript(data)
         
-        if not transcript:
-            return jsonify({'error': 'Transcript is required'}), 400
+        if error_response:
+            return error_response
         
-        # Create state dictionary
-        state = {
-            'url': data.get('url', ''),
+        params = {
+            'url': url,
             'transcript': transcript,
-            'status': 'transcript_fetched',
-            'output_type': 'summary'
+            'user_id': session.get('user_id'),
+            'use_cache': wants_cache(data),
+            'title_strategy': requested_title_strategy(data)
         }
         
-        # Generate summary
-        result = generate_summary(state)
+        if wants_async(data):
+            return submit_job('summary', params)
+        
+        try:
+            result = run_summary_pipeline(params)
+        except PipelineError as e:
+            return jsonify({'error': str(e)}), 500
         
-        if result.get('error'):
-            return jsonify({'error': result['error']}), 500
+        return jsonify({'success': True, **result})
+    
+    except Exception as e:
+        return jsonify({'error': f'Error generating summary: {str(e)}'}), 500
+
+def sse_event(event, data) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/generate-summary/stream', methods=['POST'])
+@requires_rate_limit
+def generate_summary_stream_endpoint():
+    """
+    Generate a summary, streaming it as server-sent events.
+    
+    Sends 'token' events with summary text as the LLM produces it, then
+    'title', then 'done' with the saved filename. Failures send an 'error'
+    event and end the stream.
+    """
+    data = request.get_json() or {}
+    transcript, url, error_response = resolve_transcript(data)
+    
+    if error_response:
+        return error_response
+    
+    user_id = session.get('user_id')
+    state = {
+        'url': url,
+        'transcript': transcript,
+        'status': 'transcript_fetched',
+        'output_type': 'summary',
+        'use_cache': wants_cache(data),
+        'title_strategy': requested_title_strategy(data)
+    }
+    
+    def generate():
+        try:
+            for event, payload in stream_summary(state):
+                yield sse_event(event, payload)
+        except Exception as e:
+            logging.error(f"Streaming summary failed: {str(e)}")
+            yield sse_event('error', {'error': f'Summary generation failed: {str(e)}'})
+            return
         
         # Track usage if user is logged in
-        if session.get('user_id'):
+        if user_id:
             track_usage(
-                user_id=session.get('user_id'),
-                video_url=data.get('url', ''),
+                user_id=user_id,
+                video_url=url,
                 operation_type='summary',
                 transcript_length=len(transcript),
                 tokens_used=1
             )
-        
-        return jsonify({
-            'success': True,
-            'summary': result.get('summary', ''),
-            'title': result.get('summary_title', 'Summary'),
-            'filename': os.path.basename(result.get('summary_filename', ''))
-        })
     
-    except Exception as e:
-        return jsonify({'error': f'Error generating summary: {str(e)}'}), 500
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/generate-podcast', methods=['POST'])
 @requires_rate_limit
@@ -640,58 +1036,235 @@ def generate_podcast_endpoint():
     """Generate podcast from transcript"""
     try:
         data = request.get_json()
-        transcript = data.get('transcript', '')
+        transcript, url, error_response = resolve_transcript(data)
         gender = data.get('gender', 'mixed')
         
-        if not transcript:
-            return jsonify({'error': 'Transcript is required'}), 400
+        if error_response:
+            return error_response
+        
+        tts_backend, error_response = resolve_tts_backend(data)
+        if error_response:
+            return error_response
         
-        # Create state dictionary
-        state = {
-            'url': data.get('url', ''),
+        params = {
+            'url': url,
             'transcript': transcript,
-            'status': 'transcript_fetched',
-            'output_type': 'podcast',
-            'gender': gender
+            'gender': gender,
+            'tts_backend': tts_backend,
+            'user_id': session.get('user_id'),
+            'use_cache': wants_cache(data),
+            'title_strategy': requested_title_strategy(data),
+            'pipelined': data.get('pipelined')
         }
         
-        # Generate conversation
-        state = create_conversation(state)
+        if wants_async(data):
+            return submit_job('podcast', params)
         
-        if state.get('error'):
-            return jsonify({'error': state['error']}), 500
+        try:
+            result = run_podcast_pipeline(params)
+        except PipelineError as e:
+            return jsonify({'error': str(e)}), 500
         
-        # Generate audio
-        state = generate_podcast(state)
+        return jsonify({'success': True, **result})
+    
+    except Exception as e:
+        return jsonify({'error': f'Error generating podcast: {str(e)}'}), 500
+
+@app.route('/generate-podcast/stream', methods=['POST'])
+@requires_rate_limit
+def generate_podcast_stream_endpoint():
+    """
+    Generate a podcast conversation and return a URL that streams its audio.
+    
+    The conversation and title come back straight away; the audio is
+    synthesized while the client plays /podcast-audio/<stream_id>.
+    """
+    try:
+        data = request.get_json() or {}
+        transcript, url, error_response = resolve_transcript(data)
+        
+        if error_response:
+            return error_response
+        
+        tts_backend, error_response = resolve_tts_backend(data)
+        if error_response:
+            return error_response
+        
+        state = create_conversation({
+            'url': url,
+            'transcript': transcript,
+            'status': 'transcript_fetched',
+            'output_type': 'podcast',
+            'gender': data.get('gender', 'mixed'),
+            'tts_backend': tts_backend,
+            'use_cache': wants_cache(data),
+            'title_strategy': requested_title_strategy(data)
+        })
         
         if state.get('error'):
             return jsonify({'error': state['error']}), 500
         
-        audio_path = state.get('audio_path')
-        if not audio_path or not os.path.exists(audio_path):
-            return jsonify({'error': 'Failed to generate audio file'}), 500
-        
-        # Track usage if user is logged in
-        if session.get('user_id'):
-            track_usage(
-                user_id=session.get('user_id'),
-                video_url=data.get('url', ''),
-                operation_type='podcast',
-                transcript_length=len(transcript),
-                tokens_used=1
-            )
+        # Keep what the audio request needs server-side, like extracted transcripts
+        audio_filename = podcast_render_filename(state)
+        render = {
+            'conversation': state['conversation'].to_dict(),
+            'podcast_filename': audio_filename,
+            'gender': state['gender'],
+            'tts_backend': state['tts_backend'],
+            'transcript_length': len(transcript),
+            'user_id': session.get('user_id')
+        }
+        stream_id = get_render_store().put(json.dumps(render), url=url)
         
         return jsonify({
             'success': True,
-            'conversation': state.get('conversation', ''),
-            'title': state.get('podcast_title', 'Podcast'),
-            'audio_filename': os.path.basename(audio_path),
-            'audio_url': f'/download/{os.path.basename(audio_path)}'
+            'conversation': str(state['conversation']),
+            'title': state.get('podcast_title') or 'Podcast',
+            'audio_filename': audio_filename,
+            'audio_url': f'/download/{audio_filename}',
+            'audio_mimetype': get_tts_backend(state['tts_backend']).mimetype,
+            'stream_url': f'/podcast-audio/{stream_id}'
         })
     
     except Exception as e:
         return jsonify({'error': f'Error generating podcast: {str(e)}'}), 500
 
+def podcast_render_filename(state):
+    """
+    Audio filename unique to what a render will sound like.
+    
+    The title-based name is suffixed with a hash of the conversation,
+    backend, voices and gender, so a file found under this name was
+    rendered from exactly this spec.
+    """
+    tts = get_tts_backend(state.get('tts_backend'))
+    gender = state.get('gender', 'mixed')
+    voices = tts.host_voices(gender) if PODCAST_MULTI_VOICE else [tts.voice_for(gender)]
+    spec = [state['conversation'].to_dict(), tts.name, gender, voices, PODCAST_MULTI_VOICE]
+    digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    stem, extension = os.path.splitext(state['podcast_filename'])
+    return f"{stem}_{digest}{extension}"
+
+
+# Audio renders in progress, keyed by stream ID; later requests wait for the first
+_renders_inflight = {}
+_renders_inflight_lock = threading.Lock()
+
+
+def _finish_render(stream_id, future):
+    """Release waiting requests once a render's response is closed, however it ended."""
+    with _renders_inflight_lock:
+        if _renders_inflight.get(stream_id) is future:
+            del _renders_inflight[stream_id]
+    if not future.done():
+        future.set_result(None)
+
+
+@app.route('/podcast-audio/<stream_id>', methods=['GET'])
+@requires_rate_limit
+def podcast_audio_stream(stream_id):
+    """Stream podcast audio while its segments are still being synthesized."""
+    entry = get_render_store().get(stream_id)
+    try:
+        render = json.loads(entry['transcript']) if entry else None
+        audio_filename = os.path.basename(render['podcast_filename'])
+    except (ValueError, TypeError, KeyError):
+        render = None
+    if render is None:
+        return jsonify({'error': 'Podcast stream not found or expired'}), 404
+    
+    mimetype = get_tts_backend(render.get('tts_backend')).mimetype
+    audio_path = os.path.join(DEFAULT_OUTPUT_DIR, audio_filename)
+    
+    # Only one request synthesizes a stream; others wait for its file
+    with _renders_inflight_lock:
+        future = _renders_inflight.get(stream_id)
+        is_leader = future is None and not os.path.exists(audio_path)
+        if is_leader:
+            future = Future()
+            _renders_inflight[stream_id] = future
+    
+    if not is_leader:
+        if future is not None:
+            try:
+                future.result(timeout=PODCAST_AUDIO_WAIT)
+            except FutureTimeoutError:
+                # Don't hold a worker for the whole render; ask the client to come back
+                response = jsonify({'error': 'Podcast audio is still being rendered'})
+                response.headers['Retry-After'] = str(max(1, round(PODCAST_AUDIO_WAIT)))
+                return response, 503
+        # Already rendered: serve the file, which also supports seeking
+        if os.path.exists(audio_path):
+            return send_file(audio_path, mimetype=mimetype, conditional=True)
+        return jsonify({'error': 'Podcast audio could not be rendered'}), 500
+    
+    state = {
+        'conversation': render['conversation'],
+        'podcast_filename': audio_filename,
+        'gender': render.get('gender', 'mixed'),
+        'tts_backend': render.get('tts_backend'),
+        'status': 'conversation_created'
+    }
+    
+    def generate():
+        try:
+            yield from stream_podcast_audio(state)
+        except Exception as e:
+            # Headers are already sent; ending the stream early is all we can do
+            logging.error(f"Streaming podcast audio failed: {str(e)}")
+            return
+        
+        # Track usage if user is logged in
+        if render.get('user_id'):
+            track_usage(
+                user_id=render['user_id'],
+                video_url=entry.get('url', ''),
+                operation_type='podcast',
+                transcript_length=render.get('transcript_length', 0),
+                tokens_used=1
+            )
+    
+    response = Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # Runs even if the client goes away before the stream starts
+    response.call_on_close(lambda: _finish_render(stream_id, future))
+    return response
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Get the status of a background generation job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify({
+        'success': True,
+        'job_id': job['job_id'],
+        'kind': job['kind'],
+        'status': job['status'],
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'updated_at': job['updated_at']
+    })
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    """Get the result of a finished background generation job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    if job['status'] == 'failed':
+        return jsonify({'error': job['error'], 'status': job['status']}), 500
+    
+    if job['status'] != 'succeeded':
+        return jsonify({'success': False, 'job_id': job_id, 'status': job['status']}), 202
+    
+    return jsonify({'success': True, 'job_id': job_id, 'status': job['status'], **job['result']})
+
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download generated files"""
@@ -719,7 +1292,10 @@ def bulk_extract_endpoint():
         if len(urls) > 50:  # Limit to 50 videos per request
             return jsonify({'error': 'Maximum 50 URLs allowed per request'}), 400
         
-        results = bulk_extract_transcripts(urls)
+        if wants_stream():
+            return stream_bulk_results(urls, get_bulk_workers())
+        
+        results = bulk_extract_transcripts(urls, max_workers=get_bulk_workers())
         
         return jsonify({
             'success': True,
@@ -732,6 +1308,15 @@ def bulk_extract_endpoint():
     except Exception as e:
         return jsonify({'error': f'Error processing bulk extraction: {str(e)}'}), 500
 
+def format_api_transcript(result):
+    """Format a bulk result similar to youtube-transcript.io."""
+    return {
+        'video_id': result.get('video_id'),
+        'transcript': result.get('transcript', ''),
+        'success': result.get('success', False),
+        'error': result.get('error')
+    }
+
 @app.route('/api/transcripts', methods=['POST'])
 @requires_auth
 def api_transcripts():
@@ -756,7 +1341,9 @@ def api_transcripts():
         
         # Convert video IDs to URLs
         urls = [f'https://www.youtube.com/watch?v={vid}' for vid in video_ids]
-        results = bulk_extract_transcripts(urls)
+        streaming = wants_stream()
+        if not streaming:
+            results = bulk_extract_transcripts(urls, max_workers=get_bulk_workers(request.user_plan))
         
         # Increment token usage in cache and database
         increment_token_usage(request.api_token, len(video_ids))
@@ -766,15 +1353,15 @@ def api_transcripts():
             from src.youtube_podcast.utils.usage_tracker import update_user_token_usage
             update_user_token_usage(request.api_user_id, len(video_ids))
         
+        if streaming:
+            return stream_bulk_results(
+                urls,
+                get_bulk_workers(request.user_plan),
+                format_result=format_api_transcript
+            )
+        
         # Format response similar to youtube-transcript.io
-        formatted_results = []
-        for result in results:
-            formatted_results.append({
-                'video_id': result.get('video_id'),
-                'transcript': result.get('transcript', ''),
-                'success': result.get('success', False),
-                'error': result.get('error')
-            })
+        formatted_results = [format_api_transcript(result) for result in results]
         
         return jsonify({
             'success': True,
@@ -846,7 +1433,16 @@ def extract_playlist_endpoint():
         
         # Convert video IDs to full URLs
         urls = [f'https://www.youtube.com/watch?v={vid}' for vid in video_ids]
-        results = bulk_extract_transcripts(urls)
+        
+        if wants_stream():
+            increment_token_usage(request.api_token, len(video_ids))
+            return stream_bulk_results(
+                urls,
+                get_bulk_workers(request.user_plan),
+                playlist_url=playlist_url
+            )
+        
+        results = bulk_extract_transcripts(urls, max_workers=get_bulk_workers(request.user_plan))
         
         # Increment token usage
         increment_token_usage(request.api_token, len(video_ids))
@@ -885,7 +1481,10 @@ def import_csv_endpoint():
         if len(urls) > 50:
             return jsonify({'error': 'Maximum 50 URLs allowed per CSV'}), 400
         
-        results = bulk_extract_transcripts(urls)
+        if wants_stream():
+            return stream_bulk_results(urls, get_bulk_workers(), urls_found=len(urls))
+        
+        results = bulk_extract_transcripts(urls, max_workers=get_bulk_workers())
         
         return jsonify({
             'success': True,
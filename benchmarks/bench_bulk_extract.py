@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the concurrent bulk transcript extraction engine.
+
+Starts a local fake transcript server that answers every request after a
+fixed delay (standing in for a YouTube round-trip), then runs
+bulk_extract_transcripts against it with increasing worker counts.
+
+Usage:
+    python benchmarks/bench_bulk_extract.py [--videos 32] [--latency 0.2]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from src.youtube_podcast.utils.bulk_extract import bulk_extract_transcripts
+from src.youtube_podcast.utils.youtube_utils import extract_video_id
+
+
+class FakeTranscriptServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 stalls connections at high worker counts
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def make_handler(latency: float):
+    """Create a request handler that serves fake transcripts after `latency` seconds."""
+
+    class FakeTranscriptHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            video_id = parse_qs(urlparse(self.path).query).get("v", [""])[0]
+            time.sleep(latency)
+            body = json.dumps([
+                {"text": f"Segment {i} of video {video_id}", "start": i * 2.0, "duration": 2.0}
+                for i in range(50)
+            ]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeTranscriptHandler
+
+
+def make_fetcher(base_url: str):
+    """Create a fetcher that reads transcripts from the fake server."""
+
+    def fetch(url: str) -> str:
+        video_id = extract_video_id(url)
+        with urllib.request.urlopen(f"{base_url}/transcript?v={video_id}") as response:
+            segments = json.loads(response.read())
+        return " ".join(entry["text"] for entry in segments)
+
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=32, help="Number of URLs per run")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake server latency in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Worker counts to test")
+    args = parser.parse_args()
+
+    server = FakeTranscriptServer(("127.0.0.1", 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    fetcher = make_fetcher(f"http://127.0.0.1:{server.server_address[1]}")
+
+    urls = [f"https://www.youtube.com/watch?v=bench{i:04d}" for i in range(args.videos)]
+
+    print(f"{args.videos} videos, {args.latency * 1000:.0f} ms simulated latency per video")
+    print(f"{'workers':>8} {'seconds':>9} {'videos/s':>9} {'speedup':>8}")
+    baseline = None
+    try:
+        for workers in args.workers:
+            start = time.perf_counter()
+            results = bulk_extract_transcripts(urls, max_workers=workers, fetcher=fetcher)
+            elapsed = time.perf_counter() - start
+
+            assert [r["url"] for r in results] == urls, "results out of order"
+            assert all(r["success"] for r in results), "unexpected failures"
+
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {args.videos / elapsed:>9.1f} {baseline / elapsed:>7.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
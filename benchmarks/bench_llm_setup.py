@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark for per-request LLM setup cost.
+
+Compares building a new ChatOpenAI client, prompt template and chain for
+every call (the previous behaviour of summary_agent, podcast_agent and
+title_generator) with fetching them from the shared LLM registry. No
+requests are sent to OpenAI; only client and chain construction is timed.
+
+Usage:
+    python benchmarks/bench_llm_setup.py [--iterations 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from langchain_community.chat_models import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnablePassthrough
+
+from src.youtube_podcast.agents import podcast_agent, summary_agent
+from src.youtube_podcast.utils import title_generator
+from src.youtube_podcast.utils.llm_registry import get_chain, get_llm
+
+
+def setup_per_request():
+    """Build the summary chain, conversation chain and title client the old code created per call."""
+    for system_prompt, human_prompt, temperature in (
+        (summary_agent.SYSTEM_PROMPT, summary_agent.HUMAN_PROMPT, 0.3),
+        (podcast_agent.SYSTEM_PROMPT, podcast_agent.HUMAN_PROMPT, 0.7),
+    ):
+        llm = ChatOpenAI(
+            openai_api_key=os.environ["OPENAI_API_KEY"],
+            model_name="gpt-3.5-turbo",
+            temperature=temperature
+        )
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            ("human", human_prompt)
+        ])
+        {"transcript": RunnablePassthrough()} | prompt | llm
+
+    ChatOpenAI(
+        openai_api_key=os.environ["OPENAI_API_KEY"],
+        model_name="gpt-3.5-turbo",
+        temperature=0.7
+    )
+
+
+def setup_from_registry():
+    """Fetch the same chains and clients from the shared registry."""
+    get_chain("summary", summary_agent._build_summary_chain)
+    get_chain("conversation", podcast_agent._build_conversation_chain)
+    get_chain(
+        "podcast_title",
+        lambda: title_generator.PODCAST_TITLE_PROMPT | get_llm(title_generator.TITLE_MODEL, 0.7)
+    )
+
+
+def time_calls(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="Setups to time per strategy")
+    args = parser.parse_args()
+
+    # Warm up imports and the registry so only steady-state cost is measured
+    setup_per_request()
+    setup_from_registry()
+
+    per_request = time_calls(setup_per_request, args.iterations)
+    registry = time_calls(setup_from_registry, args.iterations)
+
+    print(f"{'strategy':<14} {'per request':>14}")
+    print(f"{'per-request':<14} {per_request * 1000:>11.3f} ms")
+    print(f"{'registry':<14} {registry * 1000:>11.3f} ms")
+    print(f"setup cost reduced {per_request / registry:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pipelined podcast generation.
+
+Compares create_conversation followed by generate_podcast (LLM, then TTS)
+with generate_podcast_pipelined, which synthesizes each turn as soon as the
+streaming LLM has written it. The LLM is a fake chat model that streams a
+fixed script at a set rate, and speech synthesis is a fake that sleeps per
+segment; no network calls are made and the caches are bypassed.
+
+Usage:
+    python benchmarks/bench_podcast_pipeline.py [--turns 16] [--llm-seconds 2] [--segment-latency 0.4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["TTS_CACHE_ENABLED"] = "false"
+os.environ["STRUCTURED_OUTPUT_ENABLED"] = "false"
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from src.youtube_podcast.agents import podcast_agent
+from src.youtube_podcast.utils import llm_registry, tts_backends
+
+
+def make_script(turns: int) -> str:
+    return "\n".join(
+        f"Host{1 + i % 2}: This is turn {i} of the show. It covers one point from the video."
+        for i in range(turns)
+    )
+
+
+class FakeStreamingModel(FakeListChatModel):
+    """Streams its response a line at a time over total_seconds, and takes as long without streaming."""
+
+    total_seconds: float = 1.0
+
+    def _call(self, *args, **kwargs):
+        time.sleep(self.total_seconds)
+        return super()._call(*args, **kwargs)
+
+    def _stream(self, *args, **kwargs):
+        lines = self.responses[0].split("\n")
+        for i, line in enumerate(lines):
+            time.sleep(self.total_seconds / len(lines))
+            text = line if i == len(lines) - 1 else line + "\n"
+            yield ChatGenerationChunk(message=AIMessageChunk(content=text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=16, help="Speaker turns in the script")
+    parser.add_argument("--llm-seconds", type=float, default=2.0, help="Time the fake LLM takes for the whole script")
+    parser.add_argument("--segment-latency", type=float, default=0.4, help="Fake TTS latency per segment in seconds")
+    args = parser.parse_args()
+
+    script = make_script(args.turns)
+    llm = FakeStreamingModel(responses=[script], total_seconds=args.llm_seconds)
+    llm_registry._clients[(podcast_agent.CONVERSATION_MODEL, podcast_agent.CONVERSATION_TEMPERATURE)] = llm
+
+    class FakeBackend(tts_backends.GTTSBackend):
+        def synthesize(self, text, lang="en", voice=None):
+            time.sleep(args.segment_latency)
+            return b"\xff\xfb" + text.encode("utf-8")
+
+    tts_backends._backends["gtts"] = FakeBackend()
+    podcast_agent.DEFAULT_OUTPUT_DIR = tempfile.mkdtemp(prefix="bench_podcast_")
+
+    state = {
+        "transcript": "benchmark transcript",
+        "status": "transcript_fetched",
+        "use_cache": False,
+        "title_strategy": "local",
+        "tts_backend": "gtts",
+    }
+
+    start = time.perf_counter()
+    sequential = podcast_agent.generate_podcast(podcast_agent.create_conversation(dict(state)))
+    sequential_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipelined = podcast_agent.generate_podcast_pipelined(dict(state))
+    pipelined_seconds = time.perf_counter() - start
+
+    assert not sequential.get("error") and not pipelined.get("error"), "generation failed"
+    assert sequential["conversation"] == pipelined["conversation"], "scripts differ"
+    with open(sequential["audio_path"], "rb") as a, open(pipelined["audio_path"], "rb") as b:
+        assert a.read() == b.read(), "audio differs"
+
+    print(f"{args.turns} turns, {args.llm_seconds:.1f} s LLM, "
+          f"{args.segment_latency * 1000:.0f} ms per TTS segment")
+    print(f"{'strategy':<12} {'seconds':>9}")
+    print(f"{'sequential':<12} {sequential_seconds:>9.2f}")
+    print(f"{'pipelined':<12} {pipelined_seconds:>9.2f}")
+    print(f"latency reduced {sequential_seconds / pipelined_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the compiled speech text normalizer.
+
+Generates a corpus of podcast scripts with the markup LLMs tend to produce
+(emphasis, symbols, abbreviations, repeated punctuation, quotes and
+contractions) and runs every line through the previous step-by-step
+cleaning rules and through text_normalizer. Outputs are checked to be
+identical before timings are reported. Speaker label normalization, as
+done by format_conversation, is timed the same way.
+
+Usage:
+    python benchmarks/bench_text_normalizer.py [--scripts 500] [--turns 40] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from src.youtube_podcast.utils.text_normalizer import normalize_for_speech, add_pauses, normalize_speaker
+
+FRAGMENTS = [
+    "I think that's a **really** good point", "you know, it's kind of *wild*",
+    "the R&D budget", "input/output", "we're #1 on the charts", "ping @support",
+    "well... let me think", "it's fast — really fast", "the 2020–2023 window",
+    "A | B testing", "e.g. caching", "i.e. the hot path", "memory, disk, etc.",
+    "Python vs. Rust", "no way!!", "really??", "she said \"ship it\"",
+    "the so-called 'fast path'", "and - honestly - it works", "don't you think?",
+    "that's __huge__", "~~old~~ new", "check https://example.com/docs",
+]
+
+
+def make_corpus(scripts: int, turns: int, seed: int = 7):
+    """Build (speaker label, line text) pairs for a set of scripts."""
+    rng = random.Random(seed)
+    labels = ["Host1", "Host 2", "Speaker 1", "speaker2", "HOST1", "Narrator"]
+    corpus = []
+    for _ in range(scripts):
+        for _ in range(turns):
+            sentences = [rng.choice(FRAGMENTS) + rng.choice([".", "!", "?", ",", ""]) for _ in range(rng.randint(2, 5))]
+            corpus.append((rng.choice(labels), " ".join(sentences)))
+    return corpus
+
+
+def legacy_clean_text_for_speech(text: str) -> str:
+    """The cleaning rules as they were applied one pass at a time."""
+    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+    text = re.sub(r'\*(.*?)\*', r'\1', text)
+    text = re.sub(r'__(.*?)__', r'\1', text)
+    text = re.sub(r'~~(.*?)~~', r'\1', text)
+    text = text.replace('&', 'and')
+    text = text.replace('/', ' or ')
+    text = text.replace('#', 'number ')
+    text = text.replace('@', 'at ')
+    text = text.replace('...', '.')
+    text = text.replace('—', ', ')
+    text = text.replace('–', ', ')
+    text = text.replace('|', ', ')
+    text = re.sub(r'\bi\.e\.\s', 'that is, ', text, flags=re.IGNORECASE)
+    text = re.sub(r'\be\.g\.\s', 'for example, ', text, flags=re.IGNORECASE)
+    text = re.sub(r'\betc\.', 'etcetera', text, flags=re.IGNORECASE)
+    text = re.sub(r'\bvs\.', 'versus', text, flags=re.IGNORECASE)
+    text = re.sub(r'https?://\S+', 'a website link', text)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = re.sub(r'\!{2,}', '!', text)
+    text = re.sub(r'\?{2,}', '?', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'(\w)([,.!?;:])', r'\1\2 ', text)
+    text = re.sub(r'\s+([,.!?;:])', r'\1 ', text)
+    text = text.replace(' - ', ', ')
+    text = re.sub(r'"([^"]*)"', r' \1 ', text)
+    text = re.sub(r"'([^']*)'", r' \1 ', text)
+    return text.strip()
+
+
+def legacy_add_speech_enhancements(text: str) -> str:
+    text = text.replace('. ', '. <break time="0.3s"/> ')
+    text = text.replace('? ', '? <break time="0.5s"/> ')
+    text = text.replace('! ', '! <break time="0.4s"/> ')
+    return re.sub(r'<break[^>]*>', '', text)
+
+
+def legacy_normalize_speaker(speaker: str):
+    host1_options = ["Host1", "Host 1", "Speaker1", "Speaker 1"]
+    host2_options = ["Host2", "Host 2", "Speaker2", "Speaker 2"]
+    speaker_lower = speaker.lower()
+    if any(option.lower() in speaker_lower for option in host1_options):
+        return "Host1"
+    if any(option.lower() in speaker_lower for option in host2_options):
+        return "Host2"
+    return None
+
+
+def best_of(repeat: int, fn) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scripts", type=int, default=500, help="Scripts in the corpus")
+    parser.add_argument("--turns", type=int, default=40, help="Turns per script")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the fastest is reported")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.scripts, args.turns)
+    labels = [label for label, _ in corpus]
+    lines = [line for _, line in corpus]
+
+    legacy = [legacy_add_speech_enhancements(legacy_clean_text_for_speech(line)) for line in lines]
+    compiled = [add_pauses(normalize_for_speech(line)) for line in lines]
+    assert legacy == compiled, "speech text differs"
+    assert [legacy_normalize_speaker(l) for l in labels] == [normalize_speaker(l) for l in labels], "speakers differ"
+
+    size_mb = sum(len(line) for line in lines) / 1e6
+    print(f"{len(lines)} lines, {size_mb:.1f} MB of script text")
+    print(f"{'variant':<22} {'seconds':>9} {'lines/s':>10} {'speedup':>8}")
+
+    def report(name, seconds, baseline):
+        print(f"{name:<22} {seconds:>9.3f} {len(lines) / seconds:>10.0f} {baseline / seconds:>7.2f}x")
+
+    baseline = best_of(args.repeat, lambda: [legacy_add_speech_enhancements(legacy_clean_text_for_speech(l)) for l in lines])
+    report("speech: step-by-step", baseline, baseline)
+    report("speech: compiled", best_of(args.repeat, lambda: [add_pauses(normalize_for_speech(l)) for l in lines]), baseline)
+
+    baseline = best_of(args.repeat, lambda: [legacy_normalize_speaker(l) for l in labels])
+    report("speakers: per line", baseline, baseline)
+    report("speakers: compiled", best_of(args.repeat, lambda: [normalize_speaker(l) for l in labels]), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Throughput load test for the TTS backends.
+
+Renders a generated podcast script end to end with one backend through
+text_to_speech (segmenting, parallel synthesis and joining) and reports
+segments per second and, for WAV output, the real-time factor. The local
+espeak backend needs no network, so this can run on build machines:
+
+    apt-get install espeak-ng
+    python benchmarks/bench_tts_backends.py --backend espeak --turns 40
+
+The TTS cache is disabled so every run synthesizes every segment.
+
+Usage:
+    python benchmarks/bench_tts_backends.py [--backend espeak] [--turns 40] [--workers 1 2 4 8] [--repeat 1]
+"""
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.environ["TTS_CACHE_ENABLED"] = "false"
+
+from src.youtube_podcast.models.conversation import Conversation
+from src.youtube_podcast.utils.eleven_labs import iter_turn_segments, text_to_speech
+from src.youtube_podcast.utils.tts_backends import get_tts_backend, split_wav
+
+
+def make_script(turns: int) -> str:
+    """Build a two-host script of roughly podcast length."""
+    return "\n".join(
+        f"Host{1 + i % 2}: This is turn number {i} of the conversation. We're covering one of the main "
+        f"points from the video in a couple of sentences. Does that sound about right to you?"
+        for i in range(turns)
+    )
+
+
+def wav_seconds(path: str) -> float:
+    """Duration of a PCM WAV file."""
+    with open(path, "rb") as f:
+        fmt, data = split_wav(f.read())
+    channels, sample_rate = struct.unpack("<HI", fmt[2:8])
+    bits_per_sample = struct.unpack("<H", fmt[14:16])[0]
+    return len(data) / (sample_rate * channels * bits_per_sample // 8)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", default="espeak", help="TTS backend to load test")
+    parser.add_argument("--turns", type=int, default=40, help="Speaker turns in the script")
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="Worker counts to test; defaults to the backend's own hint")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per worker count; the fastest is reported")
+    args = parser.parse_args()
+
+    backend = get_tts_backend(args.backend)
+    if not backend.is_available():
+        sys.exit(f"The {backend.name} backend is not available here")
+
+    script = make_script(args.turns)
+    # Split the way text_to_speech does with one voice per host
+    segments = list(iter_turn_segments(Conversation.coerce(script), backend.max_chars))
+    output_file = os.path.join(tempfile.mkdtemp(prefix="bench_tts_"), f"podcast.{backend.audio_format}")
+
+    print(f"{backend.name}: {len(script.split())} words, {len(segments)} segments")
+    print(f"{'workers':<8} {'seconds':>9} {'seg/s':>8} {'realtime':>9}")
+
+    default_workers = backend.max_workers
+    for workers in args.workers or [default_workers]:
+        backend.max_workers = workers
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            text_to_speech(script, output_file, backend=backend.name)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        realtime = f"{wav_seconds(output_file) / best:>8.1f}x" if backend.audio_format == "wav" else f"{'-':>9}"
+        print(f"{workers:<8} {best:>9.2f} {len(segments) / best:>8.1f} {realtime}")
+    backend.max_workers = default_workers
+
+
+if __name__ == "__main__":
+    main()
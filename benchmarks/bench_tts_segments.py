@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for segmented, parallel podcast speech synthesis.
+
+gTTS sends one request to Google per ~100 characters of text, one after
+another. This benchmark replaces the network call with a fake synthesizer
+that sleeps for a fixed latency per 100 characters and returns dummy MP3
+bytes. It compares one call for the whole script (the previous behaviour)
+with parallel segment synthesis at increasing worker counts.
+
+Usage:
+    python benchmarks/bench_tts_segments.py [--turns 40] [--latency 0.15]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from src.youtube_podcast.models.conversation import Conversation
+from src.youtube_podcast.utils.eleven_labs import iter_synthesized_segments, iter_turn_segments
+
+# gTTS splits text into requests of at most this many characters
+GTTS_CHUNK_CHARS = 100
+
+
+def make_script(turns: int) -> str:
+    """Build a two-host script of roughly podcast length."""
+    lines = []
+    for i in range(turns):
+        speaker = "Host1" if i % 2 == 0 else "Host2"
+        lines.append(
+            f"{speaker}: This is turn number {i} of the conversation. We're covering one of the main "
+            f"points from the video in a couple of sentences. Does that sound about right to you?"
+        )
+    return "\n".join(lines)
+
+
+def make_synthesizer(latency: float):
+    """Create a fake synthesizer with `latency` seconds per gTTS request."""
+
+    def synthesize(text: str) -> bytes:
+        time.sleep(latency * math.ceil(len(text) / GTTS_CHUNK_CHARS))
+        return b"\xff\xfb" + text.encode("utf-8")
+
+    return synthesize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=40, help="Speaker turns in the script")
+    parser.add_argument("--latency", type=float, default=0.15, help="Fake latency per gTTS request in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to test")
+    args = parser.parse_args()
+
+    script = make_script(args.turns)
+    synthesize = make_synthesizer(args.latency)
+    segments = [text for _, text in iter_turn_segments(Conversation.coerce(script))]
+    whole_text = " ".join(segments)
+
+    print(f"{len(script.split())} words, {len(segments)} segments, "
+          f"{args.latency * 1000:.0f} ms simulated latency per gTTS request")
+    print(f"{'strategy':<16} {'seconds':>9} {'speedup':>8}")
+
+    start = time.perf_counter()
+    synthesize(whole_text)
+    baseline = time.perf_counter() - start
+    print(f"{'single call':<16} {baseline:>9.2f} {1:>7.1f}x")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        audio = list(iter_synthesized_segments(segments, synthesize=synthesize, max_workers=workers))
+        elapsed = time.perf_counter() - start
+
+        assert len(audio) == len(segments), "missing segments"
+        print(f"{f'{workers} workers':<16} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
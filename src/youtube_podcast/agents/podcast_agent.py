@@ -1,38 +1,36 @@
-from langchain_community.chat_models import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.runnables import RunnablePassthrough, RunnableLambda
 from gtts import gTTS
-from ..config.settings import OPENAI_API_KEY, DEFAULT_LLM_MODEL, DEFAULT_LANGUAGE_CODE, DEFAULT_OUTPUT_FILENAME, DEFAULT_OUTPUT_DIR
-from ..utils.eleven_labs import text_to_speech
-from ..utils.title_generator import generate_podcast_title
+from ..config.settings import OPENAI_API_KEY, DEFAULT_LLM_MODEL, DEFAULT_LANGUAGE_CODE, DEFAULT_OUTPUT_FILENAME, DEFAULT_OUTPUT_DIR, STRUCTURED_OUTPUT_ENABLED, TITLE_STRATEGY
+from ..utils.eleven_labs import text_to_speech, render_speech
+from ..utils.tts_backends import get_tts_backend
+from ..models.conversation import Conversation, iter_turns
+from ..utils.llm_registry import get_llm, get_chain
+from ..utils.llm_cache import cached_completion, get_cached_completion, store_completion, prompt_version
+from ..utils.title_generator import generate_podcast_title, parse_titled_response
+from ..utils.tracing import propagate, span
+from ..utils.checkpoints import content_checkpoint_id, save_checkpoint, load_checkpoint, clear_checkpoint
 import os
 import re
 import time
+import queue
 import random
 import tempfile
 import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 
 # Set environment variables
 os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
 
-def create_conversation(state: Dict) -> Dict:
-    """Generate a conversation between two hosts based on a YouTube transcript"""
-    if state["status"] != "transcript_fetched":
-        state["error"] = "No transcript available"
-        return state
-    
-    # Setup the LLM
-    llm = ChatOpenAI(
-        openai_api_key=OPENAI_API_KEY,
-        model_name="gpt-3.5-turbo",
-        temperature=0.7
-    )
-    
-    # Define the prompt templates
-    system_prompt = """You are an AI assistant tasked with creating a podcast-style conversation
+CONVERSATION_MODEL = "gpt-3.5-turbo"
+CONVERSATION_TEMPERATURE = 0.7
+
+# Define the prompt templates
+SYSTEM_PROMPT = """You are an AI assistant tasked with creating a podcast-style conversation
     between two hosts about a YouTube video.
 
     The conversation should:
@@ -60,97 +58,197 @@ def create_conversation(state: Dict) -> Dict:
     - Occasionally include short questions or brief responses
     - Vary sentence length for a more natural cadence
     """
-    
-    human_prompt = """Here is a transcript from a YouTube video:
+
+HUMAN_PROMPT = """Here is a transcript from a YouTube video:
     
     {transcript}
     
     Based on this transcript, create an engaging podcast conversation between two hosts.
     Make it sound like a natural conversation between friends, not a formal discussion.
     """
-    
-    # Create the prompt template
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_prompt),
-        ("human", human_prompt)
-    ])
-    
-    # Create the generation chain
-    generation_chain = (
+
+CONVERSATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("human", HUMAN_PROMPT)
+])
+
+# Single-call variant that returns the conversation and its title as JSON
+STRUCTURED_CONVERSATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT + """
+    Respond with a JSON object with exactly two keys:
+    - "title": a catchy, descriptive title for the podcast episode: concise (5-8 words),
+      engaging, clearly indicating the main topic, with no quotes or special characters
+    - "conversation": the full conversation, one line of dialogue per line
+    """),
+    ("human", HUMAN_PROMPT)
+])
+
+# Cache key components; change whenever a prompt changes
+CONVERSATION_PROMPT_VERSION = prompt_version(CONVERSATION_PROMPT)
+STRUCTURED_CONVERSATION_PROMPT_VERSION = prompt_version(STRUCTURED_CONVERSATION_PROMPT)
+
+def _build_conversation_chain():
+    """Create the conversation generation chain."""
+    return (
+        {"transcript": RunnablePassthrough()}
+        | CONVERSATION_PROMPT
+        | get_llm(CONVERSATION_MODEL, CONVERSATION_TEMPERATURE)
+    )
+
+def _build_structured_conversation_chain():
+    """Create the chain that returns conversation and title in one JSON completion."""
+    return (
         {"transcript": RunnablePassthrough()}
-        | prompt
-        | llm
+        | STRUCTURED_CONVERSATION_PROMPT
+        | get_llm(CONVERSATION_MODEL, CONVERSATION_TEMPERATURE).bind(response_format={"type": "json_object"})
     )
+
+def _generate_structured_conversation(transcript: str, use_cache: bool = True) -> Optional[Tuple[str, str]]:
+    """
+    Generate a conversation and its title in a single LLM call.
     
-    # Generate the conversation
-    transcript = state["transcript"]
-    ai_message = generation_chain.invoke(transcript)
-    conversation = ai_message.content
+    Args:
+        transcript: The transcript text
+        use_cache: Whether a cached response may be reused
+        
+    Returns:
+        (conversation, title) tuple, or None if the response couldn't be parsed
+    """
+    cache_args = (
+        "conversation_structured", CONVERSATION_MODEL, CONVERSATION_TEMPERATURE,
+        STRUCTURED_CONVERSATION_PROMPT_VERSION, transcript
+    )
     
-    # Process conversation to ensure proper format
-    formatted_conversation = format_conversation(conversation)
+    with span("llm.conversation_structured", "client", model=CONVERSATION_MODEL) as current:
+        text = get_cached_completion(*cache_args) if use_cache else None
+        current.set_attribute("cache_hit", text is not None)
+        if text is not None:
+            return parse_titled_response(text, "conversation")
+        
+        started = time.perf_counter()
+        try:
+            text = get_chain("conversation_structured", _build_structured_conversation_chain).invoke(transcript).content
+        except Exception as e:
+            current.record_error(e)
+            print(f"Structured conversation failed, falling back to separate title call: {str(e)}")
+            return None
+        
+        parsed = parse_titled_response(text, "conversation")
+        if parsed is None:
+            current.record_error("Response was not valid JSON")
+            print("Structured conversation was not valid JSON, falling back to separate title call")
+            return None
+        
+        # Only well-formed responses are worth caching
+        store_completion(*cache_args, text, cost=time.perf_counter() - started)
+        return parsed
+
+def create_conversation(state: Dict) -> Dict:
+    """Generate a conversation between two hosts based on a YouTube transcript"""
+    if state["status"] != "transcript_fetched":
+        state["error"] = "No transcript available"
+        return state
     
-    # Generate title for the podcast
-    podcast_title = generate_podcast_title(formatted_conversation)
+    transcript = state["transcript"]
+    use_cache = state.get("use_cache", True)
+    title_strategy = state.get("title_strategy") or TITLE_STRATEGY
     
-    # Create a suitable filename
-    if podcast_title:
-        # Clean title to use as filename (remove special chars, replace spaces with underscores)
-        clean_title = ''.join(c if c.isalnum() or c in ' -_' else '_' for c in podcast_title)
-        clean_title = clean_title.replace(' ', '_')
-        podcast_filename = f"{clean_title}.mp3"
+    # Try getting conversation and title from one JSON completion
+    structured = None
+    if STRUCTURED_OUTPUT_ENABLED and title_strategy == "llm":
+        structured = _generate_structured_conversation(transcript, use_cache=use_cache)
+    
+    if structured is not None:
+        conversation, podcast_title = structured
+        parsed_conversation = Conversation.from_text(conversation)
     else:
-        # Fallback to date-based filename
-        current_date = datetime.now().strftime("%Y%m%d")
-        podcast_filename = f"podcast_{current_date}.mp3"
+        # Reuse the process-wide chain and LLM client
+        generation_chain = get_chain("conversation", _build_conversation_chain)
+        
+        # Generate the conversation, reusing a cached one for an identical transcript
+        conversation = cached_completion(
+            "conversation", CONVERSATION_MODEL, CONVERSATION_TEMPERATURE, CONVERSATION_PROMPT_VERSION,
+            transcript, lambda: generation_chain.invoke(transcript).content, use_cache=use_cache
+        )
+        
+        # Parse into speaker turns once; later stages share the parsed form
+        parsed_conversation = Conversation.from_text(conversation)
+        
+        # Generate title for the podcast
+        podcast_title = generate_podcast_title(parsed_conversation, use_cache=use_cache, strategy=title_strategy)
     
     # Update the state
-    state["conversation"] = formatted_conversation
+    state["conversation"] = parsed_conversation
     state["podcast_title"] = podcast_title
-    state["podcast_filename"] = podcast_filename
+    state["podcast_filename"] = _podcast_filename(podcast_title, _audio_extension(state))
     state["status"] = "conversation_created"
+    save_checkpoint(state.get("checkpoint_id"), "conversation_created", state)
     
     return state
 
+def podcast_checkpoint_id(state: Dict) -> str:
+    """Checkpoint ID shared by every retry of a podcast for the same transcript (or URL) and title strategy."""
+    source = state.get("transcript") or state.get("url", "")
+    return content_checkpoint_id("podcast", source, state.get("title_strategy") or TITLE_STRATEGY)
+
+def resume_from_checkpoint(state: Dict) -> Dict:
+    """
+    Pick up a podcast where an earlier attempt with the same 'checkpoint_id' failed.
+    
+    If that attempt got as far as a conversation, it is restored and the
+    state is ready for generate_podcast; otherwise the state is unchanged.
+    """
+    checkpoint = load_checkpoint(state.get("checkpoint_id"))
+    if not checkpoint or checkpoint["status"] != "conversation_created" or "conversation" not in checkpoint:
+        return state
+    
+    podcast_title = checkpoint.get("podcast_title")
+    if podcast_title is None:
+        # The attempt failed before its title was ready
+        podcast_title = generate_podcast_title(
+            checkpoint["conversation"], use_cache=state.get("use_cache", True),
+            strategy=state.get("title_strategy") or TITLE_STRATEGY
+        )
+    
+    state["conversation"] = checkpoint["conversation"]
+    state["podcast_title"] = podcast_title
+    state["podcast_filename"] = _podcast_filename(podcast_title, _audio_extension(state))
+    state["status"] = "conversation_created"
+    state["resumed_from"] = "conversation_created"
+    return state
+
+def _audio_extension(state: Dict) -> str:
+    """File extension for the audio format of the state's TTS backend."""
+    return get_tts_backend(state.get("tts_backend")).audio_format
+
+def _podcast_filename(podcast_title: Optional[str], extension: str = "mp3") -> str:
+    """Create a suitable audio filename for a podcast title."""
+    if podcast_title:
+        # Clean title to use as filename (remove special chars, replace spaces with underscores)
+        clean_title = ''.join(c if c.isalnum() or c in ' -_' else '_' for c in podcast_title)
+        clean_title = clean_title.replace(' ', '_')
+        return f"{clean_title}.{extension}"
+    
+    # Fallback to date-based filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    return f"podcast_{current_date}.{extension}"
+
 def format_conversation(conversation: str) -> str:
     """Format the conversation to ensure proper speaker labeling and alternation"""
-    lines = conversation.strip().split('\n')
-    formatted_lines = []
-    current_speaker = None
-    
-    # Define possible host names for consistent replacement
-    host1_options = ["Host1", "Host 1", "Speaker1", "Speaker 1"]
-    host2_options = ["Host2", "Host 2", "Speaker2", "Speaker 2"]
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if line starts with a speaker indicator
-        if ':' in line:
-            parts = line.split(':', 1)
-            speaker = parts[0].strip()
-            text = parts[1].strip()
-            
-            # Normalize speaker names for consistency
-            speaker_lower = speaker.lower()
-            if any(option.lower() in speaker_lower for option in host1_options):
-                speaker = "Host1"
-            elif any(option.lower() in speaker_lower for option in host2_options):
-                speaker = "Host2"
-                
-            current_speaker = speaker
-            formatted_lines.append(f"{speaker}: {text}")
-        else:
-            # For lines without speaker prefixes, assign to alternating speakers
-            if current_speaker is None or current_speaker == "Host2":
-                current_speaker = "Host1"
-            else:
-                current_speaker = "Host2"
-            formatted_lines.append(f"{current_speaker}: {line}")
-    
-    return '\n'.join(formatted_lines)
+    return Conversation.from_text(conversation).text
+
+def _podcast_audio_path(state: Dict) -> str:
+    """Get the final audio path for a podcast, creating the output directory."""
+    # Create output directory if it doesn't exist
+    os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+    
+    # Determine the final audio path
+    if "podcast_filename" in state and state["podcast_filename"]:
+        audio_filename = state["podcast_filename"]
+    else:
+        audio_filename = _podcast_filename(None, _audio_extension(state))
+    
+    return os.path.join(DEFAULT_OUTPUT_DIR, audio_filename)
 
 def generate_podcast(state: Dict) -> Dict:
     """Generate the podcast audio file from a conversation script"""
@@ -168,18 +266,7 @@ def generate_podcast(state: Dict) -> Dict:
     with tempfile.TemporaryDirectory() as tmp_dir:
         temp_audio_path = os.path.join(tmp_dir, "temp_podcast.mp3")
         
-        # Create output directory if it doesn't exist
-        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
-        
-        # Determine the final audio path
-        if "podcast_filename" in state and state["podcast_filename"]:
-            audio_filename = state["podcast_filename"]
-        else:
-            # Fallback to date-based filename
-            current_date = datetime.now().strftime("%Y%m%d")
-            audio_filename = f"podcast_{current_date}.mp3"
-        
-        audio_path = os.path.join(DEFAULT_OUTPUT_DIR, audio_filename)
+        audio_path = _podcast_audio_path(state)
         
         # Retry logic for audio generation
         for attempt in range(max_retries):
@@ -188,12 +275,14 @@ def generate_podcast(state: Dict) -> Dict:
                 text_to_speech(
                     text=state["conversation"],
                     output_file=temp_audio_path,
-                    gender=gender
+                    gender=gender,
+                    backend=state.get("tts_backend")
                 )
                 
                 # If successful, copy from temp location to final destination
                 if os.path.exists(temp_audio_path):
-                    shutil.copy2(temp_audio_path, audio_path)
+                    with span("file.copy", bytes=os.path.getsize(temp_audio_path)):
+                        shutil.copy2(temp_audio_path, audio_path)
                     break  # Exit the retry loop on success
                 else:
                     raise Exception(f"Failed to generate audio file (attempt {attempt+1}/{max_retries})")
@@ -212,5 +301,198 @@ def generate_podcast(state: Dict) -> Dict:
         # Update the state with audio path
         state["audio_path"] = audio_path
         state["status"] = "podcast_generated"
+        clear_checkpoint(state.get("checkpoint_id"))
+    
+    return state
+
+def stream_podcast_audio(state: Dict) -> Iterator[bytes]:
+    """
+    Synthesize the podcast audio, yielding bytes as each segment is ready.
+    
+    Segments are synthesized in parallel and yielded in order, so playback
+    can start after the first one. The audio is also written to the output
+    directory; once the last segment has been yielded, state holds
+    'audio_path' and status 'podcast_generated'. If the consumer stops
+    early, the partial file is discarded.
+    
+    Args:
+        state: Workflow state with a created conversation and optional
+            'gender' and 'tts_backend'
+        
+    Yields:
+        Chunks of one continuous audio stream in the backend's format
+    """
+    if state["status"] != "conversation_created" or "conversation" not in state:
+        raise ValueError("No conversation script available")
+    
+    audio_path = _podcast_audio_path(state)
+    tmp_path = f"{audio_path}.{uuid.uuid4().hex}.part"
+    
+    tts = get_tts_backend(state.get("tts_backend"))
+    conversation = Conversation.coerce(state["conversation"])
+    audio_chunks = render_speech(conversation, state.get("gender", "mixed"), tts)
+    completed = False
+    try:
+        with open(tmp_path, "wb") as f:
+            for audio in audio_chunks:
+                f.write(audio)
+                yield audio
+        
+        tts.finalize(tmp_path)
+        os.replace(tmp_path, audio_path)
+        completed = True
+        
+        # Update the state with audio path
+        state["audio_path"] = audio_path
+        state["status"] = "podcast_generated"
+    finally:
+        # Cancel outstanding segments and drop the partial file
+        audio_chunks.close()
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _stream_conversation_lines(transcript: str, use_cache: bool = True) -> Iterator[str]:
+    """
+    Stream the raw conversation from the LLM, one completed line at a time.
+    
+    Shares its cache entries with create_conversation's two-call path.
+    
+    Args:
+        transcript: The transcript text
+        use_cache: Whether a cached conversation may be reused
+        
+    Yields:
+        Raw conversation lines as soon as each one is complete
+    """
+    cache_args = (
+        "conversation", CONVERSATION_MODEL, CONVERSATION_TEMPERATURE,
+        CONVERSATION_PROMPT_VERSION, transcript
+    )
+    
+    cached = get_cached_completion(*cache_args) if use_cache else None
+    if cached is not None:
+        yield from cached.split('\n')
+        return
+    
+    started = time.perf_counter()
+    parts = []
+    buffer = ""
+    for chunk in get_chain("conversation", _build_conversation_chain).stream(transcript):
+        parts.append(chunk.content)
+        buffer += chunk.content
+        while '\n' in buffer:
+            line, buffer = buffer.split('\n', 1)
+            yield line
+    if buffer:
+        yield buffer
+    
+    store_completion(*cache_args, "".join(parts), cost=time.perf_counter() - started)
+
+def generate_podcast_pipelined(state: Dict) -> Dict:
+    """
+    Generate the conversation and its audio with the two stages overlapping.
+    
+    The conversation is streamed from the LLM; each completed turn is
+    formatted and queued for speech synthesis straight away, and the audio
+    is written in order as segments finish. The title is generated once the
+    conversation is complete, while the last segments are still rendering.
+    Produces the same state as create_conversation followed by
+    generate_podcast.
+    """
+    if state["status"] != "transcript_fetched":
+        state["error"] = "No transcript available"
+        return state
+    
+    transcript = state["transcript"]
+    use_cache = state.get("use_cache", True)
+    title_strategy = state.get("title_strategy") or TITLE_STRATEGY
+    gender = state.get("gender", "mixed")
+    tts = get_tts_backend(state.get("tts_backend"))
+    
+    os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+    tmp_path = os.path.join(DEFAULT_OUTPUT_DIR, f"podcast_{uuid.uuid4().hex}.{tts.audio_format}.part")
+    
+    turns = []
+    conversation = None
+    title_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="podcast-title")
+    title_future = None
+    # The title is requested from the producer thread; keep its span in this trace
+    generate_title = propagate(generate_podcast_title)
+    checkpoint_id = state.get("checkpoint_id")
+    
+    # The LLM stream is read on its own thread into a queue, so a failed
+    # segment stops synthesis without cutting the conversation short: the
+    # stream still runs to the end and is cached and checkpointed for a retry
+    streamed = queue.Queue()
+    
+    def produce_turns():
+        nonlocal conversation, title_future
+        try:
+            for turn in iter_turns(_stream_conversation_lines(transcript, use_cache)):
+                turns.append(turn)
+                streamed.put(turn)
+            
+            # Conversation complete: generate the title while the remaining audio renders
+            conversation = Conversation(turns)
+            save_checkpoint(checkpoint_id, "conversation_created", {**state, "conversation": conversation})
+            title_future = title_executor.submit(generate_title, conversation, use_cache, title_strategy)
+        except BaseException as e:
+            streamed.put(e)
+        finally:
+            streamed.put(None)
+    
+    def streamed_turns():
+        while True:
+            item = streamed.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    
+    producer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="podcast-turns")
+    producer = producer_executor.submit(propagate(produce_turns))
+    
+    try:
+        # Covers the streamed LLM conversation too, which overlaps synthesis
+        with span("tts.render", backend=tts.name, pipelined=True):
+            with open(tmp_path, "wb") as f:
+                for audio in render_speech(streamed_turns(), gender, tts):
+                    f.write(audio)
+        
+        if not conversation:
+            raise ValueError("The LLM returned an empty conversation")
+        
+        podcast_title = title_future.result() if title_future else None
+        podcast_filename = _podcast_filename(podcast_title, tts.audio_format)
+        tts.finalize(tmp_path)
+        audio_path = os.path.join(DEFAULT_OUTPUT_DIR, podcast_filename)
+        os.replace(tmp_path, audio_path)
+        
+    except Exception as e:
+        # Let the conversation finish so the retry only repeats the audio
+        producer.result()
+        if conversation and title_future and not title_future.exception():
+            # Keep the title with the checkpointed conversation for the retry
+            save_checkpoint(checkpoint_id, "conversation_created", {
+                **state, "conversation": conversation, "podcast_title": title_future.result()
+            })
+        state["error"] = f"Pipelined podcast generation failed: {str(e)}"
+        state["status"] = "error"
+        return state
+    
+    finally:
+        producer_executor.shutdown(wait=False)
+        title_executor.shutdown(wait=False)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    # Update the state
+    state["conversation"] = conversation
+    state["podcast_title"] = podcast_title
+    state["podcast_filename"] = podcast_filename
+    state["audio_path"] = audio_path
+    state["status"] = "podcast_generated"
+    clear_checkpoint(checkpoint_id)
     
     return state
@@ -1,31 +1,31 @@
 import os
 import time
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple
 
-from langchain_community.chat_models import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 
-from ..config.settings import OPENAI_API_KEY, DEFAULT_OUTPUT_DIR
-from ..utils.title_generator import generate_summary_title, clean_title_for_filename
+from ..config.settings import (
+    DEFAULT_OUTPUT_DIR,
+    SUMMARY_MAP_REDUCE_THRESHOLD,
+    SUMMARY_CHUNK_TOKENS,
+    SUMMARY_MAX_CONCURRENCY,
+    STRUCTURED_OUTPUT_ENABLED,
+    TITLE_STRATEGY,
+)
+from ..utils.llm_registry import get_llm, get_chain
+from ..utils.llm_cache import cached_completion, get_cached_completion, store_completion, prompt_version
+from ..utils.metrics import record_latency
+from ..utils.text_chunker import count_tokens, chunk_text
+from ..utils.tracing import span, traced
+from ..utils.title_generator import generate_summary_title, clean_title_for_filename, parse_titled_response
 
-def generate_summary(state: Dict) -> Dict:
-    """Generate a comprehensive summary of the YouTube video transcript"""
-    if state["status"] != "transcript_fetched":
-        state["error"] = "No transcript available"
-        return state
-    
-    try:
-        # Setup the LLM
-        llm = ChatOpenAI(
-            openai_api_key=OPENAI_API_KEY,
-            model_name="gpt-3.5-turbo",
-            temperature=0.3
-        )
-        
-        # Define the prompt templates
-        system_prompt = """You are an AI assistant tasked with creating comprehensive summaries of YouTube videos.
+SUMMARY_MODEL = "gpt-3.5-turbo"
+SUMMARY_TEMPERATURE = 0.3
+
+# Define the prompt templates
+SYSTEM_PROMPT = """You are an AI assistant tasked with creating comprehensive summaries of YouTube videos.
         
         Your summary should:
         - Be comprehensive and informative
@@ -35,58 +35,238 @@ def generate_summary(state: Dict) -> Dict:
         - Use clear, concise language
         - Maintain the original meaning without adding new information
         """
-        
-        human_prompt = """Here is a transcript from a YouTube video:
+
+HUMAN_PROMPT = """Here is a transcript from a YouTube video:
         
         {transcript}
         
         Please provide a comprehensive summary of this video.
         """
+
+SUMMARY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("human", HUMAN_PROMPT)
+])
+
+# Single-call variant that returns the summary and its title as JSON
+STRUCTURED_SUMMARY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT + """
+        Respond with a JSON object with exactly two keys:
+        - "title": a clear, descriptive title for the summary: brief (4-7 words), factual
+          and informative, representing the main topic or conclusion, with no quotes
+          or special characters
+        - "summary": the summary text
+        """),
+    ("human", HUMAN_PROMPT)
+])
+
+# Prompts for long transcripts: summarize each chunk, then merge the partial summaries
+MAP_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an AI assistant summarizing one part of a long YouTube video transcript.
         
-        # Create the prompt template
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", human_prompt)
-        ])
-        
-        # Create the generation chain
-        generation_chain = (
-            {"transcript": RunnablePassthrough()}
-            | prompt
-            | llm
-        )
+        Your summary should:
+        - Capture every key point, fact and argument in this part
+        - Be approximately 150-250 words
+        - Use clear, concise language
+        - Not add information that is not in the transcript
+        """),
+    ("human", """Here is part {part} of {total} of a transcript from a YouTube video:
         
-        # Generate the summary
-        transcript = state["transcript"]
-        ai_message = generation_chain.invoke(transcript)
-        summary = ai_message.content
+        {chunk}
         
-        # Generate a title for the summary
-        summary_title = generate_summary_title(summary)
+        Please summarize this part.
+        """)
+])
+
+REDUCE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("human", """Here are summaries of consecutive parts of a transcript from a YouTube video:
         
-        # Create output directory if it doesn't exist
-        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+        {summaries}
         
-        # Create a suitable filename
-        if summary_title:
-            # Clean title to use as filename
-            clean_title = clean_title_for_filename(summary_title)
-            current_date = datetime.now().strftime("%Y%m%d")
-            summary_filename = f"{clean_title}_{current_date}.txt"
-        else:
-            # Fallback to date-based filename
-            current_date = datetime.now().strftime("%Y%m%d")
-            summary_filename = f"summary_{current_date}.txt"
+        Please combine them into one comprehensive summary of the whole video.
+        """)
+])
+
+# Cache key component; changes whenever the prompts or chunking change
+SUMMARY_PROMPT_VERSION = prompt_version(
+    SUMMARY_PROMPT, MAP_PROMPT, REDUCE_PROMPT,
+    f"threshold={SUMMARY_MAP_REDUCE_THRESHOLD};chunk={SUMMARY_CHUNK_TOKENS}"
+)
+
+STRUCTURED_SUMMARY_PROMPT_VERSION = prompt_version(STRUCTURED_SUMMARY_PROMPT)
+
+def _build_summary_chain():
+    """Create the summary generation chain."""
+    return (
+        {"transcript": RunnablePassthrough()}
+        | SUMMARY_PROMPT
+        | get_llm(SUMMARY_MODEL, SUMMARY_TEMPERATURE)
+    )
+
+def _build_structured_summary_chain():
+    """Create the chain that returns summary and title in one JSON completion."""
+    return (
+        {"transcript": RunnablePassthrough()}
+        | STRUCTURED_SUMMARY_PROMPT
+        | get_llm(SUMMARY_MODEL, SUMMARY_TEMPERATURE).bind(response_format={"type": "json_object"})
+    )
+
+def _generate_structured_summary(transcript: str, use_cache: bool = True) -> Optional[Tuple[str, str]]:
+    """
+    Generate a summary and its title in a single LLM call.
+    
+    Args:
+        transcript: The transcript text
+        use_cache: Whether a cached response may be reused
+        
+    Returns:
+        (summary, title) tuple, or None if the response couldn't be parsed
+    """
+    cache_args = (
+        "summary_structured", SUMMARY_MODEL, SUMMARY_TEMPERATURE,
+        STRUCTURED_SUMMARY_PROMPT_VERSION, transcript
+    )
+    
+    with span("llm.summary_structured", "client", model=SUMMARY_MODEL) as current:
+        text = get_cached_completion(*cache_args) if use_cache else None
+        current.set_attribute("cache_hit", text is not None)
+        if text is not None:
+            return parse_titled_response(text, "summary")
+        
+        started = time.perf_counter()
+        try:
+            text = get_chain("summary_structured", _build_structured_summary_chain).invoke(transcript).content
+        except Exception as e:
+            current.record_error(e)
+            print(f"Structured summary failed, falling back to separate title call: {str(e)}")
+            return None
+        
+        parsed = parse_titled_response(text, "summary")
+        if parsed is None:
+            current.record_error("Response was not valid JSON")
+            print("Structured summary was not valid JSON, falling back to separate title call")
+            return None
+        
+        # Only well-formed responses are worth caching
+        store_completion(*cache_args, text, cost=time.perf_counter() - started)
+        return parsed
+
+def _map_chunk_summaries(transcript: str) -> str:
+    """
+    Summarize the chunks of a long transcript concurrently.
+    
+    Args:
+        transcript: The full transcript text
+        
+    Returns:
+        The partial summaries, labelled by part, ready for the reduce prompt
+    """
+    chunks = chunk_text(transcript, SUMMARY_CHUNK_TOKENS, model=SUMMARY_MODEL)
+    
+    map_chain = get_chain("summary_map", lambda: MAP_PROMPT | get_llm(SUMMARY_MODEL, SUMMARY_TEMPERATURE))
+    with span("llm.summary_map", "client", model=SUMMARY_MODEL, chunks=len(chunks)):
+        partial_messages = map_chain.batch(
+            [{"part": i + 1, "total": len(chunks), "chunk": chunk} for i, chunk in enumerate(chunks)],
+            config={"max_concurrency": SUMMARY_MAX_CONCURRENCY}
+        )
+    return "\n\n".join(
+        f"Part {i + 1}:\n{message.content}" for i, message in enumerate(partial_messages)
+    )
+
+def _get_reduce_chain():
+    return get_chain("summary_reduce", lambda: REDUCE_PROMPT | get_llm(SUMMARY_MODEL, SUMMARY_TEMPERATURE))
+
+def _summarize_map_reduce(transcript: str) -> str:
+    """
+    Summarize a long transcript by summarizing chunks concurrently and merging them.
+    
+    Args:
+        transcript: The full transcript text
         
-        # Full path to summary file
-        summary_path = os.path.join(DEFAULT_OUTPUT_DIR, summary_filename)
+    Returns:
+        The merged summary
+    """
+    summaries = _map_chunk_summaries(transcript)
+    return _get_reduce_chain().invoke({"summaries": summaries}).content
+
+def _uses_map_reduce(transcript: str) -> bool:
+    return count_tokens(transcript, model=SUMMARY_MODEL) > SUMMARY_MAP_REDUCE_THRESHOLD
+
+@traced("file.summary")
+def _save_summary(summary: str, summary_title: Optional[str]) -> str:
+    """
+    Write a summary, headed by its title, to the output directory.
+    
+    Returns:
+        Full path of the written file
+    """
+    # Create output directory if it doesn't exist
+    os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+    
+    # Create a suitable filename
+    if summary_title:
+        # Clean title to use as filename
+        clean_title = clean_title_for_filename(summary_title)
+        current_date = datetime.now().strftime("%Y%m%d")
+        summary_filename = f"{clean_title}_{current_date}.txt"
+    else:
+        # Fallback to date-based filename
+        current_date = datetime.now().strftime("%Y%m%d")
+        summary_filename = f"summary_{current_date}.txt"
+    
+    # Full path to summary file
+    summary_path = os.path.join(DEFAULT_OUTPUT_DIR, summary_filename)
+    
+    # Create the formatted summary with title
+    formatted_summary = f"{summary_title}\n\n{summary}" if summary_title else summary
+    
+    # Write the summary to a file
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write(formatted_summary)
+    
+    return summary_path
+
+def generate_summary(state: Dict) -> Dict:
+    """Generate a comprehensive summary of the YouTube video transcript"""
+    if state["status"] != "transcript_fetched":
+        state["error"] = "No transcript available"
+        return state
+    
+    try:
+        started = time.perf_counter()
+        transcript = state["transcript"]
+        use_cache = state.get("use_cache", True)
+        title_strategy = state.get("title_strategy") or TITLE_STRATEGY
         
-        # Create the formatted summary with title
-        formatted_summary = f"{summary_title}\n\n{summary}" if summary_title else summary
+        structured = None
+        if _uses_map_reduce(transcript):
+            # Long transcript: summarize chunks in parallel, then merge
+            state["summary_mode"] = "map_reduce"
+            generate = lambda: _summarize_map_reduce(transcript)
+        else:
+            # Reuse the process-wide chain and LLM client
+            state["summary_mode"] = "single"
+            generate = lambda: get_chain("summary", _build_summary_chain).invoke(transcript).content
+            
+            # Try getting summary and title from one JSON completion
+            if STRUCTURED_OUTPUT_ENABLED and title_strategy == "llm":
+                structured = _generate_structured_summary(transcript, use_cache=use_cache)
         
-        # Write the summary to a file
-        with open(summary_path, "w", encoding="utf-8") as f:
-            f.write(formatted_summary)
+        if structured is not None:
+            summary, summary_title = structured
+            state["summary_mode"] = "structured"
+        else:
+            # Generate the summary, reusing a cached one for an identical transcript
+            summary = cached_completion(
+                "summary", SUMMARY_MODEL, SUMMARY_TEMPERATURE, SUMMARY_PROMPT_VERSION,
+                transcript, generate, use_cache=use_cache
+            )
+            
+            # Generate a title for the summary
+            summary_title = generate_summary_title(summary, use_cache=use_cache, strategy=title_strategy)
+        
+        summary_path = _save_summary(summary, summary_title)
         
         # Update the state
         state["summary"] = summary
@@ -94,9 +274,65 @@ def generate_summary(state: Dict) -> Dict:
         state["summary_filename"] = summary_path
         state["status"] = "summary_generated"
         
+        record_latency("summary.total", time.perf_counter() - started)
         return state
         
     except Exception as e:
         state["error"] = f"Summary generation failed: {str(e)}"
         state["status"] = "error"
         return state
+
+def stream_summary(state: Dict) -> Iterator[Tuple[str, Dict]]:
+    """
+    Generate a summary like generate_summary, yielding events as it is produced.
+    
+    Args:
+        state: Workflow state with 'transcript' and optional 'use_cache' and 'title_strategy'
+        
+    Yields:
+        ('token', {'text'}) for each piece of summary text as the LLM streams it,
+        then ('title', {'title'}), then ('done', {'summary', 'title', 'filename',
+        'summary_mode'}). Errors are raised to the caller.
+    """
+    started = time.perf_counter()
+    transcript = state["transcript"]
+    use_cache = state.get("use_cache", True)
+    summary_mode = "map_reduce" if _uses_map_reduce(transcript) else "single"
+    cache_args = ("summary", SUMMARY_MODEL, SUMMARY_TEMPERATURE, SUMMARY_PROMPT_VERSION, transcript)
+    
+    summary = get_cached_completion(*cache_args) if use_cache else None
+    if summary is not None:
+        record_latency("summary.ttft", time.perf_counter() - started)
+        yield "token", {"text": summary}
+    else:
+        if summary_mode == "map_reduce":
+            # The map phase can't be streamed; stream the final merge
+            pieces = _get_reduce_chain().stream({"summaries": _map_chunk_summaries(transcript)})
+        else:
+            pieces = get_chain("summary", _build_summary_chain).stream(transcript)
+        
+        parts = []
+        for chunk in pieces:
+            if not chunk.content:
+                continue
+            if not parts:
+                record_latency("summary.ttft", time.perf_counter() - started)
+            parts.append(chunk.content)
+            yield "token", {"text": chunk.content}
+        
+        summary = "".join(parts)
+        store_completion(*cache_args, summary, cost=time.perf_counter() - started)
+    
+    # Generate a title for the summary
+    summary_title = generate_summary_title(summary, use_cache=use_cache, strategy=state.get("title_strategy"))
+    yield "title", {"title": summary_title or "Summary"}
+    
+    summary_path = _save_summary(summary, summary_title)
+    record_latency("summary.total", time.perf_counter() - started)
+    
+    yield "done", {
+        "summary": summary,
+        "title": summary_title or "Summary",
+        "filename": os.path.basename(summary_path),
+        "summary_mode": summary_mode,
+    }
@@ -15,14 +15,14 @@ def fetch_transcript(state: AgentState) -> AgentState:
 def get_output_preferences(state: AgentState) -> AgentState:
     """Ask the user for their output preference (summary or podcast) and gender for podcast."""
     while True:
-        output_choice = input("Do you want a summary (text output) or podcast (audio file)? Enter 'summary' or 'podcast': ").lower().strip()
-        if output_choice in ["summary", "podcast"]:
+        output_choice = input("Do you want a summary (text output), podcast (audio file) or both? Enter 'summary', 'podcast' or 'both': ").lower().strip()
+        if output_choice in ["summary", "podcast", "both"]:
             break
-        print("Invalid choice. Please enter 'summary' or 'podcast'.")
+        print("Invalid choice. Please enter 'summary', 'podcast' or 'both'.")
     
     state["output_type"] = output_choice
     
-    if output_choice == "podcast":
+    if output_choice in ["podcast", "both"]:
         while True:
             gender_choice = input("Do you prefer a male or female voice for the podcast? Enter 'male' or 'female': ").lower().strip()
             if gender_choice in ["male", "female"]:
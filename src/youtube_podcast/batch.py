@@ -0,0 +1,190 @@
+"""
+Batch runner for VideoTranscript Pro.
+
+Runs every URL in a file through the headless workflow, several at a time,
+and prints one line per video followed by a throughput report:
+
+    python -m src.youtube_podcast.batch urls.txt --output-type podcast --concurrency 4
+
+--output-type both writes a summary and a podcast for each video from a
+single transcript fetch, generating the two in parallel.
+
+The file holds one YouTube URL per line; blank lines and lines starting
+with '#' are skipped. The exit status is 1 if any video failed.
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from .workflow import OUTPUT_TYPES, get_workflow, run_headless
+from .utils.metrics import record_latency
+from .utils.tts_backends import list_tts_backends
+
+
+def read_urls(path: str) -> List[str]:
+    """
+    Read the URLs to process from a file.
+
+    Args:
+        path: File with one URL per line, or '-' for stdin
+
+    Returns:
+        URLs in file order, without blanks and comments
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def process_url(url: str, output_type: str, gender: str, tts_backend: Optional[str],
+                use_cache: bool = True, title_strategy: Optional[str] = None) -> Dict:
+    """
+    Run one URL through the workflow and describe the outcome.
+
+    Args:
+        url: YouTube video URL
+        output_type: 'summary', 'podcast' or 'both'
+        gender: Podcast voice
+        tts_backend: Speech engine; None for TTS_BACKEND
+        use_cache: Reuse cached LLM and speech results
+        title_strategy: 'llm' or 'local'; None for TITLE_STRATEGY
+
+    Returns:
+        Dictionary with url, ok, seconds and either output/title or error
+    """
+    start = time.perf_counter()
+    try:
+        state = run_headless(url, output_type=output_type, gender=gender, tts_backend=tts_backend,
+                             use_cache=use_cache, title_strategy=title_strategy)
+        error = state.get("error")
+    except Exception as e:
+        state, error = {}, str(e)
+    seconds = time.perf_counter() - start
+
+    if error:
+        return {"url": url, "ok": False, "seconds": seconds, "error": error}
+
+    record_latency(f"workflow.{output_type}", seconds)
+    if output_type == "both":
+        output = f"{state.get('summary_filename')}, {state.get('audio_path')}"
+        title = state.get("podcast_title") or state.get("summary_title")
+    elif output_type == "podcast":
+        output, title = state.get("audio_path"), state.get("podcast_title")
+    else:
+        output, title = state.get("summary_filename"), state.get("summary_title")
+    return {"url": url, "ok": True, "seconds": seconds, "output": output, "title": title}
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(results: List[Dict], elapsed: float) -> Dict:
+    """
+    Build the throughput report for a finished batch.
+
+    Args:
+        results: Outcomes from process_url
+        elapsed: Wall-clock seconds for the whole batch
+
+    Returns:
+        Dictionary of counts, throughput and per-item latency percentiles
+    """
+    durations = sorted(result["seconds"] for result in results)
+    succeeded = sum(1 for result in results if result["ok"])
+    report = {
+        "items": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_s": round(elapsed, 2),
+        "items_per_min": round(len(results) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+    }
+    if durations:
+        report.update(
+            mean_s=round(sum(durations) / len(durations), 2),
+            p50_s=round(_percentile(durations, 0.50), 2),
+            p95_s=round(_percentile(durations, 0.95), 2),
+            max_s=round(durations[-1], 2),
+        )
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls_file", help="File with one YouTube URL per line, or '-' for stdin")
+    parser.add_argument("--output-type", choices=OUTPUT_TYPES, default="summary",
+                        help="What to generate for each video")
+    parser.add_argument("--concurrency", type=int, default=2, help="Videos processed at the same time")
+    parser.add_argument("--gender", choices=["male", "female", "mixed"], default="mixed", help="Podcast voice")
+    parser.add_argument("--tts-backend", choices=[backend["name"] for backend in list_tts_backends()], default=None,
+                        help="Speech engine for podcasts; defaults to TTS_BACKEND")
+    parser.add_argument("--title-strategy", choices=["llm", "local"], default=None,
+                        help="How titles are generated; defaults to TITLE_STRATEGY")
+    parser.add_argument("--no-cache", action="store_true", help="Don't reuse cached LLM and speech results")
+    parser.add_argument("--report", help="Also write the per-item results and report to this JSON file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    urls = read_urls(args.urls_file)
+    if not urls:
+        print("No URLs to process")
+        return 0
+
+    # Compile before the clock starts so the first items don't pay for it
+    get_workflow()
+
+    print(f"Processing {len(urls)} videos ({args.output_type}) with concurrency {args.concurrency}")
+    print_lock = threading.Lock()
+    results = []
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [
+            executor.submit(process_url, url, args.output_type, args.gender, args.tts_backend,
+                            not args.no_cache, args.title_strategy)
+            for url in urls
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            with print_lock:
+                if result["ok"]:
+                    print(f"OK    {result['seconds']:7.1f}s  {result['url']} -> {result['output']}")
+                else:
+                    print(f"FAIL  {result['seconds']:7.1f}s  {result['url']}: {result['error']}")
+    elapsed = time.perf_counter() - start
+
+    report = summarize(results, elapsed)
+    print(
+        f"\n{report['succeeded']}/{report['items']} succeeded in {report['elapsed_s']}s "
+        f"({report['items_per_min']} videos/min)"
+    )
+    if "p50_s" in report:
+        print(f"per video: mean {report['mean_s']}s, p50 {report['p50_s']}s, "
+              f"p95 {report['p95_s']}s, max {report['max_s']}s")
+
+    if args.report:
+        order = {url: index for index, url in enumerate(urls)}
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"report": report, "results": sorted(results, key=lambda r: order[r["url"]])}, f, indent=2)
+
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,30 @@ ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY", "")
 
 # LLM Settings
 DEFAULT_LLM_MODEL = "gpt-4o"
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))  # Shared keep-alive pool size
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "120"))  # Seconds
+
+# Ask for the body and its title in one JSON completion instead of two calls;
+# falls back to two calls when the JSON doesn't parse
+STRUCTURED_OUTPUT_ENABLED = os.getenv("STRUCTURED_OUTPUT_ENABLED", "true").lower() == "true"
+
+# How titles are generated: "llm" (a gpt-3.5-turbo call) or "local" (keyphrase
+# extraction, no API call). The local engine is also the fallback if the LLM fails.
+TITLE_STRATEGY = os.getenv("TITLE_STRATEGY", "llm").lower()
+
+# Summaries of transcripts longer than this many tokens are built map-reduce style:
+# chunks are summarized concurrently, then merged in a final call
+SUMMARY_MAP_REDUCE_THRESHOLD = int(os.getenv("SUMMARY_MAP_REDUCE_THRESHOLD", "6000"))
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "3000"))
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4"))
+
+# Tracing: spans around workflow nodes and the external calls they make.
+# "memory" keeps recent spans for /api/traces, "json" also appends them to
+# TRACE_FILE as OTLP JSON lines, "none" turns tracing off
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "memory").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", os.path.join(os.getcwd(), "traces.jsonl"))
+TRACE_MEMORY_SPANS = int(os.getenv("TRACE_MEMORY_SPANS", "2000"))  # Spans kept by the in-memory exporter
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "videotranscript-pro")
 
 # Debug Settings
 DEBUG_LANGGRAPH = False
@@ -24,11 +48,81 @@ DEBUG_LANGGRAPH_PORT = 8000
 DEFAULT_OUTPUT_DIR = os.path.join(os.getcwd(), "output")
 DEFAULT_OUTPUT_FILENAME = "YT_podcast.mp3"
 
+# Cache Settings
+DEFAULT_CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.getcwd(), "cache"))
+TRANSCRIPT_CACHE_ENABLED = os.getenv("TRANSCRIPT_CACHE_ENABLED", "true").lower() == "true"
+TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 256 MB
+
+# LLM response cache (keyed by model, temperature, prompt version and input)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(30 * 24 * 3600)))  # 30 days
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 64 MB
+
+# Synthesized speech segments (keyed by text, voice and language)
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+TTS_CACHE_TTL = int(os.getenv("TTS_CACHE_TTL", str(30 * 24 * 3600)))  # 30 days
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))  # 512 MB
+
+# Stage checkpoints: a failed podcast run retried with the same transcript
+# resumes after the last completed stage instead of regenerating it
+CHECKPOINTS_ENABLED = os.getenv("CHECKPOINTS_ENABLED", "true").lower() == "true"
+CHECKPOINT_TTL = int(os.getenv("CHECKPOINT_TTL", str(24 * 3600)))  # 24 hours
+
+# Server-side transcript handles used by the generate endpoints
+TRANSCRIPT_STORE_MAX_MEMORY_BYTES = int(os.getenv("TRANSCRIPT_STORE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024)))  # 64 MB
+TRANSCRIPT_STORE_TTL = int(os.getenv("TRANSCRIPT_STORE_TTL", str(24 * 3600)))  # 24 hours
+
+# Background job settings
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # Worker threads running generation jobs
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", str(7 * 24 * 3600)))  # Finished jobs kept 7 days; 0 keeps them forever
+
 # Audio settings
 DEFAULT_SPEECH_MODEL = "tts-1"  # OpenAI TTS model
+TTS_WORKERS = int(os.getenv("TTS_WORKERS", "4"))  # Segments synthesized in parallel
+TTS_SEGMENT_MAX_CHARS = int(os.getenv("TTS_SEGMENT_MAX_CHARS", "300"))  # Longest text sent in one TTS call
+TTS_SEGMENT_RETRIES = int(os.getenv("TTS_SEGMENT_RETRIES", "3"))  # Attempts per segment before giving up
+# Overlap conversation generation and speech synthesis: each finished turn from
+# the streaming LLM goes straight to TTS
+PODCAST_PIPELINE_ENABLED = os.getenv("PODCAST_PIPELINE_ENABLED", "true").lower() == "true"
+# Seconds a request for podcast audio that another request is rendering
+# waits for it before answering 503 with Retry-After
+PODCAST_AUDIO_WAIT = float(os.getenv("PODCAST_AUDIO_WAIT", "10"))
+
+# Speech engine: "gtts" (Google Translate, default), "elevenlabs" (needs
+# ELEVENLABS_API_KEY) or "espeak" (local espeak-ng, no network)
+TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts").lower()
+ELEVENLABS_MODEL = os.getenv("ELEVENLABS_MODEL", "eleven_multilingual_v2")
+ELEVENLABS_VOICE_MALE = os.getenv("ELEVENLABS_VOICE_MALE", "pNInz6obpgDQGcFmaJgB")  # Adam
+ELEVENLABS_VOICE_FEMALE = os.getenv("ELEVENLABS_VOICE_FEMALE", "21m00Tcm4TlvykEJ4GkT")  # Rachel
+ELEVENLABS_VOICE_MALE_ALT = os.getenv("ELEVENLABS_VOICE_MALE_ALT", "ErXwobaYiN019PkySvjV")  # Antoni
+ELEVENLABS_VOICE_FEMALE_ALT = os.getenv("ELEVENLABS_VOICE_FEMALE_ALT", "AZnzlk1XvdvUeBnXmlld")  # Domi
+ELEVENLABS_MAX_CONCURRENCY = int(os.getenv("ELEVENLABS_MAX_CONCURRENCY", "2"))  # Concurrent requests allowed by the plan
+ELEVENLABS_SEGMENT_MAX_CHARS = int(os.getenv("ELEVENLABS_SEGMENT_MAX_CHARS", "1000"))
+ESPEAK_BINARY = os.getenv("ESPEAK_BINARY", "espeak-ng")
+ESPEAK_WORDS_PER_MINUTE = int(os.getenv("ESPEAK_WORDS_PER_MINUTE", "165"))
+# Give each podcast host their own voice instead of announcing speakers
+# ("Host1 says, ...") in a single voice
+PODCAST_MULTI_VOICE = os.getenv("PODCAST_MULTI_VOICE", "true").lower() == "true"
 
 # Create output directory if it doesn't exist
 os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
 
 # Default language for text-to-speech
 DEFAULT_LANGUAGE_CODE = "en"
+
+# Bulk extraction settings
+# Number of concurrent transcript fetches per bulk request, by plan;
+# override with e.g. BULK_EXTRACT_WORKERS_PRO=12
+BULK_EXTRACT_WORKERS = {
+    plan: int(os.getenv(f"BULK_EXTRACT_WORKERS_{plan.upper()}", str(workers)))
+    for plan, workers in {
+        "anonymous": 2,
+        "free": 2,
+        "plus": 4,
+        "pro": 8,
+        "enterprise": 16,
+    }.items()
+}
+# Seconds to wait for a single video before reporting it as timed out
+BULK_EXTRACT_TIMEOUT = float(os.getenv("BULK_EXTRACT_TIMEOUT", "30"))
@@ -0,0 +1,166 @@
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Union
+
+from ..utils.text_normalizer import normalize_speaker
+
+# Typical conversational speaking rate, used to estimate turn durations
+SPEAKING_WORDS_PER_MINUTE = 150
+
+
+class Turn(NamedTuple):
+    """One speaker turn of a podcast conversation."""
+
+    speaker: str     # Normalized label, e.g. 'Host1'
+    text: str        # What the speaker says
+    start: int       # Offset of the text in the "HostN: text" script
+    end: int         # Offset just past the text
+    duration: float  # Estimated speaking time in seconds
+
+
+def estimate_duration(text: str) -> float:
+    """Estimate how long text takes to say, in seconds."""
+    words = text.count(" ") + 1 if text else 0
+    return words * 60.0 / SPEAKING_WORDS_PER_MINUTE
+
+
+def iter_turns(lines: Iterable[str]) -> Iterator[Turn]:
+    """
+    Parse conversation lines into turns as the lines arrive.
+
+    Speaker labels are normalized to Host1/Host2 where they name a host,
+    and lines without a label are assigned to alternating hosts.
+
+    Args:
+        lines: Raw conversation lines, e.g. streamed from the LLM
+
+    Yields:
+        Turns, with offsets into the script the turns serialize to
+    """
+    current_speaker = None
+    position = 0
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Check if line starts with a speaker indicator
+        if ':' in line:
+            label, text = line.split(':', 1)
+            label = label.strip()
+            text = text.strip()
+            speaker = normalize_speaker(label) or label
+        else:
+            # For lines without speaker prefixes, assign to alternating speakers
+            speaker = "Host1" if current_speaker is None or current_speaker == "Host2" else "Host2"
+            text = line
+        current_speaker = speaker
+
+        start = position + len(speaker) + 2
+        end = start + len(text)
+        yield Turn(speaker, text, start, end, estimate_duration(text))
+        position = end + 1
+
+
+class Conversation:
+    """
+    Podcast conversation parsed once into speaker turns.
+
+    Agents, TTS and title generation work on the turns; the "HostN: text"
+    script is only built when something asks for the text, and then once.
+    """
+
+    __slots__ = ("_turns", "_text")
+
+    def __init__(self, turns: Iterable[Turn]):
+        """
+        Args:
+            turns: Turns in speaking order, with consistent script offsets
+        """
+        self._turns = tuple(turns)
+        self._text = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "Conversation":
+        """Parse an LLM conversation or a "HostN: text" script."""
+        return cls(iter_turns(text.strip().split('\n')))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Conversation":
+        """Rebuild a conversation stored with to_dict()."""
+        return cls(iter_turns(f"{speaker}: {text}" for speaker, text in data["turns"]))
+
+    @classmethod
+    def coerce(cls, value: Union["Conversation", str, Dict, None]) -> "Conversation":
+        """Accept a conversation, a script string or a to_dict() payload."""
+        if isinstance(value, Conversation):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls.from_text(value or "")
+
+    def to_dict(self) -> Dict:
+        """Compact JSON-ready form: [speaker, text] pairs."""
+        return {"turns": [[turn.speaker, turn.text] for turn in self._turns]}
+
+    @property
+    def turns(self) -> tuple:
+        return self._turns
+
+    @property
+    def text(self) -> str:
+        """The "HostN: text" script, built on first access."""
+        if self._text is None:
+            self._text = '\n'.join(f"{turn.speaker}: {turn.text}" for turn in self._turns)
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        """Length of the script in characters, matching len() of the old string."""
+        return self._turns[-1].end - self._turns[0].start + len(self._turns[0].speaker) + 2 if self._turns else 0
+
+    def __bool__(self) -> bool:
+        return bool(self._turns)
+
+    def __iter__(self) -> Iterator[Turn]:
+        return iter(self._turns)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Conversation):
+            return self._turns == other._turns
+        return NotImplemented
+
+    __hash__ = None
+
+    @property
+    def duration(self) -> float:
+        """Estimated speaking time of the whole conversation in seconds."""
+        return sum(turn.duration for turn in self._turns)
+
+    def speakers(self) -> List[str]:
+        """Speakers in order of first appearance."""
+        return list(dict.fromkeys(turn.speaker for turn in self._turns))
+
+    def prefix(self, max_chars: int) -> str:
+        """
+        First max_chars characters of the script, without building all of it.
+
+        Args:
+            max_chars: Characters to return
+
+        Returns:
+            The same string as text[:max_chars]
+        """
+        if self._text is not None:
+            return self._text[:max_chars]
+
+        lines = []
+        length = 0
+        for turn in self._turns:
+            line = f"{turn.speaker}: {turn.text}"
+            lines.append(line)
+            length += len(line) + 1
+            if length >= max_chars:
+                break
+        return '\n'.join(lines)[:max_chars]
@@ -1,4 +1,6 @@
-from typing import TypedDict, Optional
+from typing import TypedDict, Optional, Union
+
+from .conversation import Conversation
 
 class AgentState(TypedDict):
     """State model for the YouTube podcast generator workflow"""
@@ -7,11 +9,13 @@ class AgentState(TypedDict):
     summary: str
     summary_title: Optional[str]
     summary_filename: Optional[str]
-    conversation: str
+    conversation: Union[str, Conversation]  # Parsed into turns once created
     podcast_title: Optional[str]
     audio_path: str
-    output_type: str
+    output_type: str  # 'summary', 'podcast' or 'both'
     gender: Optional[str]  # 'male' or 'female' for podcast voice
+    tts_backend: Optional[str]  # 'gtts', 'elevenlabs' or 'espeak'; None for TTS_BACKEND
+    checkpoint_id: Optional[str]  # Key the stages of this run are checkpointed under
     
     # For tracking progress through the workflow
     status: str
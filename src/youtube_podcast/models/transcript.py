@@ -0,0 +1,158 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Transcript:
+    """
+    Compact, timestamped transcript.
+
+    Segment timings are kept in parallel float arrays and the text of all
+    segments lives in one space-joined buffer, with an offsets array marking
+    where each segment starts. Slicing by time or character range returns a
+    view that shares those arrays and the buffer; text is only copied when a
+    view's `.text` is first read.
+    """
+
+    __slots__ = ("_starts", "_durations", "_buffer", "_offsets", "_lo", "_hi", "_char_lo", "_char_hi", "_text")
+
+    def __init__(
+        self,
+        starts: array,
+        durations: array,
+        buffer: str,
+        offsets: array,
+        lo: int = 0,
+        hi: Optional[int] = None,
+        char_lo: int = 0,
+        char_hi: Optional[int] = None,
+    ):
+        """
+        Args:
+            starts: Segment start times in seconds
+            durations: Segment durations in seconds
+            buffer: Text of all segments joined by single spaces
+            offsets: Start offset of each segment in buffer, plus len(buffer) + 1
+            lo, hi: Range of segments covered by this view
+            char_lo, char_hi: Range of buffer characters covered by this view
+        """
+        self._starts = starts
+        self._durations = durations
+        self._buffer = buffer
+        self._offsets = offsets
+        self._lo = lo
+        self._hi = len(starts) if hi is None else hi
+        self._char_lo = char_lo
+        self._char_hi = len(buffer) if char_hi is None else char_hi
+        self._text = None
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Dict]) -> "Transcript":
+        """Build a transcript from segments with 'text', 'start' and 'duration' keys."""
+        starts = array("d")
+        durations = array("d")
+        offsets = array("q")
+        texts = []
+        position = 0
+        for entry in segments:
+            starts.append(float(entry.get("start", 0.0)))
+            durations.append(float(entry.get("duration", 0.0)))
+            offsets.append(position)
+            texts.append(entry["text"])
+            position += len(entry["text"]) + 1
+        offsets.append(position)
+        return cls(starts, durations, " ".join(texts), offsets)
+
+    def _view(self, lo: int, hi: int, char_lo: int, char_hi: int) -> "Transcript":
+        return Transcript(self._starts, self._durations, self._buffer, self._offsets, lo, hi, char_lo, char_hi)
+
+    @property
+    def text(self) -> str:
+        """Plain transcript text, materialized on first access."""
+        if self._text is None:
+            if self._char_lo == 0 and self._char_hi == len(self._buffer):
+                self._text = self._buffer
+            else:
+                self._text = self._buffer[self._char_lo:self._char_hi]
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        """Length of the text in characters, matching len() of the old joined string."""
+        return self._char_hi - self._char_lo
+
+    def __bool__(self) -> bool:
+        return self._char_hi > self._char_lo
+
+    @property
+    def segment_count(self) -> int:
+        return self._hi - self._lo
+
+    @property
+    def start_time(self) -> float:
+        """Start of the first segment in seconds."""
+        return self._starts[self._lo] if self.segment_count else 0.0
+
+    @property
+    def end_time(self) -> float:
+        """End of the last segment in seconds."""
+        if not self.segment_count:
+            return 0.0
+        return self._starts[self._hi - 1] + self._durations[self._hi - 1]
+
+    def segments(self) -> Iterator[Tuple[float, float, str]]:
+        """Yield (start, duration, text) for each segment in the view."""
+        for i in range(self._lo, self._hi):
+            begin = max(self._offsets[i], self._char_lo)
+            end = min(self._offsets[i + 1] - 1, self._char_hi)
+            yield self._starts[i], self._durations[i], self._buffer[begin:end]
+
+    def to_segments(self) -> List[Dict]:
+        """Return the view as a list of segment dictionaries."""
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for start, duration, text in self.segments()
+        ]
+
+    def slice_time(self, start: Optional[float] = None, end: Optional[float] = None) -> "Transcript":
+        """
+        Return a view of the segments that overlap [start, end) seconds.
+
+        Args:
+            start: Window start in seconds (defaults to the beginning)
+            end: Window end in seconds (defaults to the end)
+        """
+        lo, hi = self._lo, self._hi
+        if start is not None:
+            lo = max(bisect_right(self._starts, start, self._lo, self._hi) - 1, self._lo)
+            if lo < hi and self._starts[lo] + self._durations[lo] <= start:
+                lo += 1
+        if end is not None:
+            hi = max(bisect_left(self._starts, end, lo, self._hi), lo)
+
+        if lo >= hi:
+            return self._view(lo, lo, self._char_lo, self._char_lo)
+
+        char_lo = max(self._offsets[lo], self._char_lo)
+        char_hi = min(self._offsets[hi] - 1, self._char_hi)
+        return self._view(lo, hi, char_lo, char_hi)
+
+    def slice_chars(self, start: int = 0, end: Optional[int] = None) -> "Transcript":
+        """
+        Return a view of characters [start, end) of this view's text.
+
+        Segment boundaries are kept, so timings of the view cover every
+        segment the character range touches.
+        """
+        length = len(self)
+        end = length if end is None else end
+        start = min(max(start, 0), length)
+        end = min(max(end, start), length)
+
+        char_lo = self._char_lo + start
+        char_hi = self._char_lo + end
+        lo = max(bisect_right(self._offsets, char_lo, self._lo, self._hi) - 1, self._lo)
+        hi = max(bisect_left(self._offsets, char_hi, lo, self._hi), lo + (char_hi > char_lo))
+        return self._view(lo, min(hi, self._hi), char_lo, char_hi)
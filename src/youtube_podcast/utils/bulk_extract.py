@@ -2,12 +2,18 @@
 Bulk extraction utilities for YouTube transcripts.
 Supports playlists, channels, and CSV imports.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from youtube_transcript_api import YouTubeTranscriptApi
 import re
 import csv
 import io
+import time
 from .youtube_utils import extract_video_id, fetch_transcript
+from ..config.settings import BULK_EXTRACT_WORKERS, BULK_EXTRACT_TIMEOUT
+
+# How often the engine wakes up to check running fetches against their timeout
+_POLL_INTERVAL = 0.25
 
 
 def extract_playlist_id(url: str) -> Optional[str]:
@@ -65,37 +71,142 @@ def extract_channel_id(url: str) -> Optional[str]:
     return None
 
 
-def bulk_extract_transcripts(urls: List[str]) -> List[Dict[str, any]]:
+def get_bulk_workers(plan: Optional[str] = None) -> int:
+    """
+    Get the number of concurrent transcript fetches allowed for a plan.
+    
+    Args:
+        plan: User plan name, or None for anonymous requests
+        
+    Returns:
+        Worker count for the bulk extraction pool
+    """
+    return BULK_EXTRACT_WORKERS.get(plan or "anonymous", BULK_EXTRACT_WORKERS["free"])
+
+
+def _extract_one(url: str, video_id: str, fetcher: Callable[[str], Optional[str]]) -> Dict[str, any]:
+    """Fetch a single transcript and wrap it in a bulk result dictionary."""
+    try:
+        transcript = fetcher(url)
+        
+        return {
+            'url': url,
+            'video_id': video_id,
+            'transcript': transcript,
+            'success': transcript is not None,
+            'error': None if transcript else 'Failed to fetch transcript'
+        }
+    except Exception as e:
+        return _error_result(url, video_id, str(e))
+
+
+def _error_result(url: str, video_id: Optional[str], error: str) -> Dict[str, any]:
+    """Build the result reported for a video that could not be fetched."""
+    return {
+        'url': url,
+        'video_id': video_id,
+        'transcript': None,
+        'success': False,
+        'error': error
+    }
+
+
+def iter_bulk_extract_transcripts(
+    urls: List[str],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fetcher: Optional[Callable[[str], Optional[str]]] = None
+) -> Iterator[Tuple[int, Dict[str, any]]]:
+    """
+    Extract transcripts on a bounded worker pool, yielding each as it finishes.
+    
+    URLs are deduplicated by video ID before any network work starts, so a
+    video listed several times is fetched once and its result is reported
+    for every position it appears in.
+    
+    Yields (index, result) pairs in completion order. A video whose fetch
+    has been running longer than `timeout` seconds is reported as failed;
+    its worker thread is abandoned rather than interrupted.
+    
+    Args:
+        urls: List of YouTube video URLs
+        max_workers: Number of concurrent fetches (defaults to the anonymous plan limit)
+        timeout: Seconds allowed per video (defaults to BULK_EXTRACT_TIMEOUT)
+        fetcher: Function mapping a URL to transcript text (defaults to fetch_transcript)
+        
+    Yields:
+        (index, result) pairs, where index is the URL's position in `urls`
+    """
+    max_workers = max_workers or get_bulk_workers()
+    timeout = timeout or BULK_EXTRACT_TIMEOUT
+    fetcher = fetcher or fetch_transcript
+    
+    groups: Dict[str, List[int]] = {}
+    for index, url in enumerate(urls):
+        try:
+            video_id = extract_video_id(url).strip()
+        except Exception as e:
+            yield index, _error_result(url, None, str(e))
+            continue
+        groups.setdefault(video_id, []).append(index)
+    
+    def fan_out(video_id: str, result: Dict[str, any]) -> Iterator[Tuple[int, Dict[str, any]]]:
+        for index in groups[video_id]:
+            yield index, {**result, 'url': urls[index]}
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="bulk-extract")
+    started: Dict[str, float] = {}
+    
+    def run(video_id: str, url: str) -> Dict[str, any]:
+        started[video_id] = time.monotonic()
+        return _extract_one(url, video_id, fetcher)
+    
+    pending = {
+        executor.submit(run, video_id, urls[indexes[0]]): video_id
+        for video_id, indexes in groups.items()
+    }
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=min(_POLL_INTERVAL, timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                video_id = pending.pop(future)
+                yield from fan_out(video_id, future.result())
+            
+            now = time.monotonic()
+            for future, video_id in list(pending.items()):
+                begun = started.get(video_id)
+                if begun is not None and now - begun > timeout:
+                    del pending[future]
+                    error = f'Timed out after {timeout:g} seconds'
+                    yield from fan_out(video_id, _error_result(None, video_id, error))
+    finally:
+        # Don't block the caller on fetches that already timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def bulk_extract_transcripts(
+    urls: List[str],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fetcher: Optional[Callable[[str], Optional[str]]] = None
+) -> List[Dict[str, any]]:
     """
     Extract transcripts from multiple YouTube video URLs.
     
+    Collects iter_bulk_extract_transcripts into a list in the same order as `urls`.
+    
     Args:
         urls: List of YouTube video URLs
+        max_workers: Number of concurrent fetches (defaults to the anonymous plan limit)
+        timeout: Seconds allowed per video (defaults to BULK_EXTRACT_TIMEOUT)
+        fetcher: Function mapping a URL to transcript text (defaults to fetch_transcript)
         
     Returns:
         List of dictionaries with 'url', 'video_id', 'transcript', 'success', 'error'
     """
-    results = []
-    for url in urls:
-        try:
-            video_id = extract_video_id(url)
-            transcript = fetch_transcript(url)
-            
-            results.append({
-                'url': url,
-                'video_id': video_id,
-                'transcript': transcript,
-                'success': transcript is not None,
-                'error': None if transcript else 'Failed to fetch transcript'
-            })
-        except Exception as e:
-            results.append({
-                'url': url,
-                'video_id': None,
-                'transcript': None,
-                'success': False,
-                'error': str(e)
-            })
+    results = [None] * len(urls)
+    for index, result in iter_bulk_extract_transcripts(urls, max_workers, timeout, fetcher):
+        results[index] = result
     
     return results
 
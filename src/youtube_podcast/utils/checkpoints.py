@@ -0,0 +1,191 @@
+"""
+Stage checkpoints for VideoTranscript Pro.
+
+Saves the workflow state after each expensive stage in a local SQLite
+file, keyed by a job or content ID, so that a failed run retried with the
+same ID resumes at the stage that failed instead of repaying for the LLM
+calls before it.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config.settings import CHECKPOINTS_ENABLED, CHECKPOINT_TTL, DEFAULT_CACHE_DIR
+from ..models.conversation import Conversation
+
+logger = logging.getLogger(__name__)
+
+# State keys worth keeping; everything else is per-request input or derived
+_CHECKPOINT_FIELDS = (
+    "url",
+    "transcript",
+    "summary",
+    "summary_title",
+    "summary_filename",
+    "conversation",
+    "podcast_title",
+    "audio_path",
+    "status",
+)
+
+
+class CheckpointStore:
+    """A thread-safe SQLite table holding the latest checkpoint for each ID."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds a checkpoint stays resumable, or None to keep it until cleared
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS checkpoints (
+                checkpoint_id TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                state TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def save(self, checkpoint_id: str, stage: str, state: str) -> None:
+        """Replace the checkpoint for an ID with a later stage."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (checkpoint_id, stage, state, updated_at) VALUES (?, ?, ?, ?)",
+                (checkpoint_id, stage, state, time.time())
+            )
+            if self.ttl:
+                self._conn.execute("DELETE FROM checkpoints WHERE updated_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+
+    def load(self, checkpoint_id: str) -> Optional[str]:
+        """Return the saved state for an ID, or None if there is none or it expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, updated_at FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,)
+            ).fetchone()
+        if row is None or (self.ttl and time.time() - row[1] > self.ttl):
+            return None
+        return row[0]
+
+    def delete(self, checkpoint_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,))
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Return the number of checkpoints held at each stage."""
+        with self._lock:
+            rows = self._conn.execute("SELECT stage, COUNT(*) FROM checkpoints GROUP BY stage").fetchall()
+        return {'stages': dict(rows), 'checkpoints': sum(count for _, count in rows)}
+
+
+_store: Optional[CheckpointStore] = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Get the process-wide checkpoint store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CheckpointStore(os.path.join(DEFAULT_CACHE_DIR, "checkpoints.sqlite3"), ttl=CHECKPOINT_TTL)
+    return _store
+
+
+def content_checkpoint_id(kind: str, *inputs) -> str:
+    """
+    Build a checkpoint ID from what a run produces and the inputs it depends on.
+
+    Args:
+        kind: Output being produced, e.g. 'podcast'
+        *inputs: Values that change the result, e.g. the transcript and title strategy
+
+    Returns:
+        An ID that is the same for every retry of the same request
+    """
+    digest = hashlib.sha256(json.dumps([kind, *inputs], default=str).encode("utf-8")).hexdigest()
+    return f"{kind}:{digest}"
+
+
+def save_checkpoint(checkpoint_id: Optional[str], stage: str, state: Dict) -> None:
+    """
+    Checkpoint the state reached at a stage.
+
+    Failures are logged rather than raised: a missing checkpoint only costs
+    a retry the work it would have skipped.
+
+    Args:
+        checkpoint_id: Job or content ID; nothing is saved when None
+        stage: Stage just completed, e.g. 'conversation_created'
+        state: Workflow state
+    """
+    if not CHECKPOINTS_ENABLED or not checkpoint_id:
+        return
+
+    fields = {}
+    for key in _CHECKPOINT_FIELDS:
+        value = state.get(key)
+        if isinstance(value, Conversation):
+            value = value.to_dict()
+        if value:
+            fields[key] = value
+    fields["status"] = stage
+
+    try:
+        get_checkpoint_store().save(checkpoint_id, stage, json.dumps(fields))
+    except Exception as e:
+        logger.warning(f"Checkpoint save failed: {str(e)}")
+
+
+def load_checkpoint(checkpoint_id: Optional[str]) -> Optional[Dict]:
+    """
+    Get the state saved for an ID.
+
+    Args:
+        checkpoint_id: Job or content ID
+
+    Returns:
+        The checkpointed state fields, with 'status' set to the stage reached
+        and the conversation parsed, or None if there is no checkpoint
+    """
+    if not CHECKPOINTS_ENABLED or not checkpoint_id:
+        return None
+
+    try:
+        saved = get_checkpoint_store().load(checkpoint_id)
+    except Exception as e:
+        logger.warning(f"Checkpoint load failed: {str(e)}")
+        return None
+    if saved is None:
+        return None
+
+    fields = json.loads(saved)
+    if "conversation" in fields:
+        fields["conversation"] = Conversation.coerce(fields["conversation"])
+    return fields
+
+
+def clear_checkpoint(checkpoint_id: Optional[str]) -> None:
+    """Drop the checkpoint for an ID once its run has finished."""
+    if not CHECKPOINTS_ENABLED or not checkpoint_id:
+        return
+
+    try:
+        get_checkpoint_store().delete(checkpoint_id)
+    except Exception as e:
+        logger.warning(f"Checkpoint delete failed: {str(e)}")
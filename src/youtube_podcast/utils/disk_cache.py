@@ -0,0 +1,183 @@
+"""
+Disk-backed key/value cache for VideoTranscript Pro.
+Stores values in a local SQLite file with TTL expiry and size-bounded LRU eviction.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict
+
+# Seconds between accessed_at updates for an entry. LRU eviction only needs
+# coarse recency, and skipping the write keeps most hits from committing.
+_TOUCH_INTERVAL = 300
+
+# Seconds between recounts of the total size, which other processes
+# sharing the file also change
+_RECOUNT_INTERVAL = 300
+
+
+class DiskCache:
+    """
+    A thread-safe SQLite cache with TTL, LRU eviction and hit/miss counters.
+
+    Each entry records its size and, optionally, the time it took to compute,
+    so stats() can report how much work cache hits have saved. The total
+    size is tracked in memory, so writes don't sum the table to decide
+    whether to evict.
+    """
+
+    def __init__(self, path: str, max_bytes: int, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite database file
+            max_bytes: Total size of stored values before LRU eviction kicks in
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._saved_seconds = 0.0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                cost REAL NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_created ON entries (created_at)")
+        self._conn.commit()
+        self._size = self._total_size()
+        self._counted_at = time.time()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, cost, created_at, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            value, cost, created_at, accessed_at = row
+            if self.ttl and now - created_at > self.ttl:
+                self._delete(key)
+                self._conn.commit()
+                self._misses += 1
+                return None
+
+            if now - accessed_at > _TOUCH_INTERVAL:
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            self._hits += 1
+            self._saved_seconds += cost
+            return value
+
+    def set(self, key: str, value: bytes, cost: float = 0.0) -> None:
+        """
+        Store a value, evicting least recently used entries if over max_bytes.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            cost: Seconds it took to compute the value (reported as time saved on hits)
+        """
+        now = time.time()
+        with self._lock:
+            self._delete(key)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, cost, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, len(value), cost, now, now)
+            )
+            self._size += len(value)
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._delete(key)
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+            self._saved_seconds = 0.0
+
+    def _total_size(self) -> int:
+        """Sum the stored sizes. This scans the table, so it runs rarely."""
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _delete(self, key: str) -> None:
+        """Remove an entry and take it off the running size. Caller holds the lock."""
+        row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._size -= row[0]
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        if self.ttl:
+            cutoff = time.time() - self.ttl
+            expired, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE created_at < ?", (cutoff,)
+            ).fetchone()
+            if expired:
+                self._conn.execute("DELETE FROM entries WHERE created_at < ?", (cutoff,))
+                self._evictions += expired
+                self._size -= size
+
+        # The running total only sees this process's writes; recount before evicting
+        now = time.time()
+        if self._size <= self.max_bytes and now - self._counted_at < _RECOUNT_INTERVAL:
+            return
+        self._size = self._total_size()
+        self._counted_at = now
+        while self._size > self.max_bytes:
+            rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at LIMIT 100").fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._size <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size -= size
+                self._evictions += 1
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size of the cache."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'saved_seconds': round(self._saved_seconds, 3),
+                'entries': entries,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes,
+            }
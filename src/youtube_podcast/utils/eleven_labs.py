@@ -2,89 +2,361 @@ import os
 import time
 import random
 import re
-from gtts import gTTS
-from ..config.settings import DEFAULT_LANGUAGE_CODE
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from ..config.settings import (
+    DEFAULT_LANGUAGE_CODE,
+    PODCAST_MULTI_VOICE,
+    TTS_WORKERS,
+    TTS_SEGMENT_MAX_CHARS,
+    TTS_SEGMENT_RETRIES,
+)
+from .tts_cache import get_cached_segment, cache_segment
+from .tts_backends import TTSBackend, get_tts_backend, strip_id3
+from .text_normalizer import normalize_for_speech, add_pauses
+from .tracing import propagate, span
+from ..models.conversation import Conversation, Turn
 
-def text_to_speech(text: str, output_file: str, gender: str = "mixed") -> None:
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+def text_to_speech(
+    text: Union[str, Conversation],
+    output_file: str,
+    gender: str = "mixed",
+    backend: Optional[str] = None
+) -> None:
     """
     Convert text to speech and save as an audio file.
     
-    This function currently uses gTTS for text-to-speech conversion.
-    In the future, it could be extended to use ElevenLabs or other TTS services.
+    The script is split into segments that are synthesized in parallel and
+    joined back together in order. Each host speaks with their own voice
+    unless PODCAST_MULTI_VOICE is off. The speech engine is pluggable; see
+    tts_backends for the available backends and their audio formats.
     
     Args:
-        text: The text to convert to speech
+        text: The conversation to convert to speech, parsed or as a script
         output_file: Path where the audio file will be saved
         gender: Voice gender preference (male, female, or mixed)
+        backend: TTS backend name; defaults to TTS_BACKEND
         
     Returns:
         None. The audio file is saved to the specified output path.
     """
-    # Format the conversation text to be more suitable for TTS
-    # Clean and process the text for more natural speech
-    lines = text.split('\n')
-    processed_lines = []
-    current_speaker = None
-    last_speaker = None
-    
-    for line in lines:
-        if not line.strip():
-            continue
-            
-        if ':' in line:
-            # Extract the speaker and content
-            parts = line.split(':', 1)
-            speaker = parts[0].strip()
-            content = parts[1].strip() if len(parts) > 1 else ""
-            
-            # Clean the content - remove asterisks, excessive punctuation
-            content = clean_text_for_speech(content)
-            
-            # Add natural transitions between speakers
-            if last_speaker and speaker != last_speaker:
-                processed_lines.append("<break time='1s'/>")
-            
-            # Format with conversational introduction
-            if speaker != current_speaker:
-                # Only add speaker introduction when the speaker changes
-                if gender == "male":
-                    voice_intro = f"{speaker} says, "
-                elif gender == "female":
-                    voice_intro = f"Then {speaker} responds, "
-                else:
-                    voice_intro = f"{speaker} says, "
-                processed_lines.append(voice_intro + content)
-                current_speaker = speaker
-            else:
-                # Continue with the same speaker
-                processed_lines.append(content)
-            
-            last_speaker = speaker
-        else:
-            # Lines without a speaker
-            processed_lines.append(clean_text_for_speech(line))
+    tts = get_tts_backend(backend)
+    conversation = Conversation.coerce(text)
     
-    # Join the processed lines with natural pauses
-    processed_text = " ".join(processed_lines)
-    
-    # Add SSML tags for more natural speech if needed
-    processed_text = add_speech_enhancements(processed_text)
-    
-    # Create and save the audio file using gTTS
+    # Create and save the audio file
     try:
-        tts = gTTS(text=processed_text, lang=DEFAULT_LANGUAGE_CODE, slow=False)
-        tts.save(output_file)
+        tmp_file = f"{output_file}.part"
+        with span("tts.render", backend=tts.name, turns=len(conversation.turns)):
+            with open(tmp_file, "wb") as f:
+                for audio in render_speech(conversation, gender, tts):
+                    f.write(audio)
+            tts.finalize(tmp_file)
+        os.replace(tmp_file, output_file)
         
         # Verify the file was created
         if not os.path.exists(output_file):
             raise FileNotFoundError(f"Failed to create audio file at {output_file}")
-            
-        # Small delay to ensure file is written completely
-        time.sleep(0.5)
         
     except Exception as e:
         raise Exception(f"TTS generation failed: {str(e)}")
 
+def _iter_announced_segments(
+    turns: Iterable[Tuple[Optional[str], str]],
+    gender: str = "mixed",
+    max_chars: Optional[int] = None
+) -> Iterator[str]:
+    """Segments for a single voice reading the script, announcing speaker changes."""
+    max_chars = max_chars or TTS_SEGMENT_MAX_CHARS
+    
+    # Clean and process the text for more natural speech
+    current_speaker = None
+    
+    for speaker, content in turns:
+        # Clean the content - remove asterisks, excessive punctuation
+        content = clean_text_for_speech(content)
+        
+        if speaker is not None and speaker != current_speaker:
+            # Only add speaker introduction when the speaker changes
+            if gender == "female":
+                voice_intro = f"Then {speaker} responds, "
+            else:
+                voice_intro = f"{speaker} says, "
+            turn = voice_intro + content
+            current_speaker = speaker
+        else:
+            # Continue with the same speaker, or a line without one
+            turn = content
+        
+        # Add SSML tags for more natural speech if needed
+        yield from _pack_sentences(add_speech_enhancements(turn).strip(), max_chars)
+
+def iter_turn_segments(
+    turns: Iterable[Tuple[str, str]],
+    max_chars: Optional[int] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Turn parsed speaker turns into speech-ready segments tagged with their speaker.
+    
+    Args:
+        turns: (speaker, text) pairs or Turn records, e.g. a Conversation
+        max_chars: Longest segment; defaults to TTS_SEGMENT_MAX_CHARS
+        
+    Yields:
+        (speaker, segment) pairs in speaking order
+    """
+    max_chars = max_chars or TTS_SEGMENT_MAX_CHARS
+    
+    for turn in turns:
+        speaker, text = turn[0], turn[1]
+        text = add_speech_enhancements(clean_text_for_speech(text)).strip()
+        for segment in _pack_sentences(text, max_chars):
+            yield speaker, segment
+
+def _pack_sentences(turn: str, max_chars: int) -> Iterator[str]:
+    """Split a turn at sentence boundaries into segments of at most max_chars characters."""
+    if not turn:
+        return
+    
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(turn):
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            yield current
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        yield current
+
+def _synthesize_with_retries(
+    synthesize: Callable[[str], bytes],
+    text: str,
+    retries: int,
+    retry_delay: float = 1.0
+) -> bytes:
+    """Synthesize a segment, retrying just this segment with backoff on failure."""
+    for attempt in range(retries):
+        try:
+            audio = synthesize(text)
+            if not audio:
+                raise ValueError("TTS returned no audio")
+            return audio
+        except Exception as e:
+            if attempt == retries - 1:
+                raise Exception(f"Segment failed after {retries} attempts: {str(e)}")
+            sleep_time = retry_delay * (2 ** attempt) + random.uniform(0, 0.5)
+            print(f"TTS segment failed (attempt {attempt+1}/{retries}): {str(e)}. Retrying in {sleep_time:.1f} seconds...")
+            time.sleep(sleep_time)
+
+def _synthesize_cached(
+    synthesize: Callable[[str], bytes],
+    text: str,
+    retries: int,
+    voice: Optional[str],
+    lang: str
+) -> bytes:
+    """Serve a segment from the TTS cache, synthesizing and caching it on a miss."""
+    with span("tts.segment", "client", voice=voice or "", chars=len(text)) as current:
+        if voice is None:
+            return _synthesize_with_retries(synthesize, text, retries)
+        
+        audio = get_cached_segment(text, voice, lang)
+        current.set_attribute("cache_hit", audio is not None)
+        if audio is not None:
+            return audio
+        
+        start = time.perf_counter()
+        audio = _synthesize_with_retries(synthesize, text, retries)
+        cache_segment(text, voice, lang, audio, cost=time.perf_counter() - start)
+        return audio
+
+def iter_synthesized_segments(
+    segments: Iterable[str],
+    synthesize: Optional[Callable[[str], bytes]] = None,
+    max_workers: Optional[int] = None,
+    retries: Optional[int] = None,
+    voice: Optional[str] = None,
+    lang: str = DEFAULT_LANGUAGE_CODE,
+    backend: Optional[TTSBackend] = None
+) -> Iterator[bytes]:
+    """
+    Synthesize segments in parallel and yield their audio in order.
+    
+    Up to max_workers segments are synthesized at once. Each segment's audio
+    is yielded as soon as it and every segment before it are done, so the
+    result can be written or streamed while later segments are still being
+    synthesized. A failing segment is retried on its own. Segments already
+    synthesized with the same voice and language come from the TTS cache.
+    
+    `segments` may be a lazy iterator, such as one fed by a streaming LLM;
+    it is consumed on a separate thread and each segment is queued for
+    synthesis as soon as it is produced.
+    
+    Args:
+        segments: Segment texts in speaking order
+        synthesize: Function turning text into MP3 bytes; overrides the
+            backend's engine, e.g. for benchmarks
+        max_workers: Parallel synthesis calls; defaults to the backend's hint,
+            or TTS_WORKERS with a custom `synthesize`
+        retries: Attempts per segment; defaults to TTS_SEGMENT_RETRIES
+        voice: Backend voice to speak with. With a custom `synthesize`, the
+            cache identifier for its voice instead; None disables caching.
+        lang: Language code
+        backend: TTS backend; defaults to TTS_BACKEND
+        
+    Yields:
+        Audio bytes for each segment, in order, ready to be concatenated
+    """
+    if synthesize is None:
+        backend = backend or get_tts_backend()
+        speaker_voice = voice
+        synthesize = lambda text: backend.synthesize(text, lang, speaker_voice)
+        voice = backend.cache_voice(speaker_voice)
+        max_workers = max_workers or backend.max_workers
+    frame = backend.frame if backend is not None else (lambda audio, first: audio if first else strip_id3(audio))
+    max_workers = max(1, max_workers or TTS_WORKERS)
+    retries = max(1, retries or TTS_SEGMENT_RETRIES)
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts")
+    
+    # Segment spans nest under the caller's span, not the worker thread's
+    synthesize_segment = propagate(_synthesize_cached)
+    
+    def submit(segment: str) -> Future:
+        return executor.submit(synthesize_segment, synthesize, segment, retries, voice, lang)
+    
+    yield from _iter_in_order(segments, submit, [executor], frame)
+
+def iter_multi_voice_segments(
+    segments: Iterable[Tuple[str, str]],
+    voices: List[Optional[str]],
+    backend: Optional[TTSBackend] = None,
+    max_workers: Optional[int] = None,
+    retries: Optional[int] = None,
+    lang: str = DEFAULT_LANGUAGE_CODE
+) -> Iterator[bytes]:
+    """
+    Synthesize speaker-tagged segments, each host in their own voice.
+    
+    Segments are batched per voice: every voice has its own pool of
+    workers, so both hosts' turns are synthesized concurrently, and the
+    audio is interleaved back in speaking order as it completes. Caching,
+    retries and lazy input work as in iter_synthesized_segments.
+    
+    Args:
+        segments: (speaker, text) pairs from iter_turn_segments
+        voices: Backend voices for Host1 and Host2; other speakers use the first
+        backend: TTS backend; defaults to TTS_BACKEND
+        max_workers: Parallel synthesis calls across all voices; defaults
+            to the backend's hint
+        retries: Attempts per segment; defaults to TTS_SEGMENT_RETRIES
+        lang: Language code
+        
+    Yields:
+        Audio bytes for each segment, in order, ready to be concatenated
+    """
+    backend = backend or get_tts_backend()
+    voices = voices or [None]
+    max_workers = max(1, max_workers or backend.max_workers)
+    retries = max(1, retries or TTS_SEGMENT_RETRIES)
+    
+    # Split the worker budget between the voices
+    distinct_voices = list(dict.fromkeys(voices))
+    lane_workers = max(1, max_workers // len(distinct_voices))
+    lanes: Dict[Optional[str], ThreadPoolExecutor] = {
+        voice: ThreadPoolExecutor(max_workers=lane_workers, thread_name_prefix=f"tts-voice{i}")
+        for i, voice in enumerate(distinct_voices)
+    }
+    synthesize_segment = propagate(_synthesize_cached)
+
+    def submit(segment: Tuple[str, str]) -> Future:
+        speaker, text = segment
+        voice = voices[_HOST_INDEX.get(speaker, 0) % len(voices)]
+        synthesize = lambda text: backend.synthesize(text, lang, voice)
+        return lanes[voice].submit(synthesize_segment, synthesize, text, retries, backend.cache_voice(voice), lang)
+    
+    yield from _iter_in_order(segments, submit, list(lanes.values()), backend.frame)
+
+# Voice index for each normalized speaker label
+_HOST_INDEX = {"Host1": 0, "Host2": 1}
+
+def _iter_in_order(
+    items: Iterable,
+    submit: Callable[[object], Future],
+    executors: List[ThreadPoolExecutor],
+    frame: Callable[[bytes, bool], bytes]
+) -> Iterator[bytes]:
+    """
+    Submit items for synthesis as they are produced and yield their framed audio in order.
+    
+    `items` is consumed on a separate thread so that a lazy producer, such
+    as a streaming LLM, never blocks synthesis. The executors are shut down,
+    cancelling queued work, once the caller is done or a segment fails.
+    """
+    pending: "queue.Queue" = queue.Queue()
+    stopped = threading.Event()
+    
+    def feed():
+        """Queue each item for synthesis as soon as the producer yields it."""
+        try:
+            for item in items:
+                if stopped.is_set():
+                    break
+                pending.put(submit(item))
+        except BaseException as e:
+            pending.put(e)
+        finally:
+            pending.put(None)
+    
+    feeder = threading.Thread(target=feed, name="tts-feeder", daemon=True)
+    feeder.start()
+    try:
+        index = 0
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield frame(item.result(), index == 0)
+            index += 1
+    finally:
+        # Stop queued segments if the caller gives up early or a segment failed
+        stopped.set()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def render_speech(
+    turns: Iterable[Turn],
+    gender: str = "mixed",
+    backend: Optional[TTSBackend] = None,
+    multi_voice: Optional[bool] = None
+) -> Iterator[bytes]:
+    """
+    Render a podcast conversation to audio, yielding it in order as it is synthesized.
+    
+    Args:
+        turns: A Conversation, or its turns as a lazy iterator
+        gender: Voice gender preference (male, female, or mixed)
+        backend: TTS backend; defaults to TTS_BACKEND
+        multi_voice: Give each host their own voice; defaults to
+            PODCAST_MULTI_VOICE. Otherwise one voice reads the script and
+            announces speaker changes.
+        
+    Yields:
+        Chunks of one continuous audio stream in the backend's format
+    """
+    backend = backend or get_tts_backend()
+    if multi_voice if multi_voice is not None else PODCAST_MULTI_VOICE:
+        segments = iter_turn_segments(turns, backend.max_chars)
+        return iter_multi_voice_segments(segments, backend.host_voices(gender), backend)
+    
+    segments = _iter_announced_segments(((turn.speaker, turn.text) for turn in turns), gender, backend.max_chars)
+    return iter_synthesized_segments(segments, voice=backend.voice_for(gender), backend=backend)
+
 def clean_text_for_speech(text: str) -> str:
     """
     Clean text to make it more suitable for speech synthesis.
@@ -95,51 +367,7 @@ def clean_text_for_speech(text: str) -> str:
     Returns:
         Cleaned text optimized for speech
     """
-    # Remove markdown-style formatting
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*(.*?)\*', r'\1', text)      # Italic
-    text = re.sub(r'__(.*?)__', r'\1', text)      # Underline
-    text = re.sub(r'~~(.*?)~~', r'\1', text)      # Strikethrough
-    
-    # Replace special characters that might be read literally
-    text = text.replace('&', 'and')
-    text = text.replace('/', ' or ')
-    text = text.replace('#', 'number ')
-    text = text.replace('@', 'at ')
-    text = text.replace('...', '.')  # Replace ellipsis with period for cleaner pauses
-    text = text.replace('—', ', ')   # Em dash
-    text = text.replace('–', ', ')   # En dash
-    text = text.replace('|', ', ')   # Vertical bar
-    
-    # Convert common abbreviations
-    text = re.sub(r'\bi\.e\.\s', 'that is, ', text, flags=re.IGNORECASE)
-    text = re.sub(r'\be\.g\.\s', 'for example, ', text, flags=re.IGNORECASE)
-    text = re.sub(r'\betc\.', 'etcetera', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bvs\.', 'versus', text, flags=re.IGNORECASE)
-    
-    # Convert URLs to more speech-friendly format
-    text = re.sub(r'https?://\S+', 'a website link', text)
-    
-    # Replace multiple punctuations with single ones
-    text = re.sub(r'\.{2,}', '.', text)
-    text = re.sub(r'\!{2,}', '!', text)
-    text = re.sub(r'\?{2,}', '?', text)
-    
-    # Normalize spaces
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Ensure proper spacing around punctuation
-    text = re.sub(r'(\w)([,.!?;:])', r'\1\2 ', text)
-    text = re.sub(r'\s+([,.!?;:])', r'\1 ', text)
-    
-    # Replace dashes with natural pauses
-    text = text.replace(' - ', ', ')
-    
-    # Make quoted content more natural for speech
-    text = re.sub(r'"([^"]*)"', r' \1 ', text)
-    text = re.sub(r"'([^']*)'", r' \1 ', text)
-    
-    return text.strip()
+    return normalize_for_speech(text)
 
 def add_speech_enhancements(text: str) -> str:
     """
@@ -151,12 +379,4 @@ def add_speech_enhancements(text: str) -> str:
     Returns:
         Enhanced text for more natural speech
     """
-    # Add natural pauses for commas and periods
-    text = text.replace('. ', '. <break time="0.3s"/> ')
-    text = text.replace('? ', '? <break time="0.5s"/> ')
-    text = text.replace('! ', '! <break time="0.4s"/> ')
-    
-    # Remove any SSML tags that gTTS doesn't support
-    text = re.sub(r'<break[^>]*>', '', text)
-    
-    return text 
\ No newline at end of file
+    return add_pauses(text)
@@ -0,0 +1,263 @@
+"""
+Background job queue for VideoTranscript Pro.
+Runs long generation pipelines off the request thread and persists jobs in SQLite.
+"""
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from ..config.settings import DEFAULT_CACHE_DIR, JOB_RETENTION, JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# How often (in seconds) finished jobs past their retention are purged
+_PURGE_INTERVAL = 600
+
+JobHandler = Callable[[Dict], Dict]
+
+
+class JobQueue:
+    """
+    A persistent job queue backed by SQLite and a thread pool.
+
+    Jobs move through queued -> running -> succeeded | failed. Each job
+    records the process that ran it, so jobs left queued or running by a
+    process that has since exited are picked up again by resume_pending().
+    Finished jobs are deleted `retention` seconds after they finished.
+    """
+
+    def __init__(self, db_path: str, max_workers: int, retention: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite database file
+            max_workers: Jobs run at the same time
+            retention: Seconds a succeeded or failed job stays readable, or
+                None to keep it forever
+        """
+        self.db_path = db_path
+        self.retention = retention
+        self._last_purge = 0.0
+        self._handlers: Dict[str, JobHandler] = {}
+        self._lock = threading.Lock()
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job-worker")
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                params TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                owner TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+        self._conn.commit()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """
+        Register the function that runs jobs of a given kind.
+
+        The handler receives the job params and returns a JSON-serializable
+        result dictionary; raising marks the job as failed.
+        """
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: Dict) -> str:
+        """
+        Queue a job for background execution.
+
+        Args:
+            kind: Registered job kind, e.g. 'podcast'
+            params: JSON-serializable job parameters
+
+        Returns:
+            The new job ID
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, owner, created_at, updated_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params), self._owner, now, now)
+            )
+            self._conn.commit()
+
+        self._executor.submit(self._run, job_id)
+        self._maybe_purge()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a job's status, result and error, or None if it doesn't exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, kind, status, result, error, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'job_id': row[0],
+            'kind': row[1],
+            'status': row[2],
+            'result': json.loads(row[3]) if row[3] else None,
+            'error': row[4],
+            'created_at': row[5],
+            'updated_at': row[6],
+        }
+
+    def purge_finished(self) -> int:
+        """
+        Delete succeeded and failed jobs that finished more than `retention` seconds ago.
+
+        Returns:
+            Number of jobs deleted
+        """
+        if not self.retention:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND updated_at < ?",
+                (time.time() - self.retention,)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            logger.info(f"Purged {cursor.rowcount} finished job(s)")
+        return cursor.rowcount
+
+    def _maybe_purge(self) -> None:
+        """Purge expired jobs, at most once per _PURGE_INTERVAL."""
+        now = time.time()
+        if now - self._last_purge < _PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        try:
+            self.purge_finished()
+        except sqlite3.Error as e:
+            logger.warning(f"Job purge failed: {str(e)}")
+
+    def resume_pending(self) -> int:
+        """
+        Re-queue jobs that were queued or running in a process that is gone.
+
+        Call this after all handlers are registered.
+
+        Returns:
+            Number of jobs resumed
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+
+        resumed = 0
+        for job_id, owner in rows:
+            if owner == self._owner or _owner_alive(owner):
+                continue
+            with self._lock:
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET status = 'queued', owner = ?, updated_at = ? "
+                    "WHERE id = ? AND owner IS ?",
+                    (self._owner, time.time(), job_id, owner)
+                )
+                self._conn.commit()
+            if cursor.rowcount == 1:
+                self._executor.submit(self._run, job_id)
+                resumed += 1
+
+        if resumed:
+            logger.info(f"Resumed {resumed} pending job(s)")
+        return resumed
+
+    def _run(self, job_id: str) -> None:
+        """Claim and execute a single job on a worker thread."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'running', updated_at = ? "
+                "WHERE id = ? AND status = 'queued' AND owner = ?",
+                (time.time(), job_id, self._owner)
+            )
+            self._conn.commit()
+            if cursor.rowcount != 1:
+                return
+            kind, params = self._conn.execute(
+                "SELECT kind, params FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+
+        try:
+            handler = self._handlers[kind]
+            result = handler(json.loads(params))
+            status, result_json, error = 'succeeded', json.dumps(result), None
+        except Exception as e:
+            logger.error(f"Job {job_id} ({kind}) failed: {str(e)}")
+            status, result_json, error = 'failed', None, str(e)
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, result_json, error, time.time(), job_id)
+            )
+            self._conn.commit()
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """Check whether the process that owns a job is still running on this host."""
+    if not owner:
+        return False
+
+    host, pid, _ = (owner.split(":") + ["", "", ""])[:3]
+    if host != socket.gethostname():
+        # Can't see processes on other hosts; leave their jobs alone
+        return True
+    try:
+        pid = int(pid)
+    except ValueError:
+        return False
+    if pid == os.getpid():
+        # Same PID but a different queue instance: the old process restarted
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue, creating it on first use."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue(
+                    os.path.join(DEFAULT_CACHE_DIR, "jobs.sqlite3"),
+                    max_workers=JOB_WORKERS,
+                    retention=JOB_RETENTION,
+                )
+    return _queue
@@ -0,0 +1,172 @@
+"""
+Content-addressed LLM response cache for VideoTranscript Pro.
+Reuses completions for identical model, temperature, prompt and input.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from .disk_cache import DiskCache
+from .tracing import span
+from ..config.settings import (
+    DEFAULT_CACHE_DIR,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional[DiskCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> DiskCache:
+    """Get the process-wide LLM response cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DiskCache(
+                    os.path.join(DEFAULT_CACHE_DIR, "llm_responses.sqlite3"),
+                    max_bytes=LLM_CACHE_MAX_BYTES,
+                    ttl=LLM_CACHE_TTL,
+                )
+    return _cache
+
+
+def prompt_version(*prompts) -> str:
+    """
+    Fingerprint one or more prompt templates.
+
+    Editing a prompt changes its fingerprint, so responses generated from the
+    old wording are never served for the new one.
+
+    Args:
+        prompts: LangChain prompt templates, or extra strings that affect the output
+
+    Returns:
+        A short hex digest
+    """
+    digest = hashlib.sha256()
+    for prompt in prompts:
+        text = prompt.pretty_repr() if hasattr(prompt, "pretty_repr") else str(prompt)
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _cache_key(namespace: str, model: str, temperature: float, version: str, payload) -> str:
+    material = json.dumps(
+        [namespace, model, float(temperature), version, payload],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return f"{namespace}:{hashlib.sha256(material.encode('utf-8')).hexdigest()}"
+
+
+def get_cached_completion(namespace: str, model: str, temperature: float, version: str, payload) -> Optional[str]:
+    """
+    Look up a cached completion.
+
+    Args:
+        namespace: Kind of completion, e.g. 'summary' or 'podcast_title'
+        model: Model name
+        temperature: Sampling temperature
+        version: Prompt version, see prompt_version()
+        payload: JSON-serializable prompt input
+
+    Returns:
+        The completion text, or None on a miss
+    """
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    try:
+        value = get_llm_cache().get(_cache_key(namespace, model, temperature, version, payload))
+        return value.decode("utf-8") if value is not None else None
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed: {str(e)}")
+        return None
+
+
+def store_completion(
+    namespace: str,
+    model: str,
+    temperature: float,
+    version: str,
+    payload,
+    text: str,
+    cost: float = 0.0,
+) -> None:
+    """
+    Store a completion in the cache.
+
+    Args:
+        namespace, model, temperature, version, payload: As for get_cached_completion()
+        text: The completion text
+        cost: Seconds the LLM call took
+    """
+    if not LLM_CACHE_ENABLED:
+        return
+
+    try:
+        key = _cache_key(namespace, model, temperature, version, payload)
+        get_llm_cache().set(key, text.encode("utf-8"), cost=cost)
+    except Exception as e:
+        logger.warning(f"LLM cache store failed: {str(e)}")
+
+
+def cached_completion(
+    namespace: str,
+    model: str,
+    temperature: float,
+    version: str,
+    payload,
+    generate: Callable[[], str],
+    use_cache: bool = True,
+) -> str:
+    """
+    Return a cached completion, or generate and cache it.
+
+    Args:
+        namespace: Kind of completion, e.g. 'summary' or 'podcast_title'
+        model: Model name used by generate
+        temperature: Sampling temperature used by generate
+        version: Prompt version, see prompt_version()
+        payload: JSON-serializable prompt input
+        generate: Function that calls the LLM and returns its text
+        use_cache: False skips the lookup for this request; the fresh
+            response still replaces the cached one
+
+    Returns:
+        The completion text
+    """
+    with span(f"llm.{namespace}", "client", model=model) as current:
+        if use_cache:
+            text = get_cached_completion(namespace, model, temperature, version, payload)
+            if text is not None:
+                current.set_attribute("cache_hit", True)
+                return text
+
+        current.set_attribute("cache_hit", False)
+        start = time.perf_counter()
+        text = generate()
+        store_completion(namespace, model, temperature, version, payload, text, cost=time.perf_counter() - start)
+        return text
+
+
+def get_llm_cache_stats() -> Dict:
+    """Return hit rate and time saved for the LLM response cache."""
+    if not LLM_CACHE_ENABLED:
+        return {'enabled': False}
+
+    try:
+        return {'enabled': True, **get_llm_cache().stats()}
+    except Exception as e:
+        logger.warning(f"LLM cache stats failed: {str(e)}")
+        return {'enabled': True, 'error': str(e)}
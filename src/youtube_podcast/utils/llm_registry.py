@@ -0,0 +1,91 @@
+"""
+Shared LLM clients and chains for VideoTranscript Pro.
+
+Building a ChatOpenAI client sets up a new OpenAI client and HTTP connection
+pool, so clients and compiled chains are created once per process and reused
+across requests. All chat clients share one OpenAI client and its keep-alive
+connection pool.
+"""
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+import openai
+from langchain_community.chat_models import ChatOpenAI
+from langchain_core.runnables import Runnable
+
+from ..config.settings import OPENAI_API_KEY, LLM_MAX_CONNECTIONS, LLM_REQUEST_TIMEOUT
+
+_lock = threading.RLock()
+_openai_client: Optional[openai.OpenAI] = None
+_clients: Dict[Tuple[str, float], ChatOpenAI] = {}
+_chains: Dict[str, Runnable] = {}
+
+
+def get_openai_client() -> openai.OpenAI:
+    """Get the OpenAI client whose keep-alive connection pool is shared by all chat clients."""
+    global _openai_client
+    if _openai_client is None:
+        with _lock:
+            if _openai_client is None:
+                _openai_client = openai.OpenAI(
+                    api_key=OPENAI_API_KEY,
+                    timeout=LLM_REQUEST_TIMEOUT,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=LLM_MAX_CONNECTIONS,
+                            max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                            keepalive_expiry=60,
+                        ),
+                        timeout=LLM_REQUEST_TIMEOUT,
+                    ),
+                )
+    return _openai_client
+
+
+def get_llm(model: str, temperature: float) -> ChatOpenAI:
+    """
+    Get the shared chat client for a model and temperature.
+
+    Args:
+        model: OpenAI model name
+        temperature: Sampling temperature
+
+    Returns:
+        A ChatOpenAI client, created on first use
+    """
+    key = (model, float(temperature))
+    llm = _clients.get(key)
+    if llm is None:
+        with _lock:
+            llm = _clients.get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    openai_api_key=OPENAI_API_KEY,
+                    model_name=model,
+                    temperature=temperature,
+                    client=get_openai_client().chat.completions,
+                )
+                _clients[key] = llm
+    return llm
+
+
+def get_chain(name: str, build: Callable[[], Runnable]) -> Runnable:
+    """
+    Get a compiled chain by name, building it on first use.
+
+    Args:
+        name: Unique chain name, e.g. 'summary'
+        build: Function that composes the chain
+
+    Returns:
+        The cached chain
+    """
+    chain = _chains.get(name)
+    if chain is None:
+        with _lock:
+            chain = _chains.get(name)
+            if chain is None:
+                chain = build()
+                _chains[name] = chain
+    return chain
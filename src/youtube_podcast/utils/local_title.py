@@ -0,0 +1,146 @@
+"""
+Local title generation for VideoTranscript Pro.
+Builds short titles from RAKE keyphrases, without calling an LLM.
+"""
+import re
+from collections import defaultdict
+from typing import List, Optional
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are aren't as at be because been before
+being below between both but by can can't cannot could couldn't did didn't do does doesn't doing
+don't down during each even ever every few for from further get gets getting go goes going gonna
+got had hadn't has hasn't have haven't having he he'd he'll he's her here here's hers herself him
+himself his how how's however i i'd i'll i'm i've if in into is isn't it it's its itself just
+kind know let let's like lot lots made make makes many may maybe me mean might more most much must
+my myself need no nor not now of off oh ok okay on once one only or other ought our ours ourselves
+out over own pretty quite rather really right said same say says see seem seems she she'd she'll
+she's should shouldn't so some something still such sure take talk talking tell than that that's
+the their theirs them themselves then there there's these they they'd they'll they're they've
+thing things think this those though through thus to today too under until up upon us use used
+using very video want wanted was wasn't way we we'd we'll we're we've well were weren't what
+what's when when's where where's whether which while who who's whom why why's will with won't
+would wouldn't yeah yes yet you you'd you'll you're you've your yours yourself yourselves
+""".split())
+
+# Words kept lowercase inside a title
+SMALL_WORDS = frozenset("a an and as at but by for in of on or the to vs with".split())
+
+# Conversation speaker labels such as "Host1:" at the start of a line
+_SPEAKER_LABEL = re.compile(r'^\s*[\w ]{1,20}:\s*', re.MULTILINE)
+_PHRASE_DELIMITERS = re.compile(r"[.,;:!?()\[\]\"“”\n\r\t–—]+|\s-\s")
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9'+-]*")
+
+# Longest keyphrase used in a title
+MAX_PHRASE_WORDS = 3
+
+
+def extract_keyphrases(text: str, limit: int = 5) -> List[str]:
+    """
+    Rank candidate keyphrases with RAKE (Rapid Automatic Keyword Extraction).
+
+    Candidate phrases are runs of words between stopwords and punctuation.
+    Each word scores degree / frequency across all candidates, and a phrase
+    scores the sum of its words. Phrases seen more than once get a bonus.
+
+    Args:
+        text: Text to analyse
+        limit: Maximum number of phrases to return
+
+    Returns:
+        Phrases in descending score order, with their original casing
+    """
+    candidates = []
+    for fragment in _PHRASE_DELIMITERS.split(text):
+        phrase: List[str] = []
+        for word in _WORD.findall(fragment):
+            if word.lower() in STOPWORDS or len(word) < 3 and not word.isupper():
+                if phrase:
+                    candidates.append(phrase)
+                phrase = []
+            else:
+                phrase.append(word)
+        if phrase:
+            candidates.append(phrase)
+
+    candidates = [phrase for phrase in candidates if len(phrase) <= MAX_PHRASE_WORDS]
+    if not candidates:
+        return []
+
+    frequency = defaultdict(int)
+    degree = defaultdict(int)
+    occurrences = defaultdict(int)
+    surface = {}
+    for phrase in candidates:
+        key = " ".join(word.lower() for word in phrase)
+        occurrences[key] += 1
+        surface.setdefault(key, phrase)
+        for word in phrase:
+            lower = word.lower()
+            frequency[lower] += 1
+            degree[lower] += len(phrase)
+
+    scores = {}
+    for key, count in occurrences.items():
+        words = key.split()
+        scores[key] = sum(degree[w] / frequency[w] for w in words) * (1 + 0.5 * (count - 1))
+
+    ranked = sorted(scores, key=lambda k: (-scores[k], k))
+
+    # Skip phrases that only repeat words already chosen
+    chosen: List[str] = []
+    seen_words = set()
+    for key in ranked:
+        words = set(key.split())
+        if words <= seen_words:
+            continue
+        chosen.append(" ".join(surface[key]))
+        seen_words |= words
+        if len(chosen) >= limit:
+            break
+    return chosen
+
+
+def _title_case(phrase: str, first: bool = True) -> str:
+    words = phrase.split()
+    result = []
+    for i, word in enumerate(words):
+        if word.isupper() and len(word) > 1:
+            result.append(word)  # Keep acronyms such as AI or NASA
+        elif word.lower() in SMALL_WORDS and not (first and i == 0):
+            result.append(word.lower())
+        else:
+            result.append(word[:1].upper() + word[1:].lower())
+    return " ".join(result)
+
+
+def generate_local_title(text: str, kind: str = "summary") -> Optional[str]:
+    """
+    Build a short title from the text's top keyphrases.
+
+    Args:
+        text: Summary or conversation text
+        kind: 'summary' or 'podcast'; podcasts ignore speaker labels and
+            get a conversational template
+
+    Returns:
+        A title of roughly 2-8 words, or None if no keyphrases were found
+    """
+    if not text:
+        return None
+
+    if kind == "podcast":
+        text = _SPEAKER_LABEL.sub("\n", text)
+
+    phrases = extract_keyphrases(text, limit=2)
+    if not phrases:
+        return None
+
+    main = _title_case(phrases[0])
+    if len(phrases) == 1:
+        return f"Talking {main}" if kind == "podcast" else f"{main} Explained"
+
+    second = _title_case(phrases[1], first=kind != "podcast")
+    if kind == "podcast":
+        return f"Talking {main} and {second}"
+    return f"{main}: {second}"
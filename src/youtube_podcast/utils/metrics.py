@@ -0,0 +1,111 @@
+"""
+In-process latency metrics for VideoTranscript Pro.
+Keeps a rolling window of recent samples per metric and reports percentiles,
+plus cumulative histograms over fixed bucket boundaries.
+"""
+import threading
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Samples kept per metric; older samples drop out of the percentiles
+WINDOW_SIZE = 1000
+
+# Upper bounds of the histogram buckets in milliseconds; the last bucket is unbounded
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+_lock = threading.Lock()
+_samples: Dict[str, Deque[float]] = {}
+_counts: Dict[str, int] = {}
+_buckets: Dict[str, List[int]] = {}
+_sums: Dict[str, float] = {}
+
+
+def record_latency(name: str, seconds: float) -> None:
+    """
+    Record one latency sample.
+
+    Args:
+        name: Metric name, e.g. 'summary.ttft'
+        seconds: Measured duration in seconds
+    """
+    with _lock:
+        samples = _samples.get(name)
+        if samples is None:
+            samples = _samples[name] = deque(maxlen=WINDOW_SIZE)
+        samples.append(seconds)
+        _counts[name] = _counts.get(name, 0) + 1
+
+        buckets = _buckets.get(name)
+        if buckets is None:
+            buckets = _buckets[name] = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        buckets[bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000)] += 1
+        _sums[name] = _sums.get(name, 0.0) + seconds
+
+
+def _percentile(ordered, fraction: float) -> float:
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def get_latency_stats(name: Optional[str] = None, prefix: Optional[str] = None) -> Dict:
+    """
+    Summarize recorded latencies.
+
+    Args:
+        name: Only report this metric; all metrics when None
+        prefix: Only report metrics whose name starts with this, e.g. 'node.'
+
+    Returns:
+        Dictionary of metric name to count, mean, p50, p95, p99 and max in milliseconds
+    """
+    with _lock:
+        snapshot = {
+            key: (sorted(samples), _counts[key])
+            for key, samples in _samples.items()
+            if (name is None or key == name) and (prefix is None or key.startswith(prefix))
+        }
+
+    stats = {}
+    for key, (ordered, count) in snapshot.items():
+        stats[key] = {
+            'count': count,
+            'window': len(ordered),
+            'mean_ms': round(sum(ordered) / len(ordered) * 1000, 1),
+            'p50_ms': round(_percentile(ordered, 0.50) * 1000, 1),
+            'p95_ms': round(_percentile(ordered, 0.95) * 1000, 1),
+            'p99_ms': round(_percentile(ordered, 0.99) * 1000, 1),
+            'max_ms': round(ordered[-1] * 1000, 1),
+        }
+    return stats
+
+
+def get_latency_histogram(name: Optional[str] = None, prefix: Optional[str] = None) -> Dict:
+    """
+    Report cumulative latency histograms, counted since the process started.
+
+    Args:
+        name: Only report this metric; all metrics when None
+        prefix: Only report metrics whose name starts with this, e.g. 'node.'
+
+    Returns:
+        Dictionary of metric name to bucket upper bounds in milliseconds,
+        per-bucket counts (one more than the bounds, for the overflow
+        bucket), total count and sum in milliseconds
+    """
+    with _lock:
+        snapshot = {
+            key: (list(buckets), _sums[key])
+            for key, buckets in _buckets.items()
+            if (name is None or key == name) and (prefix is None or key.startswith(prefix))
+        }
+
+    return {
+        key: {
+            'bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'counts': buckets,
+            'count': sum(buckets),
+            'sum_ms': round(total * 1000, 1),
+        }
+        for key, (buckets, total) in snapshot.items()
+    }
@@ -0,0 +1,106 @@
+"""
+Token-aware text chunking for long transcripts.
+Uses tiktoken when installed and a character-based estimate otherwise.
+"""
+import re
+from functools import lru_cache
+from typing import List
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Rough characters-per-token ratio for English text, used without tiktoken
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Load the tokenizer for a model, or None if tiktoken can't provide one."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # tiktoken downloads its vocabulary files on first use, which fails offline
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+    """
+    Count the tokens in text for the given model.
+
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer to use
+
+    Returns:
+        Token count (estimated if no tokenizer is available)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _split_units(text: str, max_tokens: int, model: str) -> List[str]:
+    """Split text into sentences, breaking sentences over max_tokens into word runs."""
+    units = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        if not sentence:
+            continue
+        if count_tokens(sentence, model) <= max_tokens:
+            units.append(sentence)
+            continue
+
+        # Auto-generated captions often have no punctuation at all
+        units.extend(_split_words(sentence.split(), max_tokens, model))
+    return units
+
+
+def _split_words(words: List[str], max_tokens: int, model: str) -> List[str]:
+    """Halve a run of words until every piece fits in max_tokens."""
+    text = " ".join(words)
+    if len(words) <= 1 or count_tokens(text, model) <= max_tokens:
+        return [text]
+    middle = len(words) // 2
+    return _split_words(words[:middle], max_tokens, model) + _split_words(words[middle:], max_tokens, model)
+
+
+def chunk_text(text: str, max_tokens: int, model: str = "gpt-3.5-turbo") -> List[str]:
+    """
+    Split text into chunks of at most max_tokens, on sentence boundaries where possible.
+
+    Args:
+        text: Text to split
+        max_tokens: Upper bound on tokens per chunk
+        model: Model whose tokenizer to use
+
+    Returns:
+        List of chunk strings in their original order
+    """
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for unit in _split_units(text, max_tokens, model):
+        unit_tokens = count_tokens(unit, model) + 1  # joining space
+        if current and current_tokens + unit_tokens > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += unit_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+
+    return chunks
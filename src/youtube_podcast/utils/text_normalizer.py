@@ -0,0 +1,176 @@
+"""
+Compiled text normalization for VideoTranscript Pro.
+
+Speech text and conversation speaker labels are normalized for every line
+of every podcast. The patterns here are compiled once, related rules
+share a single scan, and passes that can't change a line are skipped.
+Output is identical to the step-by-step rules they replace.
+"""
+import re
+from typing import Optional
+
+# Markdown emphasis, removed in this order
+_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC = re.compile(r'\*(.*?)\*')
+_UNDERLINE = re.compile(r'__(.*?)__')
+_STRIKETHROUGH = re.compile(r'~~(.*?)~~')
+
+# Characters that would be read literally. Plain replaces behind a
+# membership test beat str.translate, whose multi-character mappings are slow.
+_SYMBOL_WORDS = (
+    ('&', 'and'),
+    ('/', ' or '),
+    ('#', 'number '),
+    ('@', 'at '),
+    ('—', ', '),  # Em dash
+    ('–', ', '),  # En dash
+    ('|', ', '),  # Vertical bar
+)
+
+_ABBREVIATIONS = re.compile(r'\b(?:(i\.e\.\s)|(e\.g\.\s)|(etc\.)|(vs\.))', re.IGNORECASE)
+_ABBREVIATION_EXPANSIONS = (None, 'that is, ', 'for example, ', 'etcetera', 'versus')
+
+_REPEATED_PUNCTUATION = re.compile(r'([.!?])\1+')
+# Runs of whitespace other than a lone space, the only ones that need replacing
+_WHITESPACE = re.compile(r'\s{2,}|[^\S ]')
+_SPACE_AFTER_PUNCTUATION = re.compile(r'(?<=\w)[,.!?;:]')
+_SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+([,.!?;:])')
+_DOUBLE_QUOTED = re.compile(r'"([^"]*)"')
+_SINGLE_QUOTED = re.compile(r"'([^']*)'")
+
+_BREAK_TAG = re.compile(r'<break[^>]*>')
+
+
+# Callables avoid re-expanding a template string on every match
+def _group1(match: "re.Match") -> str:
+    return match.group(1)
+
+
+def _group1_spaced(match: "re.Match") -> str:
+    return f" {match.group(1)} "
+
+
+def _match_then_space(match: "re.Match") -> str:
+    return match.group(0) + " "
+
+
+def _group1_then_space(match: "re.Match") -> str:
+    return match.group(1) + " "
+
+
+# Normalized host labels and the spellings that map to them
+_HOST1_LABELS = ("host1", "host 1", "speaker1", "speaker 1")
+_HOST2_LABELS = ("host2", "host 2", "speaker2", "speaker 2")
+
+
+def _expand_abbreviations(text: str) -> str:
+    """Expand i.e., e.g., etc. and vs. in one scan."""
+    last_end = -1
+    last_expanded = None
+
+    def expand(match: "re.Match") -> str:
+        nonlocal last_end, last_expanded
+        kind = match.lastindex
+        # Expanded one at a time, "etc." turned into "etcetera", so a "vs."
+        # right after it no longer started at a word boundary
+        if kind == 4 and last_expanded == 3 and match.start() == last_end:
+            expansion, kind = match.group(0), None
+        else:
+            expansion = _ABBREVIATION_EXPANSIONS[kind]
+        last_end, last_expanded = match.end(), kind
+        return expansion
+
+    return _ABBREVIATIONS.sub(expand, text)
+
+
+def normalize_for_speech(text: str) -> str:
+    """
+    Clean text to make it more suitable for speech synthesis.
+
+    Removes markdown emphasis, spells out symbols and common abbreviations,
+    collapses repeated punctuation and whitespace, and unwraps quotes.
+
+    Args:
+        text: The text to clean
+
+    Returns:
+        Cleaned text optimized for speech
+    """
+    if '*' in text:
+        text = _ITALIC.sub(_group1, _BOLD.sub(_group1, text))
+    if '__' in text:
+        text = _UNDERLINE.sub(_group1, text)
+    if '~~' in text:
+        text = _STRIKETHROUGH.sub(_group1, text)
+
+    for symbol, words in _SYMBOL_WORDS:
+        if symbol in text:
+            text = text.replace(symbol, words)
+    if '...' in text:
+        text = text.replace('...', '.')  # Ellipsis becomes a cleaner pause
+
+    # URLs need no rule of their own: '/' has already been spelled out above
+    if '.' in text:
+        text = _expand_abbreviations(text)
+        text = _REPEATED_PUNCTUATION.sub(_group1, text)
+    elif '!' in text or '?' in text:
+        text = _REPEATED_PUNCTUATION.sub(_group1, text)
+
+    text = _WHITESPACE.sub(' ', text)
+
+    # Ensure proper spacing around punctuation
+    text = _SPACE_AFTER_PUNCTUATION.sub(_match_then_space, text)
+    text = _SPACE_BEFORE_PUNCTUATION.sub(_group1_then_space, text)
+
+    if ' - ' in text:
+        text = text.replace(' - ', ', ')
+
+    # Make quoted content more natural for speech
+    if '"' in text:
+        text = _DOUBLE_QUOTED.sub(_group1_spaced, text)
+    if "'" in text:
+        text = _SINGLE_QUOTED.sub(_group1_spaced, text)
+
+    return text.strip()
+
+
+def add_pauses(text: str) -> str:
+    """
+    Lengthen the gap after sentence-ending punctuation for a more natural cadence.
+
+    gTTS doesn't read SSML, so instead of inserting <break> tags a pause is
+    an extra space after '.', '?' or '!'. Any <break> tags already in the
+    text are removed.
+
+    Args:
+        text: Processed text
+
+    Returns:
+        Text ready for synthesis
+    """
+    if '<' in text:
+        # Tags in the text: keep the exact insert-then-strip behaviour
+        text = text.replace('. ', '. <break time="0.3s"/> ')
+        text = text.replace('? ', '? <break time="0.5s"/> ')
+        text = text.replace('! ', '! <break time="0.4s"/> ')
+        return _BREAK_TAG.sub('', text)
+
+    return text.replace('. ', '.  ').replace('? ', '?  ').replace('! ', '!  ')
+
+
+def normalize_speaker(label: str) -> Optional[str]:
+    """
+    Map a conversation speaker label to 'Host1' or 'Host2'.
+
+    Args:
+        label: Speaker label as written by the LLM, e.g. 'Speaker 2'
+
+    Returns:
+        'Host1' or 'Host2', or None if the label names neither host
+    """
+    lower = label.lower()
+    if any(option in lower for option in _HOST1_LABELS):
+        return "Host1"
+    if any(option in lower for option in _HOST2_LABELS):
+        return "Host2"
+    return None
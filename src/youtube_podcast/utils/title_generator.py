@@ -1,65 +1,103 @@
 import re
-from typing import Optional
-from langchain_community.chat_models import ChatOpenAI
-from ..config.settings import OPENAI_API_KEY
+import json
+from typing import Optional, Tuple, Union
+from langchain_core.prompts import PromptTemplate
+from .llm_registry import get_llm, get_chain
+from .llm_cache import cached_completion, prompt_version
+from .local_title import generate_local_title
+from .tracing import traced
+from ..config.settings import TITLE_STRATEGY
+from ..models.conversation import Conversation
 
-def generate_podcast_title(conversation_text: str) -> Optional[str]:
+TITLE_MODEL = "gpt-3.5-turbo"
+
+PODCAST_TITLE_PROMPT = PromptTemplate.from_template("""Create a catchy, descriptive title for a podcast episode based on this conversation:
+
+        {sample_text}
+        
+        The title should be:
+        - Concise (5-8 words)
+        - Engaging and descriptive
+        - Clearly indicate the main topic
+        - No quotes or special characters
+        
+        Return only the title text, nothing else.""")
+
+SUMMARY_TITLE_PROMPT = PromptTemplate.from_template("""Create a clear, descriptive title for this summary:
+
+        {sample_text}
+        
+        The title should be:
+        - Brief (4-7 words)
+        - Factual and informative
+        - Represent the main topic or conclusion
+        - No quotes or special characters
+        
+        Return only the title text, nothing else.""")
+
+# Cache key components; change whenever a prompt changes
+PODCAST_TITLE_PROMPT_VERSION = prompt_version(PODCAST_TITLE_PROMPT)
+SUMMARY_TITLE_PROMPT_VERSION = prompt_version(SUMMARY_TITLE_PROMPT)
+
+@traced("title.podcast")
+def generate_podcast_title(
+    conversation: Union[str, Conversation],
+    use_cache: bool = True,
+    strategy: Optional[str] = None
+) -> Optional[str]:
     """
     Generate a catchy and descriptive title for a podcast based on the conversation.
     
     Args:
-        conversation_text: The podcast conversation text
+        conversation: The podcast conversation, parsed or as a script
+        use_cache: Whether a cached title for the same text may be reused
+        strategy: 'llm' or 'local'; defaults to the TITLE_STRATEGY setting
         
     Returns:
         A title string or None if generation fails
     """
     try:
-        if not conversation_text or len(conversation_text) < 50:
+        if not conversation or len(conversation) < 50:
             return None
+        
+        if (strategy or TITLE_STRATEGY) == "local":
+            return generate_local_title(str(conversation), kind="podcast")
             
-        # Initialize ChatOpenAI
-        llm = ChatOpenAI(
-            openai_api_key=OPENAI_API_KEY,
-            model_name="gpt-3.5-turbo",
-            temperature=0.7
-        )
+        # Reuse the process-wide chain and LLM client
+        chain = get_chain("podcast_title", lambda: PODCAST_TITLE_PROMPT | get_llm(TITLE_MODEL, 0.7))
         
-        # Create a prompt for title generation
         # Use only the first ~1000 characters of the conversation to save tokens
-        sample_text = conversation_text[:1000] if len(conversation_text) > 1000 else conversation_text
-        
-        prompt = f"""Create a catchy, descriptive title for a podcast episode based on this conversation:
-
-        {sample_text}
-        
-        The title should be:
-        - Concise (5-8 words)
-        - Engaging and descriptive
-        - Clearly indicate the main topic
-        - No quotes or special characters
-        
-        Return only the title text, nothing else."""
+        if isinstance(conversation, Conversation):
+            sample_text = conversation.prefix(1000)
+        else:
+            sample_text = conversation[:1000]
         
         # Generate the title
-        response = llm.invoke(prompt)
+        title = cached_completion(
+            "podcast_title", TITLE_MODEL, 0.7, PODCAST_TITLE_PROMPT_VERSION,
+            sample_text, lambda: chain.invoke({"sample_text": sample_text}).content, use_cache=use_cache
+        )
         
         # Clean the title (remove quotes, extra spaces, etc.)
-        title = response.content.strip()
-        title = re.sub(r'^["\'"]|["\'"]$', '', title)  # Remove surrounding quotes
-        title = re.sub(r'\s+', ' ', title)  # Replace multiple spaces with single space
-        
-        return title
+        return clean_title(title)
         
     except Exception as e:
         print(f"Error generating podcast title: {str(e)}")
-        return None
+        return generate_local_title(str(conversation), kind="podcast")
 
-def generate_summary_title(summary_text: str) -> Optional[str]:
+@traced("title.summary")
+def generate_summary_title(
+    summary_text: str,
+    use_cache: bool = True,
+    strategy: Optional[str] = None
+) -> Optional[str]:
     """
     Generate a clear and descriptive title for a summary.
     
     Args:
         summary_text: The summary text
+        use_cache: Whether a cached title for the same text may be reused
+        strategy: 'llm' or 'local'; defaults to the TITLE_STRATEGY setting
         
     Returns:
         A title string or None if generation fails
@@ -67,43 +105,81 @@ def generate_summary_title(summary_text: str) -> Optional[str]:
     try:
         if not summary_text or len(summary_text) < 50:
             return None
+        
+        if (strategy or TITLE_STRATEGY) == "local":
+            return generate_local_title(summary_text, kind="summary")
             
-        # Initialize ChatOpenAI
-        llm = ChatOpenAI(
-            openai_api_key=OPENAI_API_KEY,
-            model_name="gpt-3.5-turbo",
-            temperature=0.5  # Lower temperature for more focused titles
-        )
+        # Reuse the process-wide chain and LLM client
+        # (lower temperature for more focused titles)
+        chain = get_chain("summary_title", lambda: SUMMARY_TITLE_PROMPT | get_llm(TITLE_MODEL, 0.5))
         
-        # Create a prompt for title generation
         # Use only the first ~800 characters of the summary to save tokens
         sample_text = summary_text[:800] if len(summary_text) > 800 else summary_text
         
-        prompt = f"""Create a clear, descriptive title for this summary:
-
-        {sample_text}
-        
-        The title should be:
-        - Brief (4-7 words)
-        - Factual and informative
-        - Represent the main topic or conclusion
-        - No quotes or special characters
-        
-        Return only the title text, nothing else."""
-        
         # Generate the title
-        response = llm.invoke(prompt)
+        title = cached_completion(
+            "summary_title", TITLE_MODEL, 0.5, SUMMARY_TITLE_PROMPT_VERSION,
+            sample_text, lambda: chain.invoke({"sample_text": sample_text}).content, use_cache=use_cache
+        )
         
         # Clean the title
-        title = response.content.strip()
-        title = re.sub(r'^["\'"]|["\'"]$', '', title)  # Remove surrounding quotes
-        title = re.sub(r'\s+', ' ', title)  # Replace multiple spaces with single space
-        
-        return title
+        return clean_title(title)
         
     except Exception as e:
         print(f"Error generating summary title: {str(e)}")
+        return generate_local_title(summary_text, kind="summary")
+
+def clean_title(title: str) -> str:
+    """
+    Tidy a generated title: strip surrounding quotes and collapse whitespace.
+    
+    Args:
+        title: Raw title text from the LLM
+        
+    Returns:
+        The cleaned title
+    """
+    title = title.strip()
+    title = re.sub(r'^["\'"]|["\'"]$', '', title)  # Remove surrounding quotes
+    title = re.sub(r'\s+', ' ', title)  # Replace multiple spaces with single space
+    return title
+
+def parse_titled_response(text: str, body_key: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a structured completion holding both a body and its title.
+    
+    Args:
+        text: Completion text, expected to be a JSON object
+        body_key: Key of the body, e.g. 'summary' or 'conversation'
+        
+    Returns:
+        (body, title) tuple, or None if the text isn't a JSON object with
+        non-empty string values for both keys
+    """
+    if not text:
+        return None
+    
+    # Tolerate a Markdown code fence around the JSON
+    text = re.sub(r'^\s*```(?:json)?\s*|\s*```\s*$', '', text)
+    try:
+        data = json.loads(text)
+    except ValueError:
         return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    body = data.get(body_key)
+    title = data.get("title")
+    if not isinstance(body, str) or not isinstance(title, str):
+        return None
+    
+    body = body.strip()
+    title = clean_title(title)
+    if not body or not title:
+        return None
+    
+    return body, title
 
 def clean_title_for_filename(title: str) -> str:
     """
@@ -0,0 +1,332 @@
+"""
+Span tracing for VideoTranscript Pro.
+
+Workflow nodes and the external calls they make (transcript fetches, LLM
+completions, title generation, speech synthesis, file writes) run inside
+spans. A span records its trace, its parent, start and end times,
+attributes and status in the OpenTelemetry data model, and is handed to
+the configured exporter when it ends:
+
+- "memory": recent spans are kept in process for /api/traces
+- "json": spans are also appended to TRACE_FILE, one OTLP JSON
+  ResourceSpans object per line, as read by the OpenTelemetry
+  collector's otlpjsonfile receiver
+- "none": tracing is off and spans cost nothing
+
+Every span's duration is also recorded in metrics under the span name,
+which gives per-node latency percentiles and histograms.
+"""
+import json
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Union
+
+from .metrics import record_latency
+from ..config.settings import TRACE_EXPORTER, TRACE_FILE, TRACE_MEMORY_SPANS, TRACE_SERVICE_NAME
+
+# OTLP enum values
+_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+_STATUS_UNSET, _STATUS_OK, _STATUS_ERROR = 0, 1, 2
+
+_SCOPE = {"name": "youtube_podcast"}
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_span_id",
+                 "start_ns", "end_ns", "attributes", "status", "status_message")
+
+    def __init__(self, name: str, kind: str = "internal", parent: Optional["Span"] = None,
+                 attributes: Optional[Dict] = None):
+        """
+        Args:
+            name: Operation name, e.g. 'node.summary_node' or 'llm.summary'
+            kind: 'internal' for work in this process, 'client' for calls out of it
+            parent: Enclosing span; a new trace is started when None
+            attributes: Initial span attributes
+        """
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = _STATUS_UNSET
+        self.status_message = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        """Mark the span failed, with an exception or an error message."""
+        self.status = _STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}" if isinstance(error, BaseException) else str(error)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end, or until now while the span is open."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def to_otlp(self) -> Dict:
+        """The span in OTLP JSON form."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value) -> Dict:
+    # OTLP JSON encodes 64-bit integers as strings
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _resource_spans(spans: List[Span]) -> Dict:
+    """Wrap spans in the OTLP ResourceSpans envelope."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": TRACE_SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": _SCOPE, "spans": [span.to_otlp() for span in spans]}],
+        }]
+    }
+
+
+class InMemoryExporter:
+    """Keeps the most recent finished spans in process."""
+
+    def __init__(self, max_spans: int = TRACE_MEMORY_SPANS):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """Finished spans, oldest first, optionally from one trace only."""
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        return spans
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonFileExporter(InMemoryExporter):
+    """Appends each finished span to a file as an OTLP JSON line, and keeps it in memory."""
+
+    def __init__(self, path: str = TRACE_FILE, max_spans: int = TRACE_MEMORY_SPANS):
+        super().__init__(max_spans)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file_lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        super().export(span)
+        line = json.dumps(_resource_spans([span]), separators=(",", ":"))
+        try:
+            with self._file_lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"Error writing trace file: {str(e)}")
+
+
+_exporter: Optional[InMemoryExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> Optional[InMemoryExporter]:
+    """Get the process-wide span exporter, or None when tracing is off."""
+    global _exporter
+    if _exporter is None and TRACE_EXPORTER != "none":
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = JsonFileExporter() if TRACE_EXPORTER == "json" else InMemoryExporter()
+    return _exporter
+
+
+def set_exporter(exporter: Optional[InMemoryExporter]) -> None:
+    """Replace the span exporter, e.g. with a collector for a benchmark run."""
+    global _exporter
+    with _exporter_lock:
+        _exporter = exporter
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this context."""
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes) -> Iterator[Span]:
+    """
+    Time a block of code as a span, nested under the current span.
+
+    Exceptions mark the span as failed and are re-raised.
+
+    Args:
+        name: Operation name; also the metric its duration is recorded under
+        kind: 'internal' or 'client'
+        **attributes: Span attributes, e.g. model='gpt-4o'
+
+    Yields:
+        The span, for setting attributes discovered along the way
+    """
+    exporter = get_exporter()
+    if exporter is None:
+        yield _NOOP_SPAN
+        return
+
+    current = Span(name, kind, _current.get(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.record_error(e)
+        raise
+    finally:
+        _current.reset(token)
+        current.end_ns = time.time_ns()
+        if current.status == _STATUS_UNSET:
+            current.status = _STATUS_OK
+        record_latency(name, current.duration)
+        exporter.export(current)
+
+
+def traced(name: str, kind: str = "internal") -> Callable:
+    """Decorator running each call of a function in a span."""
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def propagate(fn: Callable) -> Callable:
+    """
+    Bind fn to the current span, so spans it opens on a worker thread nest under it.
+
+    Args:
+        fn: Function to be run by an executor
+
+    Returns:
+        A function with the same signature
+    """
+    parent = _current.get()
+    if parent is None:
+        return fn
+
+    @wraps(fn)
+    def run(*args, **kwargs):
+        token = _current.set(parent)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current.reset(token)
+    return run
+
+
+def get_recent_traces(limit: int = 20) -> List[Dict]:
+    """
+    Summarize the most recent traces held in memory.
+
+    Args:
+        limit: Traces to return, newest first
+
+    Returns:
+        List of dictionaries with trace_id, root span name, duration in
+        milliseconds, error flag and the spans as a parent/child tree
+    """
+    exporter = get_exporter()
+    if exporter is None:
+        return []
+
+    traces: Dict[str, List[Span]] = {}
+    for finished in exporter.spans():
+        traces.setdefault(finished.trace_id, []).append(finished)
+
+    recent = sorted(traces.items(), key=lambda item: max(s.end_ns for s in item[1]), reverse=True)[:limit]
+    return [_summarize_trace(trace_id, spans) for trace_id, spans in recent]
+
+
+def _summarize_trace(trace_id: str, spans: List[Span]) -> Dict:
+    children: Dict[Optional[str], List[Span]] = {}
+    ids = {s.span_id for s in spans}
+    for s in sorted(spans, key=lambda s: s.start_ns):
+        # Spans whose parent is still open, or was dropped, show at the top
+        parent = s.parent_span_id if s.parent_span_id in ids else None
+        children.setdefault(parent, []).append(s)
+
+    def tree(s: Span) -> Dict:
+        node = {
+            "name": s.name,
+            "span_id": s.span_id,
+            "duration_ms": round(s.duration * 1000, 1),
+            "status": "error" if s.status == _STATUS_ERROR else "ok",
+            "attributes": s.attributes,
+        }
+        if s.status_message:
+            node["error"] = s.status_message
+        if s.span_id in children:
+            node["children"] = [tree(child) for child in children[s.span_id]]
+        return node
+
+    roots = children.get(None, [])
+    start = min(s.start_ns for s in spans)
+    end = max(s.end_ns for s in spans)
+    return {
+        "trace_id": trace_id,
+        "name": roots[0].name if roots else spans[0].name,
+        "duration_ms": round((end - start) / 1e6, 1),
+        "error": any(s.status == _STATUS_ERROR for s in spans),
+        "spans": [tree(root) for root in roots],
+    }
@@ -0,0 +1,98 @@
+"""
+Persistent transcript cache for VideoTranscript Pro.
+Keeps raw transcript segments on disk, keyed by video ID and language.
+"""
+import os
+import json
+import logging
+import threading
+from typing import Optional, List, Dict
+
+from .disk_cache import DiskCache
+from ..config.settings import (
+    DEFAULT_CACHE_DIR,
+    TRANSCRIPT_CACHE_ENABLED,
+    TRANSCRIPT_CACHE_TTL,
+    TRANSCRIPT_CACHE_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional[DiskCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache() -> DiskCache:
+    """Get the process-wide transcript cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DiskCache(
+                    os.path.join(DEFAULT_CACHE_DIR, "transcripts.sqlite3"),
+                    max_bytes=TRANSCRIPT_CACHE_MAX_BYTES,
+                    ttl=TRANSCRIPT_CACHE_TTL,
+                )
+    return _cache
+
+
+def _cache_key(video_id: str, language: str) -> str:
+    return f"{video_id}:{language}"
+
+
+def get_cached_transcript(video_id: str, language: str) -> Optional[List[Dict]]:
+    """
+    Look up transcript segments in the cache.
+
+    Args:
+        video_id: YouTube video ID
+        language: Transcript language code
+
+    Returns:
+        List of segments with 'text', 'start' and 'duration', or None on a miss
+    """
+    if not TRANSCRIPT_CACHE_ENABLED:
+        return None
+
+    try:
+        value = get_transcript_cache().get(_cache_key(video_id, language))
+        return json.loads(value) if value is not None else None
+    except Exception as e:
+        logger.warning(f"Transcript cache lookup failed: {str(e)}")
+        return None
+
+
+def cache_transcript(video_id: str, language: str, segments: List[Dict], cost: float = 0.0) -> None:
+    """
+    Store transcript segments in the cache.
+
+    Args:
+        video_id: YouTube video ID
+        language: Transcript language code
+        segments: Segments as returned by YouTubeTranscriptApi
+        cost: Seconds the fetch took
+    """
+    if not TRANSCRIPT_CACHE_ENABLED:
+        return
+
+    try:
+        compact = [
+            {'text': entry['text'], 'start': entry.get('start', 0.0), 'duration': entry.get('duration', 0.0)}
+            for entry in segments
+        ]
+        value = json.dumps(compact, separators=(',', ':')).encode('utf-8')
+        get_transcript_cache().set(_cache_key(video_id, language), value, cost=cost)
+    except Exception as e:
+        logger.warning(f"Transcript cache store failed: {str(e)}")
+
+
+def get_transcript_cache_stats() -> Dict:
+    """Return hit/miss counters for the transcript cache."""
+    if not TRANSCRIPT_CACHE_ENABLED:
+        return {'enabled': False}
+
+    try:
+        return {'enabled': True, **get_transcript_cache().stats()}
+    except Exception as e:
+        logger.warning(f"Transcript cache stats failed: {str(e)}")
+        return {'enabled': True, 'error': str(e)}
@@ -0,0 +1,206 @@
+"""
+Server-side transcript store for VideoTranscript Pro.
+Lets clients refer to an extracted transcript by handle instead of sending it back.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict
+
+from ..config.settings import (
+    DEFAULT_CACHE_DIR,
+    TRANSCRIPT_STORE_MAX_MEMORY_BYTES,
+    TRANSCRIPT_STORE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+# How often (in seconds) expired files are purged from the spill directory
+_PURGE_INTERVAL = 600
+
+
+class TranscriptStore:
+    """
+    Transcripts keyed by content hash, with optional aliases such as a session ID.
+
+    Recently used transcripts are kept in a memory LRU bounded by size. Every
+    entry is also spilled to disk, so it survives eviction from memory and is
+    visible to other worker processes. Entries expire `ttl` seconds after
+    they were stored.
+    """
+
+    def __init__(self, directory: str, max_memory_bytes: int, ttl: float):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+        os.makedirs(os.path.join(directory, "aliases"), exist_ok=True)
+
+    def _entry_path(self, transcript_id: str) -> str:
+        return os.path.join(self.directory, f"{transcript_id}.json")
+
+    def _alias_path(self, alias: str) -> str:
+        safe_alias = hashlib.sha256(alias.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "aliases", safe_alias)
+
+    def _expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl
+
+    def put(self, transcript: str, url: str = "", alias: Optional[str] = None) -> str:
+        """
+        Store a transcript.
+
+        Args:
+            transcript: Transcript text
+            url: Source video URL
+            alias: Extra handle for the transcript, e.g. the extract session ID
+
+        Returns:
+            The transcript ID (SHA-256 of the text)
+        """
+        transcript_id = hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+        entry = {'transcript': transcript, 'url': url, 'created_at': time.time()}
+
+        with self._lock:
+            self._remember(transcript_id, entry)
+
+        try:
+            path = self._entry_path(transcript_id)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+
+            if alias:
+                with open(self._alias_path(alias), "w", encoding="utf-8") as f:
+                    f.write(transcript_id)
+        except OSError as e:
+            logger.warning(f"Could not spill transcript to disk: {str(e)}")
+
+        self._maybe_purge()
+        return transcript_id
+
+    def get(self, handle: str) -> Optional[Dict]:
+        """
+        Look up a transcript by transcript ID or alias.
+
+        Returns:
+            Dictionary with 'transcript_id', 'transcript', 'url' and 'created_at',
+            or None if the handle is unknown or expired
+        """
+        if not handle:
+            return None
+
+        transcript_id = handle
+        try:
+            with open(self._alias_path(handle), "r", encoding="utf-8") as f:
+                transcript_id = f.read().strip()
+        except OSError:
+            pass
+
+        with self._lock:
+            entry = self._memory.get(transcript_id)
+            if entry is not None:
+                if self._expired(entry['created_at']):
+                    self._forget(transcript_id)
+                    return None
+                self._memory.move_to_end(transcript_id)
+                return {'transcript_id': transcript_id, **entry}
+
+        # Only hex digests name files on disk; anything else is an unknown handle
+        if len(transcript_id) != 64 or not all(c in "0123456789abcdef" for c in transcript_id):
+            return None
+
+        try:
+            with open(self._entry_path(transcript_id), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._expired(entry['created_at']):
+            return None
+
+        with self._lock:
+            self._remember(transcript_id, entry)
+        return {'transcript_id': transcript_id, **entry}
+
+    def _remember(self, transcript_id: str, entry: Dict) -> None:
+        """Add an entry to the memory LRU, evicting old ones. Caller holds the lock."""
+        self._forget(transcript_id)
+        self._memory[transcript_id] = entry
+        self._memory_bytes += len(entry['transcript'])
+
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            oldest_id = next(iter(self._memory))
+            self._forget(oldest_id)
+
+    def _forget(self, transcript_id: str) -> None:
+        """Drop an entry from memory. Caller holds the lock."""
+        entry = self._memory.pop(transcript_id, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry['transcript'])
+
+    def _maybe_purge(self) -> None:
+        """Delete spilled files that have outlived the TTL."""
+        now = time.time()
+        if now - self._last_purge < _PURGE_INTERVAL:
+            return
+        self._last_purge = now
+
+        for folder in (self.directory, os.path.join(self.directory, "aliases")):
+            try:
+                names = os.listdir(folder)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(folder, name)
+                try:
+                    if os.path.isfile(path) and now - os.path.getmtime(path) > self.ttl:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+
+_store: Optional[TranscriptStore] = None
+_render_store: Optional[TranscriptStore] = None
+_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> TranscriptStore:
+    """Get the process-wide transcript store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TranscriptStore(
+                    os.path.join(DEFAULT_CACHE_DIR, "transcript_store"),
+                    max_memory_bytes=TRANSCRIPT_STORE_MAX_MEMORY_BYTES,
+                    ttl=TRANSCRIPT_STORE_TTL,
+                )
+    return _store
+
+
+def get_render_store() -> TranscriptStore:
+    """
+    Get the process-wide store of podcast render specs, creating it on first use.
+
+    Kept apart from the transcript store so a render handle is never
+    accepted as a transcript handle, or the other way round.
+    """
+    global _render_store
+    if _render_store is None:
+        with _store_lock:
+            if _render_store is None:
+                _render_store = TranscriptStore(
+                    os.path.join(DEFAULT_CACHE_DIR, "render_store"),
+                    max_memory_bytes=TRANSCRIPT_STORE_MAX_MEMORY_BYTES,
+                    ttl=TRANSCRIPT_STORE_TTL,
+                )
+    return _render_store
@@ -0,0 +1,361 @@
+"""
+Text-to-speech backends for VideoTranscript Pro.
+
+A backend turns one text segment into audio and describes how it wants to
+be driven: how many segments may be synthesized at once (max_workers) and
+how long each segment may be (max_chars). Backends are created once per
+process and chosen per request by name.
+"""
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from gtts import gTTS
+
+from ..config.settings import (
+    DEFAULT_LANGUAGE_CODE,
+    ELEVENLABS_API_KEY,
+    ELEVENLABS_MODEL,
+    ELEVENLABS_VOICE_MALE,
+    ELEVENLABS_VOICE_FEMALE,
+    ELEVENLABS_VOICE_MALE_ALT,
+    ELEVENLABS_VOICE_FEMALE_ALT,
+    ELEVENLABS_MAX_CONCURRENCY,
+    ELEVENLABS_SEGMENT_MAX_CHARS,
+    ESPEAK_BINARY,
+    ESPEAK_WORDS_PER_MINUTE,
+    TTS_BACKEND,
+    TTS_WORKERS,
+    TTS_SEGMENT_MAX_CHARS,
+)
+
+# Size placeholder for WAV headers written before the length is known
+_WAV_UNKNOWN_SIZE = 0xFFFFFFFF
+
+
+class TTSBackend(ABC):
+    """Base class for speech engines; subclasses implement synthesize."""
+
+    name = "base"
+    audio_format = "mp3"
+    mimetype = "audio/mpeg"
+    # Whether the gender preference changes the voices
+    supports_gender = True
+
+    def __init__(self, max_workers: int = TTS_WORKERS, max_chars: int = TTS_SEGMENT_MAX_CHARS):
+        # Concurrency and batching hints for the segment synthesizer
+        self.max_workers = max_workers
+        self.max_chars = max_chars
+
+    def is_available(self) -> bool:
+        """Whether the backend can synthesize in this environment."""
+        return True
+
+    def voice_for(self, gender: str = "mixed") -> Optional[str]:
+        """Pick a voice for a gender preference; None means the backend default."""
+        return None
+
+    def host_voices(self, gender: str = "mixed") -> List[Optional[str]]:
+        """
+        Pick distinct voices for the podcast hosts.
+
+        Args:
+            gender: 'male' or 'female' for two voices of that gender, or
+                'mixed' for one of each
+
+        Returns:
+            Voices for Host1 and Host2, in that order
+        """
+        return [self.voice_for(gender)]
+
+    def cache_voice(self, voice: Optional[str] = None) -> str:
+        """Identifier for a voice of this backend in the TTS cache."""
+        return f"{self.name}:{voice}" if voice else self.name
+
+    @abstractmethod
+    def synthesize(self, text: str, lang: str = DEFAULT_LANGUAGE_CODE, voice: Optional[str] = None) -> bytes:
+        """
+        Synthesize one segment.
+
+        Args:
+            text: Segment text
+            lang: Language code
+            voice: Backend-specific voice, or None for the default
+
+        Returns:
+            Audio bytes in audio_format
+        """
+
+    def frame(self, audio: bytes, first: bool) -> bytes:
+        """
+        Prepare a segment's audio to be appended to the ones before it.
+
+        Args:
+            audio: Audio returned by synthesize
+            first: Whether this is the first segment of the file
+
+        Returns:
+            Bytes to write; concatenated in order they form one audio stream
+        """
+        return audio if first else strip_id3(audio)
+
+    def finalize(self, path: str) -> None:
+        """Fix up a file written from framed segments once it is complete."""
+
+
+class GTTSBackend(TTSBackend):
+    """
+    Google Translate speech through gTTS.
+
+    There is one voice per language; the voice selects a regional accent by
+    Google domain (e.g. 'co.uk'), which is how the hosts are told apart.
+    Gender is not supported.
+    """
+
+    name = "gtts"
+    supports_gender = False
+
+    def host_voices(self, gender: str = "mixed") -> List[Optional[str]]:
+        # Default (US) accent for Host1, British for Host2
+        return [None, "co.uk"]
+
+    def synthesize(self, text: str, lang: str = DEFAULT_LANGUAGE_CODE, voice: Optional[str] = None) -> bytes:
+        buffer = BytesIO()
+        gTTS(text=text, lang=lang, tld=voice or "com", slow=False).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class ElevenLabsBackend(TTSBackend):
+    """ElevenLabs text-to-speech over its HTTP API."""
+
+    name = "elevenlabs"
+    api_url = "https://api.elevenlabs.io/v1/text-to-speech"
+
+    def __init__(self, api_key: str = ELEVENLABS_API_KEY, model: str = ELEVENLABS_MODEL):
+        super().__init__(max_workers=ELEVENLABS_MAX_CONCURRENCY, max_chars=ELEVENLABS_SEGMENT_MAX_CHARS)
+        self.api_key = api_key
+        self.model = model
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return bool(self.api_key)
+
+    def voice_for(self, gender: str = "mixed") -> Optional[str]:
+        return ELEVENLABS_VOICE_FEMALE if gender == "female" else ELEVENLABS_VOICE_MALE
+
+    def host_voices(self, gender: str = "mixed") -> List[Optional[str]]:
+        if gender == "male":
+            return [ELEVENLABS_VOICE_MALE, ELEVENLABS_VOICE_MALE_ALT]
+        if gender == "female":
+            return [ELEVENLABS_VOICE_FEMALE, ELEVENLABS_VOICE_FEMALE_ALT]
+        return [ELEVENLABS_VOICE_MALE, ELEVENLABS_VOICE_FEMALE]
+
+    def cache_voice(self, voice: Optional[str] = None) -> str:
+        # The same voice sounds different on each model
+        return f"{self.name}:{self.model}:{voice or self.voice_for()}"
+
+    def _get_client(self) -> httpx.Client:
+        """Keep-alive HTTP client shared by all synthesis threads."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        headers={"xi-api-key": self.api_key},
+                        limits=httpx.Limits(max_connections=max(1, self.max_workers)),
+                        timeout=60,
+                    )
+        return self._client
+
+    def synthesize(self, text: str, lang: str = DEFAULT_LANGUAGE_CODE, voice: Optional[str] = None) -> bytes:
+        if not self.api_key:
+            raise RuntimeError("ELEVENLABS_API_KEY is not set")
+
+        # Multilingual models detect the language from the text
+        response = self._get_client().post(
+            f"{self.api_url}/{voice or self.voice_for()}",
+            params={"output_format": "mp3_44100_128"},
+            json={"text": text, "model_id": self.model},
+        )
+        response.raise_for_status()
+        return response.content
+
+
+class EspeakBackend(TTSBackend):
+    """Local espeak-ng engine. Needs no network, so it suits offline and load testing."""
+
+    name = "espeak"
+    audio_format = "wav"
+    mimetype = "audio/wav"
+
+    def __init__(self, binary: str = ESPEAK_BINARY, words_per_minute: int = ESPEAK_WORDS_PER_MINUTE):
+        # One process per segment, bounded by the CPUs available
+        super().__init__(max_workers=os.cpu_count() or TTS_WORKERS)
+        self.binary = binary
+        self.words_per_minute = words_per_minute
+
+    def _find_binary(self) -> Optional[str]:
+        return shutil.which(self.binary) or shutil.which("espeak")
+
+    def is_available(self) -> bool:
+        return self._find_binary() is not None
+
+    def voice_for(self, gender: str = "mixed") -> Optional[str]:
+        return "f3" if gender == "female" else "m3"
+
+    def host_voices(self, gender: str = "mixed") -> List[Optional[str]]:
+        if gender == "male":
+            return ["m3", "m1"]
+        if gender == "female":
+            return ["f3", "f1"]
+        return ["m3", "f3"]
+
+    def cache_voice(self, voice: Optional[str] = None) -> str:
+        return f"{self.name}:{voice or self.voice_for()}:{self.words_per_minute}"
+
+    def synthesize(self, text: str, lang: str = DEFAULT_LANGUAGE_CODE, voice: Optional[str] = None) -> bytes:
+        binary = self._find_binary()
+        if binary is None:
+            raise RuntimeError(f"{self.binary} is not installed")
+
+        # espeak voices are "<language>+<variant>", e.g. "en+m3"
+        result = subprocess.run(
+            [binary, "-v", f"{lang}+{voice or self.voice_for()}", "-s", str(self.words_per_minute),
+             "--stdout", "--stdin"],
+            input=text.encode("utf-8"),
+            capture_output=True,
+            timeout=60,
+            check=True,
+        )
+        return result.stdout
+
+    def frame(self, audio: bytes, first: bool) -> bytes:
+        fmt, data = split_wav(audio)
+        if not first:
+            return data
+        # The total length isn't known yet; finalize() writes the real sizes
+        return wav_header(fmt, _WAV_UNKNOWN_SIZE) + data
+
+    def finalize(self, path: str) -> None:
+        with open(path, "r+b") as f:
+            header = f.read(4096)
+            data_offset = _find_wav_data(header)[1]
+            size = os.fstat(f.fileno()).st_size
+            f.seek(4)
+            f.write(struct.pack("<I", size - 8))
+            f.seek(data_offset - 4)
+            f.write(struct.pack("<I", size - data_offset))
+
+
+def strip_id3(audio: bytes) -> bytes:
+    """Drop a leading ID3v2 tag so MP3 segments can be joined frame to frame."""
+    if len(audio) >= 10 and audio[:3] == b"ID3":
+        size = (audio[6] << 21) | (audio[7] << 14) | (audio[8] << 7) | audio[9]
+        return audio[10 + size:]
+    return audio
+
+
+def _find_wav_data(audio: bytes) -> Tuple[bytes, int]:
+    """Find the fmt chunk body and the offset of the PCM data in a WAV file."""
+    if audio[:4] != b"RIFF" or audio[8:12] != b"WAVE":
+        raise ValueError("Not a WAV file")
+
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(audio):
+        chunk_id = audio[pos:pos + 4]
+        size = struct.unpack("<I", audio[pos + 4:pos + 8])[0]
+        if chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV file has no fmt chunk")
+            return fmt, pos + 8
+        if chunk_id == b"fmt ":
+            fmt = audio[pos + 8:pos + 8 + size]
+        pos += 8 + size + (size & 1)
+    raise ValueError("WAV file has no data chunk")
+
+
+def split_wav(audio: bytes) -> Tuple[bytes, bytes]:
+    """
+    Split a WAV file into its format and PCM data.
+
+    The data runs to the end of the file, since streamed WAV output often
+    carries placeholder sizes.
+
+    Args:
+        audio: WAV file bytes
+
+    Returns:
+        (fmt chunk body, PCM data)
+    """
+    fmt, offset = _find_wav_data(audio)
+    return fmt, audio[offset:]
+
+
+def wav_header(fmt: bytes, data_size: int) -> bytes:
+    """Build a WAV header for a fmt chunk body and data size."""
+    riff_size = _WAV_UNKNOWN_SIZE if data_size == _WAV_UNKNOWN_SIZE else 4 + 8 + len(fmt) + 8 + data_size
+    return (
+        b"RIFF" + struct.pack("<I", riff_size) + b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"data" + struct.pack("<I", data_size)
+    )
+
+
+_BACKEND_CLASSES = {
+    GTTSBackend.name: GTTSBackend,
+    ElevenLabsBackend.name: ElevenLabsBackend,
+    EspeakBackend.name: EspeakBackend,
+}
+
+_backends: Dict[str, TTSBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_tts_backend(name: Optional[str] = None) -> TTSBackend:
+    """
+    Get the shared instance of a TTS backend.
+
+    Args:
+        name: Backend name ('gtts', 'elevenlabs' or 'espeak'); defaults to TTS_BACKEND
+
+    Returns:
+        The backend, created on first use
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    name = (name or TTS_BACKEND).lower()
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown TTS backend '{name}'. Choose one of: {', '.join(_BACKEND_CLASSES)}")
+
+    backend = _backends.get(name)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(name)
+            if backend is None:
+                backend = _backends[name] = _BACKEND_CLASSES[name]()
+    return backend
+
+
+def list_tts_backends() -> List[Dict]:
+    """Describe every backend and whether it is usable here."""
+    backends = []
+    for name in _BACKEND_CLASSES:
+        backend = get_tts_backend(name)
+        backends.append({
+            'name': name,
+            'available': backend.is_available(),
+            'format': backend.audio_format,
+            'max_workers': backend.max_workers,
+            'max_chars': backend.max_chars,
+            'supports_gender': backend.supports_gender,
+            'default': name == TTS_BACKEND,
+        })
+    return backends
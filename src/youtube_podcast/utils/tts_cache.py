@@ -0,0 +1,98 @@
+"""
+Speech segment cache for VideoTranscript Pro.
+Keeps synthesized MP3 segments on disk, keyed by text, voice and language.
+"""
+import os
+import re
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict
+
+from .disk_cache import DiskCache
+from ..config.settings import (
+    DEFAULT_CACHE_DIR,
+    TTS_CACHE_ENABLED,
+    TTS_CACHE_TTL,
+    TTS_CACHE_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional[DiskCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> DiskCache:
+    """Get the process-wide speech segment cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DiskCache(
+                    os.path.join(DEFAULT_CACHE_DIR, "tts_segments.sqlite3"),
+                    max_bytes=TTS_CACHE_MAX_BYTES,
+                    ttl=TTS_CACHE_TTL,
+                )
+    return _cache
+
+
+def _cache_key(text: str, voice: str, language: str) -> str:
+    # Whitespace differences don't change the audio
+    normalized = re.sub(r'\s+', ' ', text).strip()
+    digest = hashlib.sha256(f"{voice}\0{language}\0{normalized}".encode("utf-8")).hexdigest()
+    return f"{voice}:{language}:{digest}"
+
+
+def get_cached_segment(text: str, voice: str, language: str) -> Optional[bytes]:
+    """
+    Look up synthesized audio for a segment.
+
+    Args:
+        text: Segment text
+        voice: TTS backend and voice identifier, e.g. 'gtts'
+        language: Language code
+
+    Returns:
+        MP3 bytes, or None on a miss
+    """
+    if not TTS_CACHE_ENABLED:
+        return None
+
+    try:
+        return get_tts_cache().get(_cache_key(text, voice, language))
+    except Exception as e:
+        logger.warning(f"TTS cache lookup failed: {str(e)}")
+        return None
+
+
+def cache_segment(text: str, voice: str, language: str, audio: bytes, cost: float = 0.0) -> None:
+    """
+    Store synthesized audio for a segment.
+
+    Args:
+        text: Segment text
+        voice: TTS backend and voice identifier
+        language: Language code
+        audio: MP3 bytes
+        cost: Seconds the synthesis took
+    """
+    if not TTS_CACHE_ENABLED:
+        return
+
+    try:
+        get_tts_cache().set(_cache_key(text, voice, language), audio, cost=cost)
+    except Exception as e:
+        logger.warning(f"TTS cache store failed: {str(e)}")
+
+
+def get_tts_cache_stats() -> Dict:
+    """Return hit/miss counters for the speech segment cache."""
+    if not TTS_CACHE_ENABLED:
+        return {'enabled': False}
+
+    try:
+        return {'enabled': True, **get_tts_cache().stats()}
+    except Exception as e:
+        logger.warning(f"TTS cache stats failed: {str(e)}")
+        return {'enabled': True, 'error': str(e)}
@@ -1,6 +1,13 @@
 from youtube_transcript_api import YouTubeTranscriptApi
-from typing import Optional, Union
+from typing import Optional, Union, List, Dict, Callable, Any
+from concurrent.futures import Future
+import threading
+import time
 from ..models.state import AgentState
+from ..models.transcript import Transcript
+from ..config.settings import DEFAULT_LANGUAGE_CODE
+from .transcript_cache import get_cached_transcript, cache_transcript
+from .tracing import span
 
 def extract_video_id(url: str) -> str:
     """Extract the YouTube video ID from a URL."""
@@ -11,12 +18,89 @@ def extract_video_id(url: str) -> str:
     else:
         raise ValueError("Invalid YouTube URL format")
 
-def fetch_transcript(video_url_or_state: Union[str, AgentState]) -> Optional[str]:
+# Fetches currently in progress, keyed by (video_id, language)
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+def _single_flight(key: tuple, fetch: Callable[[], Any]) -> Any:
+    """
+    Run fetch once for all concurrent callers with the same key.
+    
+    The first caller performs the fetch; callers arriving while it is in
+    flight wait for it and receive the same result or exception.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+def get_transcript_segments(video_id: str, language: str = DEFAULT_LANGUAGE_CODE) -> List[Dict]:
+    """
+    Get raw transcript segments for a video, serving repeated videos from the cache.
+    
+    Concurrent cache misses for the same video share a single YouTube request.
+    
+    Args:
+        video_id: YouTube video ID
+        language: Transcript language code
+        
+    Returns:
+        List of segments with 'text', 'start' and 'duration'
+    """
+    segments = get_cached_transcript(video_id, language)
+    if segments is not None:
+        return segments
+    
+    def fetch() -> List[Dict]:
+        started = time.monotonic()
+        fetched = YouTubeTranscriptApi.get_transcript(video_id, languages=[language])
+        cache_transcript(video_id, language, fetched, cost=time.monotonic() - started)
+        return fetched
+    
+    return _single_flight((video_id, language), fetch)
+
+def fetch_transcript_segments(video_url: str, language: str = DEFAULT_LANGUAGE_CODE) -> Optional[Transcript]:
+    """
+    Fetch a timestamped transcript from a YouTube video URL.
+    
+    Args:
+        video_url: YouTube video URL
+        language: Transcript language code
+        
+    Returns:
+        A Transcript with segment timings, or None if fetching fails
+    """
+    try:
+        video_id = extract_video_id(video_url).strip()
+        return Transcript.from_segments(get_transcript_segments(video_id, language))
+    except Exception as e:
+        print(f"Error fetching transcript: {str(e)}")
+        return None
+
+def fetch_transcript(video_url_or_state: Union[str, AgentState], language: str = DEFAULT_LANGUAGE_CODE) -> Optional[str]:
     """
     Fetch transcript from a YouTube video URL.
     
     Args:
         video_url_or_state: Either a YouTube URL string or an AgentState containing the URL
+        language: Transcript language code
         
     Returns:
         The transcript text if successful, None otherwise
@@ -27,14 +111,17 @@ def fetch_transcript(video_url_or_state: Union[str, AgentState]) -> Optional[str
             video_url = video_url_or_state['url']
         else:
             video_url = video_url_or_state
-            
-        video_id = extract_video_id(video_url)
-        transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        text = " ".join([entry['text'] for entry in transcript])
-        return text
     except Exception as e:
         print(f"Error fetching transcript: {str(e)}")
         return None
+    
+    with span("transcript.fetch", "client", url=video_url, language=language) as current:
+        transcript = fetch_transcript_segments(video_url, language)
+        if transcript is None:
+            current.record_error("No transcript found")
+            return None
+        current.set_attribute("chars", len(transcript.text))
+        return transcript.text
 
 def update_transcript_in_state(state: AgentState) -> AgentState:
     """Update the state with the fetched transcript."""
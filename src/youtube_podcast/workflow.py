@@ -1,10 +1,18 @@
 from langgraph.graph import StateGraph, START, END
 from .agents.transcript_agent import get_url_input, fetch_transcript, get_output_preferences
 from .agents.summary_agent import generate_summary
-from .agents.podcast_agent import create_conversation, generate_podcast
-from typing import Dict
+from .agents.podcast_agent import (
+    create_conversation, generate_podcast, generate_podcast_pipelined,
+    podcast_checkpoint_id, resume_from_checkpoint
+)
+from typing import Annotated, Callable, Dict, List, Optional, Union
 import os
+import threading
 from datetime import datetime
+from functools import wraps
+
+from .config.settings import PODCAST_PIPELINE_ENABLED
+from .utils.tracing import span
 
 try:
     from .config.settings import DEFAULT_OUTPUT_DIR
@@ -13,21 +21,114 @@ except ImportError:
     DEFAULT_OUTPUT_DIR = os.path.join(os.getcwd(), "output")
     os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
 
-def determine_output_path(state: Dict) -> str:
+# Output types a run can ask for; "both" fans out to the summary and podcast branches
+OUTPUT_TYPES = ("summary", "podcast", "both")
+_FAN_OUT = ["summary_branch", "podcast_branch"]
+
+def merge_state(current: Dict, update: Dict) -> Dict:
+    """Reducer for the workflow state: updates from parallel branches are merged."""
+    return {**current, **update}
+
+# Nodes return the whole state or, on the fan-out branches, only what they changed
+WorkflowState = Annotated[dict, merge_state]
+
+def traced_node(name: str, node: Callable[[Dict], Dict]) -> Callable[[Dict], Dict]:
+    """
+    Run a graph node in a 'node.<name>' span.
+    
+    Nodes report failures in the state rather than raising, so an error
+    the node adds to the state also marks the span as failed.
+    """
+    @wraps(node)
+    def run(state: Dict) -> Dict:
+        with span(f"node.{name}", output_type=state.get("output_type", "")) as current:
+            errors_before = {key: value for key, value in state.items() if key.endswith("error")}
+            result = node(state)
+            for key, value in result.items():
+                if key.endswith("error") and value and value != errors_before.get(key):
+                    current.record_error(value)
+            return result
+    return run
+
+def determine_output_path(state: Dict) -> Union[str, List[str]]:
     """Determine which path to take based on user's choice."""
+    if state["output_type"] == "both":
+        return _FAN_OUT
     return state["output_type"]
 
+def _use_pipeline(state: Dict) -> bool:
+    pipelined = state.get("pipelined")
+    return pipelined if pipelined is not None else PODCAST_PIPELINE_ENABLED
+
+def _changes(before: Dict, after: Dict, branch: str) -> Dict:
+    """What a branch changed, with its status and error under branch-specific keys."""
+    update = {
+        key: value for key, value in after.items()
+        if key not in ("status", "error") and (key not in before or before[key] is not value)
+    }
+    update[f"{branch}_status"] = after.get("status")
+    update[f"{branch}_error"] = after.get("error")
+    return update
+
+def summary_branch(state: Dict) -> Dict:
+    """Summary side of a "both" run, working on its own copy of the state."""
+    return _changes(state, generate_summary(dict(state)), "summary")
+
+def podcast_branch(state: Dict) -> Dict:
+    """Podcast side of a "both" run, working on its own copy of the state."""
+    branch_state = dict(state)
+    if _use_pipeline(branch_state):
+        branch_state = generate_podcast_pipelined(branch_state)
+    else:
+        branch_state = create_conversation(branch_state)
+        if not branch_state.get("error"):
+            branch_state = generate_podcast(branch_state)
+    return _changes(state, branch_state, "podcast")
+
+def join_outputs(state: Dict) -> Dict:
+    """Combine the outcome of the summary and podcast branches."""
+    errors = [
+        f"{branch}: {state[f'{branch}_error']}"
+        for branch in ("summary", "podcast") if state.get(f"{branch}_error")
+    ]
+    if errors:
+        state["error"] = "; ".join(errors)
+        state["status"] = "error"
+    else:
+        state["status"] = "summary_and_podcast_generated"
+    return state
+
+def fetch_transcript_if_missing(state: Dict) -> Dict:
+    """Fetch the transcript unless the caller already supplied one or the run is resuming."""
+    if state.get("status") == "conversation_created":
+        return state
+    if state.get("transcript"):
+        state["status"] = "transcript_fetched"
+        return state
+    return fetch_transcript(state)
+
+def route_headless(state: Dict) -> str:
+    """Stop on a failed fetch, otherwise take the requested output path."""
+    if state.get("error"):
+        return "error"
+    if state["output_type"] == "podcast" and state["status"] == "conversation_created":
+        return "resume_podcast"
+    if state["output_type"] == "podcast" and _use_pipeline(state):
+        return "podcast_pipelined"
+    return determine_output_path(state)
+
 def create_workflow() -> StateGraph:
     """Create a workflow graph with conditional branches."""
-    workflow = StateGraph(Dict)
+    workflow = StateGraph(WorkflowState)
     
     # Add nodes
-    workflow.add_node("get_url_node", get_url_input)
-    workflow.add_node("fetch_transcript_node", fetch_transcript)
-    workflow.add_node("get_preferences_node", get_output_preferences)
-    workflow.add_node("summary_node", generate_summary)
-    workflow.add_node("conversation_node", create_conversation)
-    workflow.add_node("podcast_node", generate_podcast)
+    workflow.add_node("get_url_node", traced_node("get_url_node", get_url_input))
+    workflow.add_node("fetch_transcript_node", traced_node("fetch_transcript_node", fetch_transcript))
+    workflow.add_node("get_preferences_node", traced_node("get_preferences_node", get_output_preferences))
+    workflow.add_node("summary_node", traced_node("summary_node", generate_summary))
+    workflow.add_node("conversation_node", traced_node("conversation_node", create_conversation))
+    workflow.add_node("podcast_node", traced_node("podcast_node", generate_podcast))
+    _add_fan_out_nodes(workflow)
     
     # Add edges
     workflow.add_edge(START, "get_url_node")
@@ -40,7 +141,9 @@ def create_workflow() -> StateGraph:
         determine_output_path,
         {
             "summary": "summary_node",
-            "podcast": "conversation_node"
+            "podcast": "conversation_node",
+            "summary_branch": "summary_branch_node",
+            "podcast_branch": "podcast_branch_node"
         }
     )
     
@@ -52,6 +155,76 @@ def create_workflow() -> StateGraph:
     # Compile the workflow
     return workflow.compile()
 
+def _add_fan_out_nodes(workflow: StateGraph) -> None:
+    """Add the parallel summary and podcast branches and the node joining them."""
+    workflow.add_node("summary_branch_node", traced_node("summary_branch_node", summary_branch))
+    workflow.add_node("podcast_branch_node", traced_node("podcast_branch_node", podcast_branch))
+    workflow.add_node("join_node", traced_node("join_node", join_outputs))
+    # The join waits for both branches, which run in the same step
+    workflow.add_edge(["summary_branch_node", "podcast_branch_node"], "join_node")
+    workflow.add_edge("join_node", END)
+
+def create_headless_workflow() -> StateGraph:
+    """
+    Create a workflow graph that never prompts.
+    
+    The URL, output type and voice come in with the initial state, so the
+    graph starts at the transcript fetch and skips it when a transcript
+    is already present.
+    """
+    workflow = StateGraph(WorkflowState)
+    
+    workflow.add_node("fetch_transcript_node", traced_node("fetch_transcript_node", fetch_transcript_if_missing))
+    workflow.add_node("summary_node", traced_node("summary_node", generate_summary))
+    workflow.add_node("conversation_node", traced_node("conversation_node", create_conversation))
+    workflow.add_node("podcast_node", traced_node("podcast_node", generate_podcast))
+    workflow.add_node("podcast_pipeline_node", traced_node("podcast_pipeline_node", generate_podcast_pipelined))
+    _add_fan_out_nodes(workflow)
+    
+    workflow.add_edge(START, "fetch_transcript_node")
+    workflow.add_conditional_edges(
+        "fetch_transcript_node",
+        route_headless,
+        {
+            "summary": "summary_node",
+            "podcast": "conversation_node",
+            "podcast_pipelined": "podcast_pipeline_node",
+            "resume_podcast": "podcast_node",
+            "summary_branch": "summary_branch_node",
+            "podcast_branch": "podcast_branch_node",
+            "error": END
+        }
+    )
+    
+    workflow.add_edge("summary_node", END)
+    workflow.add_edge("conversation_node", "podcast_node")
+    workflow.add_edge("podcast_node", END)
+    workflow.add_edge("podcast_pipeline_node", END)
+    
+    return workflow.compile()
+
+# Compiled graphs hold no per-run state, so one of each serves every run
+_workflows = {}
+_workflows_lock = threading.Lock()
+
+def get_workflow(interactive: bool = False):
+    """
+    Get the compiled workflow, compiling it on first use.
+    
+    Args:
+        interactive: The graph that prompts for the URL and preferences
+            instead of the headless one
+    
+    Returns:
+        The compiled graph, safe to invoke from several threads at once
+    """
+    with _workflows_lock:
+        workflow = _workflows.get(interactive)
+        if workflow is None:
+            workflow = create_workflow() if interactive else create_headless_workflow()
+            _workflows[interactive] = workflow
+        return workflow
+
 def initialize_state() -> Dict:
     """
     Initialize the state dictionary with default values.
@@ -88,8 +261,44 @@ def run_workflow():
     # Initialize the state
     initial_state = initialize_state()
     
-    # Create and run the workflow
-    workflow = create_workflow()
-    final_state = workflow.invoke(initial_state)
+    # Run the workflow
+    workflow = get_workflow(interactive=True)
+    with span("workflow.run", interactive=True):
+        final_state = workflow.invoke(initial_state)
+    
+    return final_state
+
+def run_headless(url: str = "", output_type: str = "summary", gender: str = "mixed",
+                 tts_backend: Optional[str] = None, **overrides) -> Dict:
+    """
+    Run the workflow without prompting.
+    
+    Args:
+        url: YouTube video URL
+        output_type: 'summary', 'podcast' or 'both'
+        gender: Podcast voice, 'male', 'female' or 'mixed'
+        tts_backend: Speech engine; None for TTS_BACKEND
+        **overrides: Any other state keys, e.g. 'transcript' to skip the
+            fetch, 'use_cache', 'title_strategy', 'pipelined' or
+            'checkpoint_id'. Podcasts are checkpointed under a content ID
+            by default, so rerunning a failed one resumes it.
+    
+    Returns:
+        Dict: The final state; check 'error' for failures
+    """
+    if output_type not in OUTPUT_TYPES:
+        raise ValueError(f"Unknown output type: {output_type}")
+    
+    initial_state = initialize_state()
+    initial_state.update(url=url, output_type=output_type, gender=gender, tts_backend=tts_backend, **overrides)
+    
+    if output_type == "podcast":
+        initial_state.setdefault("checkpoint_id", podcast_checkpoint_id(initial_state))
+        if initial_state.get("use_cache", True):
+            initial_state = resume_from_checkpoint(initial_state)
     
+    with span("workflow.run", output_type=output_type, url=url) as current:
+        final_state = get_workflow().invoke(initial_state)
+        if final_state.get("error"):
+            current.record_error(final_state["error"])
     return final_state
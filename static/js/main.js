@@ -69,49 +69,72 @@ window.generateSummary = async function (sessionId) {
 
   resultsSection.innerHTML = `
         <div class="result-card">
-            <h2>Generating Summary...</h2>
-            <div class="spinner"></div>
-            <p class="text-center">This may take a few moments...</p>
+            <h2>📄 Summary</h2>
+            <h3 id="summary-title" style="margin: 1rem 0; color: #6366f1;">Generating summary...</h3>
+            <div style="max-height: 500px; overflow-y: auto; padding: 1rem; background: #f9fafb; border-radius: 0.5rem; margin: 1rem 0;">
+                <p id="summary-text" style="white-space: pre-wrap; line-height: 1.8;"></p>
+            </div>
         </div>
     `;
 
+  const titleEl = document.getElementById("summary-title");
+  const textEl = document.getElementById("summary-text");
+
+  const handleEvent = (event, data) => {
+    if (event === "token") {
+      textEl.textContent += data.text;
+    } else if (event === "title") {
+      titleEl.textContent = data.title;
+    } else if (event === "done") {
+      window.currentSummary = data.summary;
+      window.currentSummaryTitle = data.title;
+      showAlert("Summary generated successfully!", "success");
+    } else if (event === "error") {
+      throw new Error(data.error);
+    }
+  };
+
   try {
-    const response = await fetch("/generate-summary", {
+    const response = await fetch("/generate-summary/stream", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({
-        transcript: window.currentTranscript,
+        transcript_id: window.currentTranscriptId,
         session_id: sessionId,
         url: document.getElementById("youtube-url").value,
       }),
     });
 
-    const data = await response.json();
-
-    if (data.success) {
-      resultsSection.innerHTML = `
-                <div class="result-card">
-                    <h2>📄 Summary</h2>
-                    <h3 style="margin: 1rem 0; color: #6366f1;">${escapeHtml(
-                      data.title
-                    )}</h3>
-                    <div style="max-height: 500px; overflow-y: auto; padding: 1rem; background: #f9fafb; border-radius: 0.5rem; margin: 1rem 0;">
-                        <p style="white-space: pre-wrap; line-height: 1.8;">${escapeHtml(
-                          data.summary
-                        )}</p>
-                    </div>
-                </div>
-            `;
+    if (!response.ok) {
+      const data = await response.json().catch(() => ({}));
+      throw new Error(data.error || "Failed to generate summary");
+    }
 
-      window.currentSummary = data.summary;
-      window.currentSummaryTitle = data.title;
-      showAlert("Summary generated successfully!", "success");
-    } else {
-      showAlert(data.error || "Failed to generate summary", "error");
-      window.showTranscript(window.currentTranscript, sessionId);
+    // Server-sent events, separated by blank lines
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = "message";
+        let data = "";
+        for (const line of block.split("\n")) {
+          if (line.startsWith("event: ")) event = line.slice(7);
+          else if (line.startsWith("data: ")) data += line.slice(6);
+        }
+        handleEvent(event, data ? JSON.parse(data) : {});
+      }
     }
   } catch (err) {
-    showAlert("Error generating summary", "error");
+    showAlert(err.message || "Error generating summary", "error");
     window.showTranscript(window.currentTranscript, sessionId);
   }
 };
@@ -128,8 +151,22 @@ window.showPodcastOptions = function (sessionId) {
                 <button class="btn btn-primary" onclick="window.generatePodcast('${sessionId}', 'male')">Male Voice</button>
                 <button class="btn btn-primary" onclick="window.generatePodcast('${sessionId}', 'female')">Female Voice</button>
             </div>
+            <p id="voice-note" class="hidden"></p>
         </div>
     `;
+
+  // Some speech engines have one voice per accent rather than per gender
+  fetch("/api/tts/backends")
+    .then((response) => response.json())
+    .then((data) => {
+      const backend = (data.backends || []).find((b) => b.default);
+      const note = document.getElementById("voice-note");
+      if (!backend || backend.supports_gender || !note) return;
+      note.textContent =
+        "The current speech engine has no male or female voices, so both options sound the same.";
+      note.classList.remove("hidden");
+    })
+    .catch(() => {});
 };
 
 window.generatePodcast = async function (sessionId, gender) {
@@ -145,11 +182,11 @@ window.generatePodcast = async function (sessionId, gender) {
     `;
 
   try {
-    const response = await fetch("/generate-podcast", {
+    const response = await fetch("/generate-podcast/stream", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({
-        transcript: window.currentTranscript,
+        transcript_id: window.currentTranscriptId,
         session_id: sessionId,
         gender,
         url: document.getElementById("youtube-url").value,
@@ -165,8 +202,8 @@ window.generatePodcast = async function (sessionId, gender) {
                     <h3 style="margin: 1rem 0; color: #6366f1;">${escapeHtml(
                       data.title
                     )}</h3>
-                    <audio controls style="width: 100%; margin: 1.5rem 0;">
-                        <source src="${data.audio_url}" type="audio/mpeg" />
+                    <audio id="podcast-audio" controls style="width: 100%; margin: 1.5rem 0;">
+                        <source src="${data.stream_url}" type="${data.audio_mimetype || "audio/mpeg"}" />
                         Your browser does not support the audio element.
                     </audio>
                     <div style="max-height: 400px; overflow-y: auto; padding: 1rem; background: #f9fafb; border-radius: 0.5rem; margin: 1.5rem 0;">
@@ -179,6 +216,10 @@ window.generatePodcast = async function (sessionId, gender) {
             `;
 
       window.currentConversation = data.conversation;
+
+      // Audio streams in as it is synthesized; start playing as soon as possible
+      const audio = document.getElementById("podcast-audio");
+      if (audio) audio.play().catch(() => {});
       showAlert("Podcast generated successfully!", "success");
     } else {
       showAlert(data.error || "Failed to generate podcast", "error");
@@ -258,6 +299,7 @@ window.extractTranscript = async function() {
     const data = await response.json();
 
     if (data.success) {
+      window.currentTranscriptId = data.transcript_id;
       window.showTranscript(data.transcript, data.session_id);
       showAlert("Transcript extracted successfully!", "success");
     } else {
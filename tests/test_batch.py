@@ -0,0 +1,19 @@
+import pytest
+
+from src.youtube_podcast.batch import build_parser
+from src.youtube_podcast.utils.tts_backends import list_tts_backends
+
+
+@pytest.mark.parametrize("name", [backend["name"] for backend in list_tts_backends()])
+def test_every_tts_backend_is_a_valid_choice(name):
+    args = build_parser().parse_args(["urls.txt", "--tts-backend", name])
+    assert args.tts_backend == name
+
+
+def test_unknown_tts_backend_is_rejected():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["urls.txt", "--tts-backend", "nope"])
+
+
+def test_tts_backend_defaults_to_setting():
+    assert build_parser().parse_args(["urls.txt"]).tts_backend is None
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from src.youtube_podcast.utils import disk_cache
+from src.youtube_podcast.utils.disk_cache import DiskCache
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    def make(max_bytes=1000, ttl=None):
+        return DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=max_bytes, ttl=ttl)
+    return make
+
+
+def _accessed_at(cache, key):
+    return cache._conn.execute("SELECT accessed_at FROM entries WHERE key = ?", (key,)).fetchone()[0]
+
+
+def test_running_size_tracks_sets_replaces_and_deletes(make_cache):
+    cache = make_cache()
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 20)
+    cache.set("a", b"x" * 5)
+    cache.delete("b")
+    cache.delete("missing")
+
+    assert cache._size == cache._total_size() == 5
+    assert make_cache()._size == 5
+
+
+def test_least_recently_used_entries_are_evicted(make_cache, monkeypatch):
+    monkeypatch.setattr(disk_cache, "_TOUCH_INTERVAL", 0)
+    cache = make_cache(max_bytes=30)
+    for key in ("a", "b", "c"):
+        cache.set(key, b"x" * 10)
+        time.sleep(0.01)
+    assert cache.get("a") is not None
+
+    cache.set("d", b"x" * 10)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache._size == cache._total_size() == 30
+
+
+def test_hits_only_touch_entries_after_the_interval(make_cache, monkeypatch):
+    cache = make_cache()
+    cache.set("a", b"value")
+    stored = _accessed_at(cache, "a")
+
+    assert cache.get("a") == b"value"
+    assert _accessed_at(cache, "a") == stored
+
+    monkeypatch.setattr(disk_cache, "_TOUCH_INTERVAL", 0)
+    assert cache.get("a") == b"value"
+    assert _accessed_at(cache, "a") > stored
+
+
+def test_expired_entries_leave_the_running_size(make_cache):
+    cache = make_cache(ttl=60)
+    cache.set("old", b"x" * 10)
+    cache._conn.execute("UPDATE entries SET created_at = ?", (time.time() - 120,))
+    cache._conn.commit()
+
+    cache.set("new", b"x" * 4)
+
+    assert cache.get("old") is None
+    assert cache._size == cache._total_size() == 4
+    assert cache.stats()["evictions"] == 1
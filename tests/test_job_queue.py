@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from src.youtube_podcast.utils import job_queue as job_queue_module
+from src.youtube_podcast.utils.job_queue import JobQueue
+
+
+def _wait_for(queue, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    def make(retention=None):
+        return JobQueue(str(tmp_path / "jobs.sqlite3"), max_workers=1, retention=retention)
+    return make
+
+
+def test_finished_jobs_are_purged_after_retention(make_queue):
+    queue = make_queue(retention=60)
+    queue.register("echo", lambda params: params)
+    job_id = queue.submit("echo", {"value": 1})
+    assert _wait_for(queue, job_id)["result"] == {"value": 1}
+
+    assert queue.purge_finished() == 0
+    with queue._lock:
+        queue._conn.execute("UPDATE jobs SET updated_at = ?", (time.time() - 120,))
+        queue._conn.commit()
+
+    assert queue.purge_finished() == 1
+    assert queue.get(job_id) is None
+
+
+def test_unfinished_jobs_are_never_purged(make_queue):
+    release = threading.Event()
+    queue = make_queue(retention=60)
+    queue.register("wait", lambda params: release.wait(5) and {})
+    job_id = queue.submit("wait", {})
+    with queue._lock:
+        queue._conn.execute("UPDATE jobs SET updated_at = ?", (time.time() - 120,))
+        queue._conn.commit()
+
+    assert queue.purge_finished() == 0
+    release.set()
+    assert _wait_for(queue, job_id)["status"] == "succeeded"
+
+
+def test_submit_purges_at_most_once_per_interval(make_queue, monkeypatch):
+    queue = make_queue(retention=60)
+    queue.register("echo", lambda params: params)
+    first = queue.submit("echo", {})
+    _wait_for(queue, first)
+    with queue._lock:
+        queue._conn.execute("UPDATE jobs SET updated_at = ?", (time.time() - 120,))
+        queue._conn.commit()
+
+    # The first submit purged already, so the next one inside the interval doesn't
+    _wait_for(queue, queue.submit("echo", {}))
+    assert queue.get(first) is not None
+
+    monkeypatch.setattr(job_queue_module, "_PURGE_INTERVAL", 0)
+    _wait_for(queue, queue.submit("echo", {}))
+    assert queue.get(first) is None
+
+
+def test_no_retention_keeps_jobs(make_queue):
+    queue = make_queue()
+    queue.register("echo", lambda params: params)
+    job_id = queue.submit("echo", {})
+    _wait_for(queue, job_id)
+    with queue._lock:
+        queue._conn.execute("UPDATE jobs SET updated_at = 0")
+        queue._conn.commit()
+
+    assert queue.purge_finished() == 0
+    assert queue.get(job_id) is not None
@@ -0,0 +1,64 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.youtube_podcast.agents import podcast_agent
+from src.youtube_podcast.utils import checkpoints, eleven_labs
+from src.youtube_podcast.utils.checkpoints import CheckpointStore, load_checkpoint
+from src.youtube_podcast.utils.tts_backends import TTSBackend
+
+SCRIPT_LINES = [f"Host{1 + i % 2}: This is turn number {i}." for i in range(6)]
+
+
+class SlowStreamChain:
+    """Streams the script a line at a time, like a slow LLM."""
+
+    def stream(self, _input):
+        for line in SCRIPT_LINES:
+            time.sleep(0.02)
+            yield SimpleNamespace(content=line + "\n")
+
+
+class FailingBackend(TTSBackend):
+    name = "failing"
+
+    def synthesize(self, text, lang="en", voice=None):
+        raise RuntimeError("synthesis is down")
+
+
+@pytest.fixture
+def pipeline(monkeypatch, tmp_path):
+    completions = {}
+    monkeypatch.setattr(podcast_agent, "get_chain", lambda *args: SlowStreamChain())
+    monkeypatch.setattr(podcast_agent, "get_cached_completion", lambda *args: completions.get(args))
+    monkeypatch.setattr(podcast_agent, "store_completion",
+                        lambda *args, cost=0: completions.__setitem__(args[:-1], args[-1]))
+    monkeypatch.setattr(podcast_agent, "generate_podcast_title", lambda *args: "A Title")
+    monkeypatch.setattr(podcast_agent, "get_tts_backend", lambda name=None: FailingBackend())
+    monkeypatch.setattr(podcast_agent, "DEFAULT_OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(eleven_labs, "get_cached_segment", lambda *args: None)
+    monkeypatch.setattr(eleven_labs, "TTS_SEGMENT_RETRIES", 1)
+    monkeypatch.setattr(checkpoints, "CHECKPOINTS_ENABLED", True)
+    monkeypatch.setattr(checkpoints, "_store", CheckpointStore(str(tmp_path / "checkpoints.sqlite3")))
+    return completions
+
+
+def test_failed_synthesis_still_checkpoints_the_streamed_conversation(pipeline):
+    state = podcast_agent.generate_podcast_pipelined({
+        "transcript": "some transcript",
+        "status": "transcript_fetched",
+        "checkpoint_id": "podcast:test",
+    })
+
+    assert state["status"] == "error"
+    assert "synthesis is down" in state["error"]
+
+    saved = load_checkpoint("podcast:test")
+    assert saved is not None
+    assert saved["status"] == "conversation_created"
+    assert len(saved["conversation"].turns) == len(SCRIPT_LINES)
+    assert saved["podcast_title"] == "A Title"
+
+    # The whole completion is cached too, so the retry makes no LLM call
+    assert list(pipeline.values()) == ["\n".join(SCRIPT_LINES) + "\n"]
@@ -0,0 +1,86 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.youtube_podcast.agents import podcast_agent, summary_agent
+from src.youtube_podcast.utils import tracing
+
+
+class FakeChain:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    def invoke(self, _input):
+        self.calls += 1
+        return SimpleNamespace(content=self.content)
+
+
+@pytest.fixture
+def exporter():
+    previous = tracing.get_exporter()
+    exporter = tracing.InMemoryExporter()
+    tracing.set_exporter(exporter)
+    yield exporter
+    tracing.set_exporter(previous)
+
+
+@pytest.fixture
+def no_llm_cache(monkeypatch):
+    stored = {}
+    for module in (summary_agent, podcast_agent):
+        monkeypatch.setattr(module, "get_cached_completion", lambda *args: stored.get(args))
+        monkeypatch.setattr(module, "store_completion", lambda *args, cost=0: stored.__setitem__(args[:-1], args[-1]))
+    return stored
+
+
+def _spans_named(exporter, name):
+    return [s for s in exporter.spans() if s.name == name]
+
+
+@pytest.mark.parametrize("module, function, name, model, kind", [
+    (summary_agent, "_generate_structured_summary", "llm.summary_structured", "SUMMARY_MODEL", "summary"),
+    (podcast_agent, "_generate_structured_conversation", "llm.conversation_structured", "CONVERSATION_MODEL",
+     "conversation"),
+])
+def test_structured_call_is_a_client_span(monkeypatch, exporter, no_llm_cache, module, function, name, model, kind):
+    chain = FakeChain(json.dumps({"title": "A Title", kind: "Body text"}))
+    monkeypatch.setattr(module, "get_chain", lambda *args: chain)
+    generate = getattr(module, function)
+
+    with tracing.span("node.test") as parent:
+        assert generate("some transcript") is not None
+        assert generate("some transcript") is not None
+
+    assert chain.calls == 1
+    miss, hit = _spans_named(exporter, name)
+    for s in (miss, hit):
+        assert s.kind == "client"
+        assert s.attributes["model"] == getattr(module, model)
+        assert s.trace_id == parent.trace_id
+        assert s.parent_span_id == parent.span_id
+    assert miss.attributes["cache_hit"] is False
+    assert hit.attributes["cache_hit"] is True
+
+
+def test_failed_structured_call_marks_span_as_error(monkeypatch, exporter, no_llm_cache):
+    monkeypatch.setattr(summary_agent, "get_chain", lambda *args: FakeChain("not json"))
+
+    assert summary_agent._generate_structured_summary("some transcript") is None
+
+    [failed] = _spans_named(exporter, "llm.summary_structured")
+    assert failed.status == tracing._STATUS_ERROR
+    assert failed.attributes["cache_hit"] is False
+
+
+def test_no_spans_when_tracing_is_off(monkeypatch, no_llm_cache):
+    previous = tracing.get_exporter()
+    tracing.set_exporter(None)
+    monkeypatch.setattr(tracing, "TRACE_EXPORTER", "none")
+    try:
+        with tracing.span("node.test") as current:
+            current.set_attribute("ignored", True)
+        assert tracing.get_recent_traces() == []
+    finally:
+        tracing.set_exporter(previous)
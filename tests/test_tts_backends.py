@@ -0,0 +1,23 @@
+import pytest
+
+from src.youtube_podcast.utils.tts_backends import TTSBackend, get_tts_backend, list_tts_backends
+
+
+@pytest.mark.parametrize("described", list_tts_backends(), ids=lambda backend: backend["name"])
+def test_supports_gender_matches_the_voices_picked(described):
+    backend = get_tts_backend(described["name"])
+    voices = {tuple(backend.host_voices(gender)) for gender in ("male", "female", "mixed")}
+    assert described["supports_gender"] == (len(voices) > 1)
+
+
+def test_gtts_reports_no_gender_support():
+    [gtts] = [backend for backend in list_tts_backends() if backend["name"] == "gtts"]
+    assert gtts["supports_gender"] is False
+
+
+def test_backend_without_synthesize_cannot_be_created():
+    class HalfDefined(TTSBackend):
+        name = "half"
+
+    with pytest.raises(TypeError):
+        HalfDefined()